@@ -0,0 +1,57 @@
+"""Shared pytest fixtures."""
+
+import os
+import select
+import shutil
+import subprocess
+
+import pytest
+
+# Seconds to wait for Xvfb to report its display number
+XVFB_START_TIMEOUT = 3.0
+
+
+@pytest.fixture(scope="session")
+def xvfb_display():
+    """Provide an X display, starting one headless Xvfb for the session if needed.
+
+    Under pytest-xdist every worker runs its own session, so each one gets its
+    own server: Xvfb picks a free display number (-displayfd) instead of a
+    fixed one that parallel workers would fight over.
+    """
+    if os.environ.get('DISPLAY'):
+        yield os.environ['DISPLAY']
+        return
+
+    if shutil.which('Xvfb') is None:
+        pytest.skip("Requires X display or Xvfb")
+
+    read_fd, write_fd = os.pipe()
+    proc = subprocess.Popen(
+        ["Xvfb", "-displayfd", str(write_fd), "-screen", "0", "640x480x24", "-nolisten", "tcp"],
+        pass_fds=(write_fd,),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    os.close(write_fd)
+
+    # Xvfb writes the display number once it accepts connections
+    try:
+        ready, _, _ = select.select([read_fd], [], [], XVFB_START_TIMEOUT)
+        number = os.read(read_fd, 16).decode().strip() if ready else ""
+    finally:
+        os.close(read_fd)
+
+    if not number or proc.poll() is not None:
+        proc.kill()
+        proc.wait()
+        pytest.skip("Xvfb failed to start")
+
+    display_name = f":{number}"
+    os.environ['DISPLAY'] = display_name
+    try:
+        yield display_name
+    finally:
+        os.environ.pop('DISPLAY', None)
+        proc.terminate()
+        proc.wait()
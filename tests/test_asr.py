@@ -1,177 +1,413 @@
 """Tests for ASR backend consent and download callbacks."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 import numpy as np
 
-from wispr_lite.asr.faster_whisper_backend import FasterWhisperBackend
 from wispr_lite.config.schema import ASRConfig
+from wispr_lite.asr.engine import ChunkStream
 
+# faster-whisper pulls in CTranslate2; skip this module instead of failing collection without it
+pytest.importorskip('faster_whisper')
 
-def test_consent_callback_granted():
-    """Test model consent callback when user grants consent."""
-    config = ASRConfig()
-    config.model_size = "tiny"
+from wispr_lite.asr.faster_whisper_backend import FasterWhisperBackend  # noqa: E402
 
-    backend = FasterWhisperBackend(config)
 
-    # Mock _model_exists to return False (model not available)
-    with patch.object(backend, '_model_exists', return_value=False):
-        # Set up consent callback that grants consent (new API: (model, event, result_list))
-        calls = []
+# One second of read-only audio shared by all tests (the mocked model never mutates it):
+# a -23 dBFS tone standing in for speech, and silence below the transcription gate
+SPEECH_AUDIO = (0.1 * np.sin(2 * np.pi * 220 * np.arange(16000) / 16000)).astype(np.float32)
+SPEECH_AUDIO.setflags(write=False)
+SILENT_AUDIO = np.zeros(16000, dtype=np.float32)
+SILENT_AUDIO.setflags(write=False)
 
-        def consent_callback(model_size, event, result_list):
-            calls.append(model_size)
-            result_list[0] = True
-            event.set()
+WHISPER_MODEL = 'wispr_lite.asr.faster_whisper_backend.WhisperModel'
 
-        backend.on_consent_needed = consent_callback
 
-        # Mock WhisperModel to avoid actual model loading
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([], Mock(language='en'))
+@pytest.fixture(scope="module")
+def mock_whisper_model():
+    """Create a mock WhisperModel that returns no segments."""
+    model = MagicMock()
+    model.transcribe.return_value = ([], Mock(language='en'))
+    return model
 
-        with patch('wispr_lite.asr.faster_whisper_backend.WhisperModel', return_value=mock_model):
-            # Trigger model load by calling transcribe
-            audio = np.zeros(16000, dtype=np.float32)
-            backend.transcribe(audio, 16000)
 
-            # Verify consent callback was called with correct model size
-            assert calls == ["tiny"]
+@pytest.fixture(scope="module")
+def shared_backend():
+    """Create one backend instance for the whole module."""
+    return FasterWhisperBackend(ASRConfig())
 
 
-def test_consent_callback_denied():
-    """Test model consent callback when user denies consent."""
-    config = ASRConfig()
-    config.model_size = "base"
+@pytest.fixture
+def backend(shared_backend):
+    """Provide the shared backend with fresh config, callbacks, and model state."""
+    shared_backend.reset()
+    shared_backend.config = ASRConfig()
+    yield shared_backend
+    shared_backend.reset()
+
+
+@pytest.fixture
+def granting_consent():
+    """Create a consent callback that always grants consent."""
+    def consent_callback(model_size, future):
+        future.set_result(True)
+
+    return consent_callback
+
+
+def test_consent_callback_granted(backend, monkeypatch, mock_whisper_model):
+    """Test model consent callback when user grants consent."""
+    backend.config.model_size = "tiny"
+
+    # Model not available locally
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: False)
 
-    backend = FasterWhisperBackend(config)
+    # Set up consent callback that grants consent (API: (model, future))
+    calls = []
 
-    # Mock _model_exists to return False (model not available)
-    with patch.object(backend, '_model_exists', return_value=False):
-        # Set up consent callback that denies consent (new API)
-        def consent_callback(model_size, event, result_list):
-            result_list[0] = False
-            event.set()
+    def consent_callback(model_size, future):
+        calls.append(model_size)
+        future.set_result(True)
 
-        backend.on_consent_needed = consent_callback
+    backend.on_consent_needed = consent_callback
 
-        # Trigger model load by calling transcribe
-        audio = np.zeros(16000, dtype=np.float32)
+    # Mock WhisperModel to avoid actual model loading
+    monkeypatch.setattr(WHISPER_MODEL, lambda *args, **kwargs: mock_whisper_model)
 
-        # Should raise RuntimeError when consent is denied
-        with pytest.raises(RuntimeError) as exc_info:
-            backend.transcribe(audio, 16000)
+    # Trigger model load by calling transcribe
+    backend.transcribe(SPEECH_AUDIO, 16000)
 
-        # Verify error message mentions offline preload
-        assert "preload_models.sh" in str(exc_info.value)
-        assert "base" in str(exc_info.value)
+    # Verify consent callback was called with correct model size
+    assert calls == ["tiny"]
 
-        # Confirm denied path triggered by checking exception message above
 
+def test_consent_callback_denied(backend, monkeypatch):
+    """Test model consent callback when user denies consent."""
+    backend.config.model_size = "base"
+
+    # Model not available locally
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: False)
+
+    # Set up consent callback that denies consent
+    def consent_callback(model_size, future):
+        future.set_result(False)
+
+    backend.on_consent_needed = consent_callback
+
+    # Should raise RuntimeError when consent is denied
+    with pytest.raises(RuntimeError) as exc_info:
+        backend.transcribe(SPEECH_AUDIO, 16000)
 
-def test_consent_callback_not_called_when_model_exists():
+    # Verify error message mentions offline preload
+    assert "preload_models.sh" in str(exc_info.value)
+    assert "base" in str(exc_info.value)
+
+
+def test_consent_callback_not_called_when_model_exists(backend, monkeypatch, mock_whisper_model):
     """Test consent callback is not called when model already exists."""
-    config = ASRConfig()
-    config.model_size = "tiny"
+    backend.config.model_size = "tiny"
 
-    backend = FasterWhisperBackend(config)
+    # Model already available
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: True)
 
-    # Mock _model_exists to return True (model already available)
-    with patch.object(backend, '_model_exists', return_value=True):
-        # Set up consent callback (should not be called)
-        calls = []
+    # Set up consent callback (should not be called)
+    calls = []
 
-        def consent_callback(model_size, event, result_list):
-            calls.append(model_size)
-            result_list[0] = True
-            event.set()
+    def consent_callback(model_size, future):
+        calls.append(model_size)
+        future.set_result(True)
 
-        backend.on_consent_needed = consent_callback
+    backend.on_consent_needed = consent_callback
 
-        # Mock WhisperModel to avoid actual model loading
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([], Mock(language='en'))
+    # Mock WhisperModel to avoid actual model loading
+    monkeypatch.setattr(WHISPER_MODEL, lambda *args, **kwargs: mock_whisper_model)
 
-        with patch('wispr_lite.asr.faster_whisper_backend.WhisperModel', return_value=mock_model):
-            # Trigger model load
-            audio = np.zeros(16000, dtype=np.float32)
-            backend.transcribe(audio, 16000)
+    # Trigger model load
+    backend.transcribe(SPEECH_AUDIO, 16000)
 
-            # Consent callback should NOT be called when model exists
-            assert calls == []
+    # Consent callback should NOT be called when model exists
+    assert calls == []
 
 
-def test_download_progress_callbacks():
+def test_download_progress_callbacks(backend, monkeypatch, mock_whisper_model, granting_consent):
     """Test download progress callbacks are called appropriately."""
-    config = ASRConfig()
-    config.model_size = "tiny"
+    backend.config.model_size = "tiny"
 
-    backend = FasterWhisperBackend(config)
+    # Model needs download
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: False)
 
-    # Mock _model_exists to return False (model needs download)
-    with patch.object(backend, '_model_exists', return_value=False):
-        # Set up callbacks
-        progress_callback = Mock()
+    # Set up callbacks
+    progress_callback = Mock()
+    backend.on_consent_needed = granting_consent
+    backend.on_download_progress = progress_callback
 
-        def consent_callback(model_size, event, result_list):
-            result_list[0] = True
-            event.set()
+    monkeypatch.setattr(WHISPER_MODEL, lambda *args, **kwargs: mock_whisper_model)
 
-        backend.on_consent_needed = consent_callback
-        backend.on_download_progress = progress_callback
+    # Trigger model load
+    backend.transcribe(SPEECH_AUDIO, 16000)
+    backend.flush_progress()
 
-        # Mock WhisperModel
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([], Mock(language='en'))
+    # Progress callback should be called at start (0.0) and end (1.0)
+    assert progress_callback.call_count == 2
 
-        with patch('wispr_lite.asr.faster_whisper_backend.WhisperModel', return_value=mock_model):
-            # Trigger model load
-            audio = np.zeros(16000, dtype=np.float32)
-            backend.transcribe(audio, 16000)
+    # First call should be with 0.0 (start)
+    first_call = progress_callback.call_args_list[0]
+    assert first_call[0] == ("tiny", 0.0)
 
-            # Progress callback should be called at start (0.0) and end (1.0)
-            assert progress_callback.call_count == 2
+    # Second call should be with 1.0 (complete)
+    second_call = progress_callback.call_args_list[1]
+    assert second_call[0] == ("tiny", 1.0)
 
-            # First call should be with 0.0 (start)
-            first_call = progress_callback.call_args_list[0]
-            assert first_call[0] == ("tiny", 0.0)
 
-            # Second call should be with 1.0 (complete)
-            second_call = progress_callback.call_args_list[1]
-            assert second_call[0] == ("tiny", 1.0)
+def test_download_progress_on_error(backend, monkeypatch, granting_consent):
+    """Test download progress callback with -1.0 on error."""
+    backend.config.model_size = "tiny"
 
+    # Model needs download
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: False)
 
-def test_download_progress_on_error():
-    """Test download progress callback with -1.0 on error."""
-    config = ASRConfig()
-    config.model_size = "tiny"
+    # Set up callbacks
+    progress_callback = Mock()
+    backend.on_consent_needed = granting_consent
+    backend.on_download_progress = progress_callback
+
+    # Mock WhisperModel to raise an error
+    def failing_model(*args, **kwargs):
+        raise RuntimeError("Download failed")
+
+    monkeypatch.setattr(WHISPER_MODEL, failing_model)
+
+    # Trigger model load
+    with pytest.raises(RuntimeError):
+        backend.transcribe(SPEECH_AUDIO, 16000)
+    backend.flush_progress()
+
+    # Progress callback should be called with -1.0 on error
+    error_call_found = any(
+        call[0] == ("tiny", -1.0)
+        for call in progress_callback.call_args_list
+    )
+    assert error_call_found, "Progress callback should be called with -1.0 on error"
+
+
+def test_model_exists_is_memoized(backend, monkeypatch):
+    """Test that a positive model check is cached and a miss is re-checked."""
+    backend.config.model_size = "tiny"
+
+    checks = []
+    present = [False]
+
+    def model_exists_impl(model_size):
+        checks.append(present[0])
+        return present[0]
+
+    monkeypatch.setattr(backend, '_model_exists_impl', model_exists_impl)
+
+    assert backend._model_exists() is False
+    assert backend._model_exists() is False
+    assert len(checks) == 2
+
+    present[0] = True
+    assert backend._model_exists() is True
+    assert backend._model_exists() is True
+    assert len(checks) == 3
+
+    # Cached per model size: switching back after another size needs no new check
+    backend.config.model_size = "base"
+    assert backend._model_exists() is True
+    backend.config.model_size = "tiny"
+    assert backend._model_exists() is True
+    assert len(checks) == 4
+
+
+def test_model_size_change_during_load_is_not_mixed_in(backend, monkeypatch, mock_whisper_model):
+    """Test a size picked while a load runs is neither marked loaded nor marked downloaded."""
+    from dataclasses import replace
+
+    backend.config.model_size = "tiny"
+    monkeypatch.setattr(backend, '_model_exists_impl', lambda model_size: model_size == "tiny")
+    loaded = []
+
+    def load_model(model_size, **kwargs):
+        loaded.append(model_size)
+        if len(loaded) == 1:
+            # The user picks another size in preferences while this load runs
+            backend.config = replace(backend.config, model_size="small")
+        return mock_whisper_model
+
+    monkeypatch.setattr(WHISPER_MODEL, load_model)
+    backend._load_model()
+
+    assert "small" not in backend._models_present
+    assert not backend._has_model("small")
+
+    # The next load asks for consent to download the new size and loads it
+    consent = Mock(side_effect=lambda model_size, future: future.set_result(True))
+    backend.on_consent_needed = consent
+    backend._load_model()
+
+    assert consent.call_args[0][0] == "small"
+    assert loaded == ["tiny", "small"]
+    assert backend._has_model("small")
+
+
+def test_preload_loads_existing_model(backend, monkeypatch, mock_whisper_model):
+    """Test preload loads and warms up a model that is already downloaded."""
+    backend.config.model_size = "tiny"
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: True)
+    monkeypatch.setattr(WHISPER_MODEL, lambda *args, **kwargs: mock_whisper_model)
+
+    backend.preload()
+
+    assert backend.model_loaded
+    assert backend.model is mock_whisper_model
+
+
+def test_preload_skips_missing_model(backend, monkeypatch):
+    """Test preload does not prompt for a download."""
+    backend.config.model_size = "tiny"
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: False)
+
+    consent = Mock()
+    backend.on_consent_needed = consent
+
+    backend.preload()
+
+    assert not backend.model_loaded
+    consent.assert_not_called()
+
+
+def test_transcript_cache_reuses_identical_audio(backend, monkeypatch):
+    """Test cached transcription skips the model for identical audio."""
+    segment = Mock()
+    segment.text = " open terminal "
+    model = MagicMock()
+    model.transcribe.side_effect = lambda *args, **kwargs: ([segment], Mock(language='en'))
+
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: True)
+    monkeypatch.setattr(WHISPER_MODEL, lambda *args, **kwargs: model)
+
+    assert backend.transcribe(SPEECH_AUDIO, 16000, use_cache=True) == "open terminal"
+    assert backend.transcribe(SPEECH_AUDIO, 16000, use_cache=True) == "open terminal"
+    assert model.transcribe.call_count == 1
+
+    # Without the cache flag the model always runs
+    backend.transcribe(SPEECH_AUDIO, 16000)
+    assert model.transcribe.call_count == 2
+
+    # New decoding settings from preferences miss the cache
+    from dataclasses import replace
+    backend.config = replace(backend.config, language="de")
+    backend.transcribe(SPEECH_AUDIO, 16000, use_cache=True)
+    assert model.transcribe.call_count == 3
+
+
+def test_transcribe_chunk_decodes_once_per_second(backend, monkeypatch):
+    """Test chunked transcription waits for a second of new audio and finalizes on the last chunk."""
+    segment = Mock()
+    segment.text = " hello world "
+    model = MagicMock()
+    model.transcribe.side_effect = lambda *args, **kwargs: ([segment], Mock(language='en'))
+
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: True)
+    monkeypatch.setattr(WHISPER_MODEL, lambda *args, **kwargs: model)
+
+    half_second = SPEECH_AUDIO[:8000]
+    stream = ChunkStream()
+    assert backend.transcribe_chunk(stream, half_second, 16000) is None
+    assert backend.transcribe_chunk(stream, half_second, 16000) == "hello world"
+    assert model.transcribe.call_count == 1
+
+    # A second utterance keeps its own audio
+    other = ChunkStream()
+    assert backend.transcribe_chunk(other, half_second, 16000) is None
+    assert other.samples == 8000
+
+    # The whole utterance is decoded again on the last chunk, however short
+    assert backend.transcribe_chunk(stream, half_second[:1600], 16000, is_last=True) == "hello world"
+    assert model.transcribe.call_count == 2
+    assert model.transcribe.call_args[0][0].size == 17600
+
+
+def test_int8_cpu_threads_on_dot_product_cpus(backend, monkeypatch, mock_whisper_model):
+    """Test int8 CPU models get one thread per physical core when VNNI/dotprod is present."""
+    backend.config.device = "cpu"
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: True)
+    monkeypatch.setattr('wispr_lite.asr.faster_whisper_backend._cpu_int8_threads', lambda: 4)
+
+    model_factory = Mock(return_value=mock_whisper_model)
+    monkeypatch.setattr(WHISPER_MODEL, model_factory)
+
+    backend._load_model()
+
+    kwargs = model_factory.call_args.kwargs
+    assert kwargs['compute_type'] == "int8"
+    assert kwargs['cpu_threads'] == 4
+    assert kwargs['num_workers'] == 1
+
+
+def test_short_audio_uses_greedy_decoding(backend, monkeypatch, mock_whisper_model):
+    """Test utterances under two seconds skip beam search and longer ones use the config."""
+    backend.config.beam_size = 5
+    backend.config.best_of = 5
+    mock_whisper_model.transcribe.reset_mock()
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: True)
+    monkeypatch.setattr(WHISPER_MODEL, lambda *args, **kwargs: mock_whisper_model)
+
+    backend.transcribe(SPEECH_AUDIO, 16000)
+    short_kwargs = mock_whisper_model.transcribe.call_args.kwargs
+    assert short_kwargs['beam_size'] == 1
+    assert short_kwargs['best_of'] == 1
+
+    backend.transcribe(np.tile(SPEECH_AUDIO, 3), 16000)
+    long_kwargs = mock_whisper_model.transcribe.call_args.kwargs
+    assert long_kwargs['beam_size'] == 5
+    assert long_kwargs['best_of'] == 5
+
+    # Decoding options follow config changes
+    backend.config.beam_size = 3
+    backend.transcribe(np.tile(SPEECH_AUDIO, 3), 16000)
+    assert mock_whisper_model.transcribe.call_args.kwargs['beam_size'] == 3
+
+
+def test_hybrid_cpu_pins_to_performance_cores(backend, monkeypatch, mock_whisper_model):
+    """Test CPU inference is pinned to performance cores on hybrid processors."""
+    backend.config.device = "cpu"
+    monkeypatch.setattr(backend, '_model_exists', lambda *args: True)
+    monkeypatch.setattr('wispr_lite.asr.faster_whisper_backend._cpu_int8_threads', lambda: 0)
+    monkeypatch.setattr('wispr_lite.asr.faster_whisper_backend._performance_cpus', lambda: frozenset({0, 1}))
+    monkeypatch.setattr('wispr_lite.asr.faster_whisper_backend._physical_core_count', lambda cpus: 1)
+
+    setaffinity = Mock()
+    monkeypatch.setattr('wispr_lite.asr.faster_whisper_backend.os.sched_setaffinity', setaffinity)
+    model_factory = Mock(return_value=mock_whisper_model)
+    monkeypatch.setattr(WHISPER_MODEL, model_factory)
 
-    backend = FasterWhisperBackend(config)
+    backend.transcribe(SPEECH_AUDIO, 16000)
 
-    # Mock _model_exists to return False
-    with patch.object(backend, '_model_exists', return_value=False):
-        # Set up callbacks
-        progress_callback = Mock()
+    assert model_factory.call_args.kwargs['cpu_threads'] == 1
+    # Pinned once for this thread, not again for every decode
+    setaffinity.assert_called_once_with(0, frozenset({0, 1}))
 
-        def consent_callback(model_size, event, result_list):
-            result_list[0] = True
-            event.set()
 
-        backend.on_consent_needed = consent_callback
-        backend.on_download_progress = progress_callback
+def test_prepare_audio():
+    """Test audio preparation passes float32 through and converts everything else once."""
+    assert FasterWhisperBackend._prepare_audio(SPEECH_AUDIO) is SPEECH_AUDIO
 
-        # Mock WhisperModel to raise an error
-        with patch('wispr_lite.asr.faster_whisper_backend.WhisperModel', side_effect=RuntimeError("Download failed")):
-            # Trigger model load
-            audio = np.zeros(16000, dtype=np.float32)
+    pcm = np.array([0, 16384, -32768], dtype=np.int16)
+    assert FasterWhisperBackend._prepare_audio(pcm).tolist() == [0.0, 0.5, -1.0]
 
-            with pytest.raises(RuntimeError):
-                backend.transcribe(audio, 16000)
+    strided = np.arange(8, dtype=np.float64)[::2]
+    prepared = FasterWhisperBackend._prepare_audio(strided)
+    assert prepared.dtype == np.float32
+    assert prepared.flags.c_contiguous
+    assert prepared.tolist() == [0.0, 2.0, 4.0, 6.0]
+
+
+def test_silent_audio_skips_model(backend, monkeypatch):
+    """Test audio below the silence gate returns no text without loading the model."""
+    load_model = Mock()
+    monkeypatch.setattr(backend, '_load_model', load_model)
 
-            # Progress callback should be called with -1.0 on error
-            error_call_found = any(
-                call[0] == ("tiny", -1.0)
-                for call in progress_callback.call_args_list
-            )
-            assert error_call_found, "Progress callback should be called with -1.0 on error"
+    assert backend.transcribe(SILENT_AUDIO, 16000) == ""
+    load_model.assert_not_called()
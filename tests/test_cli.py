@@ -36,3 +36,39 @@ def test_cli_mode_command_returns_zero(monkeypatch):
     rc = run_main_with_args(monkeypatch, ['--mode', 'command'], return_code=0)
     assert rc == 0
 
+
+def test_cli_import_skips_audio_stack():
+    """Test importing the CLI and audio modules doesn't load PortAudio or webrtcvad."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, wispr_lite.cli, wispr_lite.audio.capture, wispr_lite.audio.vad; "
+        "print('sounddevice' in sys.modules, 'webrtcvad' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ['False', 'False']
+
+
+def test_send_dbus_command_uses_gdbus_call(monkeypatch):
+    """Test commands are sent with one direct GDBus call carrying string arguments."""
+    import sys
+    from types import ModuleType
+    from unittest.mock import MagicMock
+    from wispr_lite import cli
+
+    bus = MagicMock()
+    gi_repository = ModuleType('gi.repository')
+    gi_repository.Gio = MagicMock()
+    gi_repository.Gio.bus_get_sync.return_value = bus
+    gi_repository.GLib = SimpleNamespace(Variant=lambda sig, value: (sig, value), Error=Exception)
+    monkeypatch.setitem(sys.modules, 'gi', ModuleType('gi'))
+    monkeypatch.setitem(sys.modules, 'gi.repository', gi_repository)
+
+    assert cli.send_dbus_command('SetMode', 'command') == 0
+    args = bus.call_sync.call_args.args
+    assert args[:5] == (cli.BUS_NAME, cli.OBJECT_PATH, cli.BUS_NAME, 'SetMode', ('(s)', ('command',)))
+
+    bus.call_sync.side_effect = Exception("org.freedesktop.DBus.Error.ServiceUnknown")
+    assert cli.send_dbus_command('Toggle') == 1
+    assert bus.call_sync.call_args.args[4] is None
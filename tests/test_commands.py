@@ -18,7 +18,7 @@ def test_default_commands():
 def test_command_registry_initialization():
     """Test command registry initialization."""
     config = CommandConfig()
-    config.commands = get_default_commands()
+    config.commands = dict(get_default_commands())
 
     registry = CommandRegistry(config)
 
@@ -38,6 +38,31 @@ def test_command_matching_exact():
     assert command["action"] == "launch"
 
 
+def test_command_matching_mixed_case_names():
+    """Test command names configured with capitals still match exactly."""
+    config = CommandConfig()
+    config.commands = {"Open Terminal": {"action": "launch", "target": "gnome-terminal"}}
+
+    registry = CommandRegistry(config)
+
+    assert registry.match_command("Open terminal")["target"] == "gnome-terminal"
+
+
+def test_command_matching_ignores_transcript_punctuation():
+    """Test punctuated transcripts still match word by word."""
+    config = CommandConfig()
+    config.commands = {
+        "open terminal": {"action": "launch", "target": "gnome-terminal"},
+        "search": {"action": "url", "target": "https://google.com/search?q={query}"},
+    }
+
+    registry = CommandRegistry(config)
+
+    assert registry.match_command("Open terminal.")["target"] == "gnome-terminal"
+    assert registry.match_command("Open, terminal!")["target"] == "gnome-terminal"
+    assert registry.match_command("Search, python tutorial")["query"] == "python tutorial"
+
+
 def test_command_matching_with_prefix():
     """Test command matching with prefix."""
     config = CommandConfig()
@@ -51,6 +76,9 @@ def test_command_matching_with_prefix():
     assert command is not None
     assert command["action"] == "launch"
 
+    # Prefix matching is case-insensitive too
+    assert registry.match_command("CMD: Open Terminal") is command
+
 
 def test_command_matching_with_query():
     """Test command matching with query substitution."""
@@ -78,3 +106,57 @@ def test_command_no_match():
     # No match
     command = registry.match_command("unknown command")
     assert command is None
+
+
+def test_command_matching_many_commands():
+    """Test matching against a large command set."""
+    config = CommandConfig()
+    config.commands = {
+        f"open app{i}": {"action": "launch", "target": f"app{i}"} for i in range(1000)
+    }
+    config.commands["search"] = {"action": "url", "target": "https://example.com/?q={query}"}
+
+    registry = CommandRegistry(config)
+
+    assert registry.match_command("open app999")["target"] == "app999"
+    assert registry.match_command("search cats")["query"] == "cats"
+    assert registry.match_command("close app1") is None
+
+
+def test_command_matching_prefers_longest_command():
+    """Test the longest command prefix wins and partial words don't match."""
+    config = CommandConfig()
+    config.commands = {
+        "search": {"action": "url", "target": "https://example.com/?q={query}"},
+        "search images": {"action": "url", "target": "https://example.com/images?q={query}"},
+        "open app9": {"action": "launch", "target": "app9"},
+        "open app999": {"action": "launch", "target": "app999"},
+    }
+
+    registry = CommandRegistry(config)
+
+    command = registry.match_command("search images of cats")
+    assert command["target"].startswith("https://example.com/images")
+    assert command["query"] == "of cats"
+
+    assert registry.match_command("open app999 now")["target"] == "app999"
+    assert registry.match_command("open app99") is None
+
+
+def test_open_url_uses_gio_without_forking(monkeypatch):
+    """Test URLs go to the default handler through GIO when it is available."""
+    from unittest.mock import Mock
+    from wispr_lite.commands import registry as registry_module
+
+    gio = Mock()
+    gio.AppInfo.launch_default_for_uri.return_value = True
+    popen = Mock()
+    monkeypatch.setattr(registry_module, 'GIO_AVAILABLE', True)
+    monkeypatch.setattr(registry_module, 'Gio', gio, raising=False)
+    monkeypatch.setattr(registry_module.subprocess, 'Popen', popen)
+
+    registry = CommandRegistry(CommandConfig())
+
+    assert registry._open_url("https://example.com/search?q={query}", "cats") is True
+    gio.AppInfo.launch_default_for_uri.assert_called_once_with("https://example.com/search?q=cats", None)
+    popen.assert_not_called()
@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 
 import pytest
+from unittest.mock import Mock
 from wispr_lite.config.schema import Config, HotkeyConfig, AudioConfig, ASRConfig
 
 
@@ -26,6 +27,22 @@ def test_hotkey_config_defaults():
     assert hotkeys.undo_last == "ctrl+shift+z"
 
 
+def test_hotkey_config_parsed():
+    """Test hotkey strings are parsed into modifiers and main key."""
+    hotkeys = HotkeyConfig(push_to_talk="ctrl+space", toggle="Control+Shift+Space")
+
+    assert hotkeys.parsed['push_to_talk'].mods == frozenset({'ctrl'})
+    assert hotkeys.parsed['push_to_talk'].key == 'space'
+    assert hotkeys.parsed['toggle'].mods == frozenset({'ctrl', 'shift'})
+    assert hotkeys.parsed['toggle'].key == 'space'
+    assert hotkeys.parsed['command_mode'].mods == frozenset()
+    assert hotkeys.parsed['command_mode'].key == ''
+
+    # Modifier-only hotkeys have no main key
+    assert HotkeyConfig().parsed['push_to_talk'].mods == frozenset({'ctrl', 'super'})
+    assert HotkeyConfig().parsed['push_to_talk'].key == ''
+
+
 def test_audio_config_defaults():
     """Test default audio configuration."""
     audio = AudioConfig()
@@ -77,3 +94,41 @@ def test_config_save_load(tmp_path, monkeypatch):
 
     assert config2.mode == "command"
     assert config2.autostart is True
+
+
+def test_config_save_skips_unchanged(tmp_path, monkeypatch):
+    """Test saving an unchanged config doesn't rewrite the file."""
+    config_path = tmp_path / "config.yaml"
+    monkeypatch.setattr(Config, 'get_config_path', staticmethod(lambda: config_path))
+
+    Config().save()
+    config = Config.load()
+
+    dump = Mock()
+    monkeypatch.setattr('wispr_lite.config.schema.yaml.dump', dump)
+    config.save()
+    dump.assert_not_called()
+
+    config.mode = "command"
+    config.save()
+    dump.assert_called_once()
+
+
+def test_config_uses_libyaml_when_available(tmp_path, monkeypatch):
+    """Test load/save go through the C-accelerated YAML classes when libyaml is built in."""
+    import yaml
+    from wispr_lite.config import schema
+
+    if not yaml.__with_libyaml__:
+        pytest.skip("PyYAML built without libyaml")
+
+    assert schema._YamlLoader is yaml.CSafeLoader
+    assert schema._YamlDumper is yaml.CSafeDumper
+
+    config_path = tmp_path / "config.yaml"
+    monkeypatch.setattr(Config, 'get_config_path', staticmethod(lambda: config_path))
+    config = Config()
+    config.mode = "command"
+    config.save()
+
+    assert Config.load().mode == "command"
@@ -0,0 +1,124 @@
+"""Tests for hotkey matching (no listener is started)."""
+
+import pytest
+
+try:
+    from pynput import keyboard
+except ImportError as e:  # pynput raises ImportError when no X display is available
+    pytest.skip(f"pynput unavailable: {e}", allow_module_level=True)
+
+from wispr_lite.config.schema import HotkeyConfig
+from wispr_lite.integration.hotkeys import HotkeyManager
+
+Key = keyboard.Key
+
+
+def make_manager(**hotkeys):
+    """Create a manager that records which callbacks fired."""
+    manager = HotkeyManager(HotkeyConfig(**hotkeys))
+    events = []
+    manager.on_push_to_talk_press = lambda: events.append('ptt')
+    manager.on_push_to_talk_release = lambda: events.append('ptt_release')
+    manager.on_toggle = lambda: events.append('toggle')
+    manager.on_undo = lambda: events.append('undo')
+    return manager, events
+
+
+def test_right_hand_modifiers_match():
+    """Test right-hand modifier variants match hotkeys written with left-hand keys."""
+    manager, events = make_manager(push_to_talk="ctrl+super")
+
+    manager._on_press(Key.ctrl_r)
+    manager._on_press(Key.cmd_r)
+
+    assert events == ['ptt']
+
+
+def test_releasing_one_of_two_held_variants_keeps_modifier():
+    """Test holding both Ctrl keys and releasing one still counts Ctrl as held."""
+    manager, events = make_manager(push_to_talk="ctrl+super")
+
+    manager._on_press(Key.ctrl_l)
+    manager._on_press(Key.ctrl_r)
+    manager._on_release(Key.ctrl_r)
+    events.clear()
+
+    manager._on_press(Key.cmd)
+
+    assert events == ['ptt']
+
+
+def test_toggle_clears_pressed_keys():
+    """Test the toggle hotkey fires once and resets the held-key state."""
+    manager, events = make_manager()
+
+    for key in (Key.ctrl_l, Key.shift_l, Key.cmd):
+        manager._on_press(key)
+
+    assert events == ['toggle']
+    assert not manager.currently_pressed
+    assert not manager._normalized_pressed
+
+
+def test_hotkey_keys_are_cached_across_managers():
+    """Test identical hotkeys share one cached key set."""
+    first, _ = make_manager(push_to_talk="Control+Space")
+    second, _ = make_manager(push_to_talk="ctrl+space")
+
+    assert first.ptt_keys == frozenset({Key.ctrl_l, Key.space})
+    assert first.ptt_keys is second.ptt_keys
+
+
+def test_hotkey_matches_with_extra_keys_held():
+    """Test a combination still matches while an unrelated key is also held."""
+    manager, events = make_manager(push_to_talk="ctrl+super")
+
+    manager._on_press(keyboard.KeyCode.from_char('a'))
+    manager._on_press(Key.ctrl_l)
+    manager._on_press(Key.cmd)
+
+    assert events == ['ptt']
+
+    # Releasing the extra key doesn't end push-to-talk
+    manager._on_release(keyboard.KeyCode.from_char('a'))
+    assert events == ['ptt']
+
+
+def test_most_specific_hotkey_wins():
+    """Test a toggle combo that contains the PTT combo fires toggle, not PTT."""
+    manager, events = make_manager(push_to_talk="ctrl+super", toggle="ctrl+shift+super")
+
+    manager._on_press(Key.ctrl_l)
+    manager._on_press(Key.shift_l)
+    manager._on_press(Key.cmd)
+
+    assert events == ['toggle']
+
+
+def test_hotkey_marked_working_only_on_first_match():
+    """Test later activations skip mark_hotkey_working once the hotkey is known to work."""
+    from unittest.mock import Mock
+
+    manager, events = make_manager(push_to_talk="ctrl+super")
+    manager.mark_hotkey_working = Mock(side_effect=manager.mark_hotkey_working)
+
+    for _ in range(3):
+        manager._on_press(Key.ctrl_l)
+        manager._on_press(Key.cmd)
+        manager._on_release(Key.cmd)
+        manager._on_release(Key.ctrl_l)
+
+    assert events.count('ptt') == 3
+    assert manager.hotkey_test_passed
+    manager.mark_hotkey_working.assert_called_once()
+
+
+def test_unconfigured_hotkey_is_never_checked():
+    """Test an empty undo hotkey is left out of the press handlers."""
+    manager, events = make_manager(undo_last="")
+
+    assert len(manager._press_handlers) == 2
+    assert all(mask for mask, _ in manager._press_handlers)
+
+    manager._on_press(Key.ctrl_l)
+    assert events == []
@@ -1,80 +1,63 @@
 """Integration tests for typing and clipboard operations."""
 
 import os
+import shutil
 import pytest
 
-# Skip tests if DISPLAY is not available
-pytestmark = pytest.mark.skipif(
-    not os.environ.get('DISPLAY'),
-    reason="Requires X display"
-)
+# Skip tests if neither DISPLAY nor Xvfb is available; otherwise share one display per session
+pytestmark = [
+    pytest.mark.skipif(
+        not os.environ.get('DISPLAY') and shutil.which('Xvfb') is None,
+        reason="Requires X display or Xvfb"
+    ),
+    pytest.mark.usefixtures("xvfb_display"),
+]
 
 
+@pytest.mark.xdist_group("clipboard")
 def test_clipboard_preservation():
     """Test that clipboard preservation works correctly."""
-    from wispr_lite.integration.typing import TextOutput
-    from wispr_lite.config.schema import TypingConfig
+    from wispr_lite.integration.typing import clipboard
 
     try:
-        import subprocess
-
         # Set initial clipboard content
         test_text = "original clipboard content"
-        subprocess.run(
-            ["xclip", "-selection", "clipboard"],
-            input=test_text.encode(),
-            timeout=1,
-            check=True
-        )
-
-        # Create text output with preservation enabled
-        config = TypingConfig(strategy="clipboard", preserve_clipboard=True)
-        text_output = TextOutput(config)
+        clipboard.set_clipboard(test_text, 'clipboard')
 
         # This would normally insert text and restore clipboard
         # For testing, we just verify the clipboard operations work
-        saved = text_output._get_clipboard('clipboard')
+        saved = clipboard.get_clipboard('clipboard')
         assert saved == test_text
 
         # Set new content
         new_text = "dictated text"
-        text_output._set_clipboard(new_text, 'clipboard')
+        clipboard.set_clipboard(new_text, 'clipboard')
 
         # Verify it was set
-        current = text_output._get_clipboard('clipboard')
+        current = clipboard.get_clipboard('clipboard')
         assert current == new_text
 
         # Restore original
-        text_output._set_clipboard(test_text, 'clipboard')
-        restored = text_output._get_clipboard('clipboard')
+        clipboard.set_clipboard(test_text, 'clipboard')
+        restored = clipboard.get_clipboard('clipboard')
         assert restored == test_text
 
     except FileNotFoundError:
         pytest.skip("xclip not available")
 
 
+@pytest.mark.xdist_group("clipboard")
 def test_primary_selection_preservation():
     """Test that PRIMARY selection is preserved."""
-    from wispr_lite.integration.typing import TextOutput
-    from wispr_lite.config.schema import TypingConfig
+    from wispr_lite.integration.typing import clipboard
 
     try:
-        import subprocess
-
         # Set primary selection
         test_text = "primary selection"
-        subprocess.run(
-            ["xclip", "-selection", "primary"],
-            input=test_text.encode(),
-            timeout=1,
-            check=True
-        )
-
-        config = TypingConfig(strategy="clipboard", preserve_clipboard=True)
-        text_output = TextOutput(config)
+        clipboard.set_clipboard(test_text, 'primary')
 
         # Verify primary selection operations
-        saved = text_output._get_clipboard('primary')
+        saved = clipboard.get_clipboard('primary')
         if saved:  # PRIMARY might be empty
             assert isinstance(saved, str)
 
@@ -94,15 +77,21 @@ def test_wayland_detection():
         # Test X11
         os.environ['XDG_SESSION_TYPE'] = 'x11'
         os.environ.pop('WAYLAND_DISPLAY', None)
+        is_wayland.cache_clear()
         assert not is_wayland()
 
-        # Test Wayland
+        # Detection is cached for the session
         os.environ['XDG_SESSION_TYPE'] = 'wayland'
+        assert not is_wayland()
+
+        # Test Wayland
+        is_wayland.cache_clear()
         assert is_wayland()
 
         # Test Wayland via display
         os.environ['XDG_SESSION_TYPE'] = 'x11'
         os.environ['WAYLAND_DISPLAY'] = 'wayland-0'
+        is_wayland.cache_clear()
         assert is_wayland()
 
         # Verify limitations are documented
@@ -121,6 +110,7 @@ def test_wayland_detection():
             os.environ['WAYLAND_DISPLAY'] = original_wayland
         else:
             os.environ.pop('WAYLAND_DISPLAY', None)
+        is_wayland.cache_clear()
 
 
 def test_delta_typing():
@@ -167,28 +157,21 @@ def test_delta_typing():
         pytest.skip(f"Delta typing test failed (may need X display): {e}")
 
 
+@pytest.mark.xdist_group("clipboard")
 def test_mime_clipboard_preservation():
     """Test MIME type preservation (text/html, text/uri-list)."""
-    from wispr_lite.integration.typing import TextOutput
-    from wispr_lite.config.schema import TypingConfig
+    from wispr_lite.integration.typing import clipboard
 
     try:
         import subprocess
 
         # Set clipboard with HTML content
         html_content = b"<p>Test HTML</p>"
-        subprocess.run(
-            ["xclip", "-selection", "clipboard", "-t", "text/html"],
-            input=html_content,
-            timeout=1,
-            check=True
-        )
-
-        config = TypingConfig(strategy="clipboard", preserve_clipboard=True)
-        text_output = TextOutput(config)
+        if not clipboard.set_clipboard_content_by_target(html_content, "text/html", 'clipboard'):
+            pytest.skip("xclip not available")
 
         # Save clipboard data (should include MIME types)
-        saved_data = text_output._save_clipboard_data('clipboard')
+        saved_data = clipboard.save_clipboard_data('clipboard')
 
         assert saved_data is not None
         assert 'text' in saved_data
@@ -201,10 +184,10 @@ def test_mime_clipboard_preservation():
             assert saved_data['mime_data']['text/html'] == html_content
 
         # Modify clipboard
-        text_output._set_clipboard("different text", 'clipboard')
+        clipboard.set_clipboard("different text", 'clipboard')
 
         # Restore
-        text_output._restore_clipboard_with_targets(saved_data, 'clipboard')
+        clipboard.restore_clipboard_with_targets(saved_data, 'clipboard')
 
         # Verify HTML was restored if it was saved
         if 'text/html' in saved_data.get('mime_data', {}):
@@ -221,36 +204,29 @@ def test_mime_clipboard_preservation():
         pytest.skip(f"MIME test failed: {e}")
 
 
+@pytest.mark.xdist_group("clipboard")
 def test_mime_uri_list_preservation():
     """Test text/uri-list MIME type preservation."""
-    from wispr_lite.integration.typing import TextOutput
-    from wispr_lite.config.schema import TypingConfig
+    from wispr_lite.integration.typing import clipboard
 
     try:
         import subprocess
 
         # Set clipboard with URI list
         uri_list = b"file:///home/user/test.txt\nfile:///home/user/doc.pdf"
-        subprocess.run(
-            ["xclip", "-selection", "clipboard", "-t", "text/uri-list"],
-            input=uri_list,
-            timeout=1,
-            check=True
-        )
-
-        config = TypingConfig(strategy="clipboard", preserve_clipboard=True)
-        text_output = TextOutput(config)
+        if not clipboard.set_clipboard_content_by_target(uri_list, "text/uri-list", 'clipboard'):
+            pytest.skip("xclip not available")
 
         # Save and verify
-        saved_data = text_output._save_clipboard_data('clipboard')
+        saved_data = clipboard.save_clipboard_data('clipboard')
 
         if saved_data.get('targets') and 'text/uri-list' in saved_data['targets']:
             assert 'text/uri-list' in saved_data['mime_data']
             assert saved_data['mime_data']['text/uri-list'] == uri_list
 
             # Modify and restore
-            text_output._set_clipboard("other", 'clipboard')
-            text_output._restore_clipboard_with_targets(saved_data, 'clipboard')
+            clipboard.set_clipboard("other", 'clipboard')
+            clipboard.restore_clipboard_with_targets(saved_data, 'clipboard')
 
             # Verify restoration
             restored = subprocess.run(
@@ -0,0 +1,24 @@
+"""Tests for logger setup."""
+
+import logging
+
+from wispr_lite.logging import get_logger, set_log_level
+
+
+def test_module_loggers_share_package_handlers():
+    """Test module loggers add no handlers of their own and follow set_log_level()."""
+    package = logging.getLogger('wispr_lite')
+    first = get_logger('wispr_lite.test_a')
+    handlers = list(package.handlers)
+    second = get_logger('wispr_lite.test_b')
+
+    assert first.handlers == [] and second.handlers == []
+    assert package.handlers == handlers and len(handlers) == 2
+    assert first.propagate
+
+    level = package.level
+    try:
+        set_log_level(logging.DEBUG)
+        assert second.isEnabledFor(logging.DEBUG)
+    finally:
+        set_log_level(level)
@@ -0,0 +1,53 @@
+"""Tests for model download progress notifications."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("gi")
+
+from wispr_lite import model_ui
+
+
+@pytest.fixture
+def glib(monkeypatch):
+    """Record idle/timeout callbacks instead of scheduling them on a main loop."""
+    scheduled = SimpleNamespace(idle=[], timeouts=[])
+    fake = SimpleNamespace(
+        idle_add=lambda func, *args: scheduled.idle.append((func, args)),
+        timeout_add=lambda ms, func, *args: scheduled.timeouts.append((func, args)),
+    )
+    monkeypatch.setattr(model_ui, 'GLib', fake)
+    monkeypatch.setattr(model_ui, '_pending_progress', {})
+    monkeypatch.setattr(model_ui, '_last_progress_emit', 0.0)
+    return scheduled
+
+
+def test_progress_updates_are_coalesced(glib):
+    """Test a burst of progress updates shows the first one and then only the latest."""
+    manager = Mock()
+
+    for progress in (0.1, 0.2, 0.3, 0.4):
+        model_ui.notify_model_download_progress(manager, "base", progress)
+
+    assert len(glib.idle) == 1 and len(glib.timeouts) == 1
+
+    func, args = glib.timeouts[0]
+    func(*args)
+    assert manager.notify.call_args.args[-1] == 0.4
+    assert manager.notify.call_count == 1
+
+
+def test_completion_is_immediate_and_drops_stale_progress(glib):
+    """Test completion is never throttled and a pending intermediate update is discarded."""
+    manager = Mock()
+
+    model_ui.notify_model_download_progress(manager, "base", 0.5)
+    model_ui.notify_model_download_progress(manager, "base", 0.9)
+    model_ui.notify_model_download_progress(manager, "base", 1.0)
+
+    assert glib.idle[-1][1][0] == "Model Ready"
+    func, args = glib.timeouts[0]
+    func(*args)
+    manager.notify.assert_not_called()
@@ -1,7 +1,6 @@
 """Tests for notification anti-spam and rate limiting."""
 
 import pytest
-import time
 from unittest.mock import Mock, patch
 
 from wispr_lite.ui.notifications import NotificationManager, Severity
@@ -24,81 +23,77 @@ def config():
 
 
 @pytest.fixture
-def notification_manager(config):
+def clock():
+    """Create a mutable fake clock; set clock[0] to advance time."""
+    return [0.0]
+
+
+@pytest.fixture
+def notification_manager(config, clock):
     """Create a notification manager for testing."""
     with patch('wispr_lite.ui.notifications.NOTIFY_AVAILABLE', True):
         with patch('wispr_lite.ui.notifications.Notify'):
-            manager = NotificationManager(config)
+            manager = NotificationManager(config, time_func=lambda: clock[0])
             return manager
 
 
-def test_global_rate_limit(notification_manager):
+def test_global_rate_limit(notification_manager, clock):
     """Test that global rate limit enforces max toasts per minute."""
     config = notification_manager.config
 
-    # Mock time to control rate limiting
-    with patch('time.time') as mock_time:
-        mock_time.return_value = 0.0
+    # First 3 notifications should pass (max_toasts_per_minute=3)
+    assert notification_manager._check_rate_limit("key1") is True
+    notification_manager.global_toast_times.append(0.0)
 
-        # First 3 notifications should pass (max_toasts_per_minute=3)
-        assert notification_manager._check_rate_limit("key1") is True
-        notification_manager.global_toast_times.append(0.0)
+    assert notification_manager._check_rate_limit("key2") is True
+    notification_manager.global_toast_times.append(0.0)
 
-        assert notification_manager._check_rate_limit("key2") is True
-        notification_manager.global_toast_times.append(0.0)
+    assert notification_manager._check_rate_limit("key3") is True
+    notification_manager.global_toast_times.append(0.0)
 
-        assert notification_manager._check_rate_limit("key3") is True
-        notification_manager.global_toast_times.append(0.0)
+    # 4th notification should be rate limited
+    assert notification_manager._check_rate_limit("key4") is False
 
-        # 4th notification should be rate limited
-        assert notification_manager._check_rate_limit("key4") is False
+    # After 60 seconds, rate limit should reset
+    clock[0] = 61.0
+    assert notification_manager._check_rate_limit("key5") is True
 
-        # After 60 seconds, rate limit should reset
-        mock_time.return_value = 61.0
-        assert notification_manager._check_rate_limit("key5") is True
 
-
-def test_per_key_cooldown(notification_manager):
+def test_per_key_cooldown(notification_manager, clock):
     """Test that per-key cooldown prevents repeated notifications."""
     config = notification_manager.config
 
-    with patch('time.time') as mock_time:
-        mock_time.return_value = 0.0
-
-        # First notification for key should pass
-        assert notification_manager._check_rate_limit("test_key") is True
+    # First notification for key should pass
+    assert notification_manager._check_rate_limit("test_key") is True
 
-        # Record that we showed it
-        from wispr_lite.ui.notifications import NotificationState
-        notification_manager.states["test_key"] = NotificationState(last_shown=0.0)
+    # Record that we showed it
+    from wispr_lite.ui.notifications import NotificationState
+    notification_manager.states["test_key"] = NotificationState(last_shown=0.0)
 
-        # Immediate retry should be blocked (within cooldown period)
-        mock_time.return_value = 5.0  # 5 seconds later (< 10 second cooldown)
-        assert notification_manager._check_rate_limit("test_key") is False
+    # Immediate retry should be blocked (within cooldown period)
+    clock[0] = 5.0  # 5 seconds later (< 10 second cooldown)
+    assert notification_manager._check_rate_limit("test_key") is False
 
-        # After cooldown period, should pass again
-        mock_time.return_value = 11.0  # 11 seconds later (> 10 second cooldown)
-        assert notification_manager._check_rate_limit("test_key") is True
+    # After cooldown period, should pass again
+    clock[0] = 11.0  # 11 seconds later (> 10 second cooldown)
+    assert notification_manager._check_rate_limit("test_key") is True
 
 
-def test_coalescing_counter(notification_manager):
+def test_coalescing_counter(notification_manager, clock):
     """Test that repeated notifications increment the count for coalescing."""
-    with patch('time.time') as mock_time:
-        mock_time.return_value = 0.0
-
-        # First notification
-        notification_manager._check_rate_limit("test_key")
-        from wispr_lite.ui.notifications import NotificationState
-        notification_manager.states["test_key"] = NotificationState(last_shown=0.0, count=1)
+    # First notification
+    notification_manager._check_rate_limit("test_key")
+    from wispr_lite.ui.notifications import NotificationState
+    notification_manager.states["test_key"] = NotificationState(last_shown=0.0, count=1)
 
-        # Blocked notifications should increment count
-        mock_time.return_value = 1.0
-        notification_manager._check_rate_limit("test_key")
-        assert notification_manager.states["test_key"].count == 2
+    # Blocked notifications should increment count
+    clock[0] = 1.0
+    notification_manager._check_rate_limit("test_key")
+    assert notification_manager.states["test_key"].count == 2
 
-        mock_time.return_value = 2.0
-        notification_manager._check_rate_limit("test_key")
-        assert notification_manager.states["test_key"].count == 3
+    clock[0] = 2.0
+    notification_manager._check_rate_limit("test_key")
+    assert notification_manager.states["test_key"].count == 3
 
 
 def test_severity_filtering(notification_manager):
@@ -111,36 +106,35 @@ def test_severity_filtering(notification_manager):
 
     # Disable info
     notification_manager.config.show_info = False
+    notification_manager.refresh_severity_mask()
     assert notification_manager._should_show_severity(Severity.INFO) is False
     assert notification_manager._should_show_severity(Severity.WARNING) is True
 
     # Disable warnings
     notification_manager.config.show_warnings = False
+    notification_manager.refresh_severity_mask()
     assert notification_manager._should_show_severity(Severity.WARNING) is False
     assert notification_manager._should_show_severity(Severity.ERROR) is True
 
 
-def test_progress_notifications_bypass_rate_limit(notification_manager):
+def test_progress_notifications_bypass_rate_limit(notification_manager, clock):
     """Test that progress notifications are not subject to per-key rate limiting."""
-    with patch('time.time') as mock_time:
-        mock_time.return_value = 0.0
-
-        # Mock the _show_notification method since we're testing notify() flow
-        notification_manager._show_notification = Mock()
+    # Mock the _show_notification method since we're testing notify() flow
+    notification_manager._show_notification = Mock()
 
-        # First progress notification
-        notification_manager.notify("Download", Severity.PROGRESS, progress=0.0)
-        assert notification_manager._show_notification.call_count == 1
+    # First progress notification
+    notification_manager.notify("Download", Severity.PROGRESS, progress=0.0)
+    assert notification_manager._show_notification.call_count == 1
 
-        # Immediate second progress notification should not be rate limited
-        mock_time.return_value = 0.1
-        notification_manager.notify("Download", Severity.PROGRESS, progress=0.5)
-        assert notification_manager._show_notification.call_count == 2
+    # Immediate second progress notification should not be rate limited
+    clock[0] = 0.1
+    notification_manager.notify("Download", Severity.PROGRESS, progress=0.5)
+    assert notification_manager._show_notification.call_count == 2
 
-        # Third progress notification
-        mock_time.return_value = 0.2
-        notification_manager.notify("Download", Severity.PROGRESS, progress=1.0)
-        assert notification_manager._show_notification.call_count == 3
+    # Third progress notification
+    clock[0] = 0.2
+    notification_manager.notify("Download", Severity.PROGRESS, progress=1.0)
+    assert notification_manager._show_notification.call_count == 3
 
 
 def test_dnd_suppression(notification_manager):
@@ -159,3 +153,17 @@ def test_dnd_suppression(notification_manager):
         notification_manager.notify("Test Event", Severity.INFO, text="Test")
         # Notification should be shown
         assert notification_manager._show_notification.call_count == 1
+
+
+def test_dnd_lookup_is_cached(notification_manager, clock):
+    """Test that DND state is reused briefly instead of queried on every notification."""
+    with patch.object(notification_manager, '_query_dnd', return_value=True) as query:
+        assert notification_manager._is_dnd_active() is True
+        clock[0] = 1.0
+        assert notification_manager._is_dnd_active() is True
+        assert query.call_count == 1
+
+        # Cache expires after DND_CACHE_SEC
+        clock[0] = 2.5
+        notification_manager._is_dnd_active()
+        assert query.call_count == 2
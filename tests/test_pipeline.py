@@ -0,0 +1,119 @@
+"""Tests for the pipeline's utterance buffer (no audio device or ASR model needed)."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("gi")
+
+from wispr_lite import pipeline
+from wispr_lite.pipeline import AudioPipeline
+
+
+def make_pipeline(monkeypatch, buffer_sec=1):
+    """Create a pipeline with a small utterance buffer and stub components."""
+    monkeypatch.setattr(pipeline, 'UTTERANCE_BUFFER_SEC', buffer_sec)
+    vad = SimpleNamespace(sample_rate=16000, frame_duration_ms=30)
+    return AudioPipeline(audio_capture=None, vad=vad, silence_detector=None, asr_engine=None)
+
+
+def test_speech_is_scaled_into_one_preallocated_buffer(monkeypatch):
+    """Test int16 frames land in the float32 buffer in one pass, and ASR gets a read-only view of it."""
+    audio = make_pipeline(monkeypatch)
+    buffer = audio._utterance
+    frames = np.array([[-32768, 0, 16384], [32767, 1, -1]], dtype=np.int16)
+
+    audio._append_speech(frames)
+    audio._append_speech(frames[:1])
+
+    received = []
+    audio.on_transcript = received.append
+    audio._transcribe_and_output()
+
+    assert audio._utterance is buffer
+    np.testing.assert_array_equal(
+        received[0], np.concatenate([frames.ravel(), frames[0]]).astype(np.float32) / 32768.0
+    )
+    assert np.shares_memory(received[0], buffer)
+    assert not received[0].flags.writeable
+    assert audio._utterance_len == 0
+
+
+def test_utterance_buffer_grows_past_initial_capacity(monkeypatch):
+    """Test an utterance longer than the preallocated buffer keeps all earlier samples."""
+    audio = make_pipeline(monkeypatch)
+    frame = np.full((1, 480), 8192, dtype=np.int16)
+
+    for _ in range(40):  # 1.2 s of audio into a 1 s buffer
+        audio._append_speech(frame)
+
+    assert audio._utterance_len == 40 * 480
+    assert audio._utterance.size >= 40 * 480
+    assert np.all(audio._utterance[:audio._utterance_len] == 0.25)
+
+
+def test_stream_worker_merges_backlog_into_one_decode(monkeypatch):
+    """Test chunks queued behind a slow decode are fed to the engine as one chunk."""
+    import queue
+    from unittest.mock import Mock
+
+    engine = Mock()
+    engine.transcribe_chunk.side_effect = lambda stream, chunk, rate, is_last=False: f"{chunk.size}"
+    audio = make_pipeline(monkeypatch)
+    audio.asr_engine = engine
+    audio.on_finalize_partial = Mock()
+
+    chunks = queue.Queue()
+    for n in (100, 200, 300):
+        chunks.put((np.zeros(n, dtype=np.float32), False))
+    chunks.put((np.zeros(50, dtype=np.float32), True))
+    chunks.put(None)
+
+    audio._stream_transcribe(chunks)
+
+    engine.transcribe_chunk.assert_called_once()
+    args, kwargs = engine.transcribe_chunk.call_args
+    assert args[1].size == 650
+    assert kwargs['is_last'] is True
+    audio.on_finalize_partial.assert_called_once_with("650")
+
+
+def test_stream_worker_drops_unfinished_utterance(monkeypatch):
+    """Test a stream that ends without a final chunk is not decoded."""
+    import queue
+    from unittest.mock import Mock
+
+    audio = make_pipeline(monkeypatch)
+    audio.asr_engine = Mock()
+    chunks = queue.Queue()
+    chunks.put((np.zeros(100, dtype=np.float32), False))
+    chunks.put(None)
+
+    audio._stream_transcribe(chunks)
+
+    audio.asr_engine.transcribe_chunk.assert_not_called()
+
+
+def test_frames_pending_at_stop_are_transcribed(monkeypatch):
+    """Test speech still in the capture ring when capture stops ends up in the utterance."""
+    from wispr_lite.audio.ring import FrameRing
+
+    audio = make_pipeline(monkeypatch)
+    ring = FrameRing(capacity=64, frame_size=480)
+    audio.audio_capture = SimpleNamespace(get_frames=ring.pop_many, dropped_frames=0)
+    audio.vad.is_speech_batch = lambda frames: np.ones(len(frames), dtype=bool)
+    audio.silence_detector = SimpleNamespace(update_batch=lambda flags: np.zeros(len(flags), dtype=bool))
+    monkeypatch.setattr(audio, '_set_thread_priority', lambda: None)
+    received = []
+    audio.on_transcript = lambda samples: received.append(samples.size)
+
+    # Ten 30 ms frames captured right before release; more than one processing batch
+    for _ in range(10):
+        ring.push(np.full(480, 1000, dtype=np.int16))
+    ring.interrupt()
+    audio.stop_processing.set()
+
+    audio._process_audio()
+
+    assert received == [10 * 480]
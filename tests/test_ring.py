@@ -0,0 +1,136 @@
+"""Tests for the capture frame ring."""
+
+import numpy as np
+from wispr_lite.audio.ring import FrameRing
+
+
+def test_ring_fifo_order():
+    """Test frames come out in order as int16 byte views."""
+    ring = FrameRing(capacity=4, frame_size=3)
+
+    for value in range(3):
+        assert ring.push(np.full(3, value, dtype=np.int16))
+
+    for value in range(3):
+        frame = ring.pop(timeout=0)
+        assert len(frame) == 6
+        assert np.frombuffer(frame, dtype=np.int16).tolist() == [value] * 3
+
+    assert ring.pop(timeout=0) is None
+
+
+def test_ring_drops_when_full():
+    """Test the producer drops frames instead of overwriting unread ones."""
+    ring = FrameRing(capacity=2, frame_size=2)
+
+    assert ring.push(np.array([1, 1], dtype=np.int16))
+    assert ring.push(np.array([2, 2], dtype=np.int16))
+    assert not ring.push(np.array([3, 3], dtype=np.int16))
+
+    # The frame being read still occupies its slot until the next pop
+    first = ring.pop(timeout=0)
+    assert not ring.push(np.array([3, 3], dtype=np.int16))
+    assert np.frombuffer(first, dtype=np.int16).tolist() == [1, 1]
+
+    ring.pop(timeout=0)
+    assert ring.push(np.array([3, 3], dtype=np.int16))
+    assert len(ring) == 1
+
+
+def test_ring_clear():
+    """Test clearing drops pending frames."""
+    ring = FrameRing(capacity=4, frame_size=2)
+    ring.push(np.zeros(2, dtype=np.int16))
+    ring.push(np.zeros(2, dtype=np.int16))
+
+    ring.clear()
+
+    assert len(ring) == 0
+    assert ring.pop(timeout=0.01) is None
+
+
+def test_ring_reuses_preallocated_slots():
+    """Test frames are written into and read from the preallocated buffer without new allocations."""
+    ring = FrameRing(capacity=2, frame_size=4)
+    buffer = ring.buffer
+
+    for value in range(5):
+        assert ring.push(np.full(4, value, dtype=np.int16))
+        frame = np.frombuffer(ring.pop(timeout=0), dtype=np.int16)
+        assert np.shares_memory(frame, buffer)
+        assert frame.tolist() == [value] * 4
+
+    assert ring.buffer is buffer
+
+
+def test_ring_drops_oldest_beyond_max_pending():
+    """Test a lagging consumer skips to the newest max_pending frames."""
+    ring = FrameRing(capacity=8, frame_size=1, max_pending=3)
+
+    for value in range(6):
+        assert ring.push(np.array([value], dtype=np.int16))
+
+    values = [np.frombuffer(ring.pop(timeout=0), dtype=np.int16)[0] for _ in range(3)]
+
+    assert values == [3, 4, 5]
+    assert ring.dropped == 3
+    assert ring.pop(timeout=0) is None
+
+
+def test_ring_pop_many_returns_contiguous_blocks():
+    """Test blocks are zero-copy views that stop at the ring's wrap-around."""
+    ring = FrameRing(capacity=4, frame_size=2)
+    for value in range(3):
+        ring.push(np.full(2, value, dtype=np.int16))
+
+    block = ring.pop_many(8, timeout=0)
+    assert block.shape == (3, 2)
+    assert block[:, 0].tolist() == [0, 1, 2]
+    assert np.shares_memory(block, ring.buffer)
+
+    # Slot 3 is the last before the wrap; the next frame lands in slot 0
+    ring.push(np.full(2, 3, dtype=np.int16))
+    assert ring.pop_many(8, timeout=0)[:, 0].tolist() == [3]
+    ring.push(np.full(2, 4, dtype=np.int16))
+    ring.push(np.full(2, 5, dtype=np.int16))
+    assert ring.pop_many(8, timeout=0)[:, 0].tolist() == [4, 5]
+    assert ring.pop_many(8, timeout=0) is None
+
+
+def test_ring_clear_releases_held_block():
+    """Test clear() drops pending and held frames in one step, freeing every slot."""
+    ring = FrameRing(capacity=4, frame_size=2)
+    for _ in range(4):
+        ring.push(np.zeros(2, dtype=np.int16))
+    assert ring.pop_many(2, timeout=0).shape == (2, 2)
+
+    ring.clear()
+
+    assert len(ring) == 0
+    for _ in range(4):
+        assert ring.push(np.ones(2, dtype=np.int16))
+
+
+def test_ring_interrupt_wakes_waiting_consumer():
+    """Test interrupt() ends a pending wait early and resume() restores waiting."""
+    import threading
+    import time
+
+    ring = FrameRing(capacity=4, frame_size=2, poll_interval=0.001)
+    result = []
+    reader = threading.Thread(target=lambda: result.append(ring.pop_many(4, timeout=10)))
+
+    start = time.monotonic()
+    reader.start()
+    time.sleep(0.02)
+    ring.interrupt()
+    reader.join(timeout=1)
+
+    assert result == [None]
+    assert time.monotonic() - start < 1
+
+    ring.push(np.ones(2, dtype=np.int16))
+    assert ring.pop_many(4, timeout=10).shape == (1, 2)
+
+    ring.resume()
+    assert ring.pop_many(4, timeout=0.01) is None
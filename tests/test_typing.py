@@ -0,0 +1,400 @@
+"""Tests for TextOutput smart spacing and capitalization (no X display needed)."""
+
+import pytest
+
+from wispr_lite.config.schema import TypingConfig
+from wispr_lite.integration.typing import core
+
+
+@pytest.fixture
+def text_output(monkeypatch):
+    """TextOutput whose clipboard insertion records text instead of pasting."""
+    inserted = []
+    monkeypatch.setattr(core.clipboard, 'check_xclip', lambda: True)
+    monkeypatch.setattr(core.clipboard, 'insert_via_clipboard', lambda text, *args: inserted.append(text) or True)
+
+    output = core.TextOutput(TypingConfig(strategy="clipboard"))
+    output.inserted = inserted
+    return output
+
+
+def fake_display():
+    """Mock X display with no pending events and a small US-like keyboard mapping."""
+    from unittest.mock import Mock
+    from Xlib import XK
+
+    levels = {XK.string_to_keysym(name): (8 + i, 0) for i, name in enumerate(
+        ["BackSpace", "Control_L", "Shift_L", "space", "period"]
+    )}
+    for i, letter in enumerate("abcdefghijklmnopqrstuvwxyz"):
+        levels[XK.string_to_keysym(letter)] = (20 + i, 0)
+        levels[XK.string_to_keysym(letter.upper())] = (20 + i, 1)
+    by_key = {key: keysym for keysym, key in levels.items()}
+
+    disp = Mock()
+    disp.pending_events.return_value = 0
+    disp.display.info.min_keycode = 8
+    disp.display.info.max_keycode = 60
+    disp.keycode_to_keysym.side_effect = lambda keycode, index: by_key.get((keycode, index), 0)
+    return disp
+
+
+@pytest.fixture
+def xtest_display(monkeypatch):
+    """Shared XTest input display replaced by fake_display(), with fake_input recorded.
+
+    Yields a namespace with the display, the patched Display constructor
+    (connect) and the fake_input mock; the shared display is closed on teardown.
+    """
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+    from wispr_lite.integration.typing import xtest
+
+    disp = fake_display()
+    fake = SimpleNamespace(display=disp, connect=Mock(return_value=disp), fake_input=Mock())
+    monkeypatch.setattr(xtest.display, 'Display', fake.connect)
+    # clipboard.xtest is the same Xlib.ext.xtest module, so paste is recorded too
+    monkeypatch.setattr(xtest.xtest, 'fake_input', fake.fake_input)
+    xtest.close_input_display()
+
+    yield fake
+
+    xtest.close_input_display()
+
+
+def test_smart_spacing_and_capitalization(text_output):
+    """Test sentences are capitalized and separated after sentence-ending punctuation."""
+    for text in ["hello world.", "next one", "more", "done?  \n", "yes"]:
+        text_output.insert_text(text)
+
+    assert text_output.inserted == ["Hello world.", " Next one", "more", "done?  \n", " Yes"]
+
+
+def test_last_sentence_end_tracks_assignments(text_output):
+    """Test the cached last character follows every update of last_inserted_text."""
+    text_output.last_inserted_text = "Ends here!   "
+    text_output.insert_text("again")
+    assert text_output.inserted[-1] == " Again"
+
+    text_output.last_inserted_text = "no end"
+    text_output.insert_text("again")
+    assert text_output.inserted[-1] == "again"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("hello", "Hello"),
+    ("  'quoted' word", "  'Quoted' word"),
+    ("3 apples", "3 Apples"),
+    ("éclair", "Éclair"),
+    ("...", "..."),
+])
+def test_smart_capitalization_first_letter(text_output, text, expected):
+    """Test the first letter is capitalized wherever it appears."""
+    text_output.insert_text(text)
+
+    assert text_output.inserted == [expected]
+
+
+def test_tool_checks_are_cached_path_lookups(monkeypatch):
+    """Test xclip/xdotool detection uses one PATH lookup per process and no subprocess."""
+    from unittest.mock import Mock
+    from wispr_lite.integration.typing import clipboard, xtest
+
+    which = Mock(return_value="/usr/bin/tool")
+    monkeypatch.setattr(clipboard.shutil, 'which', which)
+    monkeypatch.setattr(clipboard.subprocess, 'run', Mock(side_effect=AssertionError("no subprocess")))
+    clipboard.check_xclip.cache_clear()
+    xtest.check_xdotool.cache_clear()
+
+    try:
+        assert clipboard.check_xclip() and clipboard.check_xclip()
+        assert xtest.check_xdotool()
+        assert which.call_count == 2
+    finally:
+        clipboard.check_xclip.cache_clear()
+        xtest.check_xdotool.cache_clear()
+
+
+def test_synthetic_input_shares_one_display(xtest_display):
+    """Test paste, typing and undo reuse one X connection until it fails."""
+    from wispr_lite.integration.typing import clipboard, xtest
+
+    clipboard.simulate_paste()
+    assert xtest.undo_via_xlib(2, 0)
+    assert xtest.insert_partial("ab", "", 0)[0]
+    assert xtest_display.connect.call_count == 1
+    assert xtest_display.fake_input.call_count == 4 + 4 + 4
+
+    xtest_display.fake_input.side_effect = OSError("connection lost")
+    assert not xtest.undo_via_xlib(1, 0)
+    xtest_display.fake_input.side_effect = None
+    assert xtest.undo_via_xlib(1, 0)
+    assert xtest_display.connect.call_count == 2
+
+
+def test_clipboard_insert_waits_for_transfer_not_fixed_sleeps(monkeypatch):
+    """Test a confirmed in-process owner replaces the fixed pre/post-paste sleeps."""
+    from unittest.mock import Mock
+    from wispr_lite.integration.typing import clipboard
+
+    owner = Mock()
+    calls = []
+    owner.expect_paste.side_effect = lambda selection: calls.append('expect')
+    monkeypatch.setattr(clipboard, '_own_text', lambda text, selection: owner)
+    monkeypatch.setattr(clipboard, 'simulate_paste', lambda: calls.append('paste'))
+    monkeypatch.setattr(clipboard, 'save_clipboard_data', lambda selection: {'text': 'old'})
+    monkeypatch.setattr(clipboard, 'restore_clipboard_with_targets', lambda data, selection: calls.append(selection))
+    monkeypatch.setattr(clipboard.time, 'sleep', Mock(side_effect=AssertionError("no fixed sleep")))
+
+    assert clipboard.insert_via_clipboard("hello", preserve_clipboard=True, xclip_available=True)
+
+    # The transfer wait is armed before the paste chord, so a fast fetch isn't missed
+    assert calls == ['expect', 'paste', 'clipboard', 'primary']
+    owner.wait_for_transfer.assert_called_once_with('clipboard', clipboard.PASTE_TRANSFER_TIMEOUT)
+
+
+def test_clipboard_owner_flags_transfer_only_to_pasting_client(monkeypatch):
+    """Test only a data request from the focused client, once armed, marks the selection transferred."""
+    import threading
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+    from wispr_lite.integration.typing import clipboard
+
+    monkeypatch.setattr(clipboard.xevent, 'SelectionNotify', Mock())
+    owner = object.__new__(clipboard._ClipboardOwner)
+    owner.display = Mock()
+    owner.display.intern_atom.return_value = 1
+    owner.display.screen.return_value.root.id = 0x100
+    # Focused window 0x4200005 belongs to client 0x4200000
+    owner.display.get_input_focus.return_value.focus = SimpleNamespace(id=0x4200005)
+    owner.resource_id_mask = 0x1fffff
+    owner.targets_atom = 99
+    owner._lock = threading.Lock()
+    owner._contents = {1: {5: b"hello"}}
+    owner._transferred = {}
+    owner._paste_clients = {}
+
+    def request(target, requestor_id):
+        return SimpleNamespace(
+            property=7, target=target, selection=1, time=0, requestor=Mock(id=requestor_id)
+        )
+
+    # A clipboard manager fetching right after the ownership change
+    owner._answer(request(5, 0x2600001))
+    owner.expect_paste('clipboard')
+    assert not owner.wait_for_transfer('clipboard', 0)
+
+    # Armed before the chord: the manager's fetch and the app's TARGETS query still don't count
+    owner._answer(request(5, 0x2600001))
+    owner._answer(request(99, 0x4200011))
+    assert not owner.wait_for_transfer('clipboard', 0)
+
+    # The focused app's selection helper window (same client) fetches the text
+    owner._answer(request(5, 0x4200011))
+    assert owner.wait_for_transfer('clipboard', 0)
+
+    # With focus on the root window no fetch counts
+    owner.display.get_input_focus.return_value.focus = SimpleNamespace(id=0x100)
+    owner.expect_paste('clipboard')
+    owner._answer(request(5, 0x4200011))
+    assert not owner.wait_for_transfer('clipboard', 0)
+
+
+def test_clipboard_displays_use_real_locks():
+    """Test the clipboard module enables Xlib's thread locks for the shared owner connection."""
+    from Xlib.support import lock
+    from wispr_lite.integration.typing import clipboard  # noqa: F401
+
+    assert lock.allocate_lock() is not lock._dummy_lock
+
+
+def test_partial_delta_is_one_batch_with_cached_key_lookups(xtest_display):
+    """Test a partial delta syncs once and keycodes come from a keysym table built once."""
+    from wispr_lite.integration.typing import xtest
+
+    assert xtest.insert_partial("hello there", "hello", 5) == (True, "hello there", 11)
+    assert xtest.insert_partial("hello thee", "hello there", 5)[0]
+
+    assert xtest_display.display.sync.call_count == 2
+    # The keymap is read once (two levels of 53 keycodes), not per character
+    assert xtest_display.display.keycode_to_keysym.call_count == 2 * 53
+
+
+def test_clipboard_insert_without_xclip_uses_xlib(monkeypatch):
+    """Test the clipboard strategy works in-process when xclip is missing but Xlib is present."""
+    from unittest.mock import Mock
+    from wispr_lite.integration.typing import clipboard
+
+    set_clipboard = Mock()
+    monkeypatch.setattr(clipboard, 'XLIB_AVAILABLE', True)
+    monkeypatch.setattr(clipboard, '_own_text', lambda text, selection: Mock())
+    monkeypatch.setattr(clipboard, 'simulate_paste', Mock())
+    monkeypatch.setattr(clipboard, 'set_clipboard', set_clipboard)
+
+    assert clipboard.insert_via_clipboard("hello", preserve_clipboard=False, xclip_available=False)
+    set_clipboard.assert_not_called()
+
+    monkeypatch.setattr(clipboard, 'XLIB_AVAILABLE', False)
+    assert not clipboard.insert_via_clipboard("hello", preserve_clipboard=False, xclip_available=False)
+
+
+def test_no_smart_space_before_leading_punctuation(text_output):
+    """Test text starting with punctuation attaches directly to the previous sentence."""
+    text_output.insert_text("Done.")
+    text_output.insert_text("..and more")
+    text_output.insert_text("x")
+
+    assert text_output.inserted == ["Done.", "..And more", "x"]
+
+
+def test_xdotool_undo_is_one_process(monkeypatch):
+    """Test the xdotool fallback presses all backspaces from a single subprocess."""
+    from unittest.mock import Mock
+    from wispr_lite.integration.typing import xtest
+
+    run = Mock()
+    monkeypatch.setattr(xtest.subprocess, 'run', run)
+
+    assert xtest.undo_via_xdotool(42, 0)
+
+    run.assert_called_once()
+    assert run.call_args.args[0] == ["xdotool", "key", "--delay", "0"] + ["BackSpace"] * 42
+
+
+def test_closed_display_reconnects_once(xtest_display):
+    """Test a connection closed by the server is reopened and the batch resent once."""
+    from Xlib.error import ConnectionClosedError
+    from wispr_lite.integration.typing import xtest
+
+    stale, fresh = xtest_display.display, fake_display()
+    stale.sync.side_effect = ConnectionClosedError('server')
+    xtest_display.connect.side_effect = [stale, fresh]
+
+    assert xtest.undo_via_xlib(3, 0)
+    fresh.sync.assert_called_once()
+    assert xtest.get_input_display() is fresh
+
+
+def test_keysym_table_shift_levels_and_mapping_refresh(xtest_display):
+    """Test shifted characters press Shift and a MappingNotify rebuilds the keysym table."""
+    from types import SimpleNamespace
+    from Xlib import X
+    from wispr_lite.integration.typing import xtest
+
+    disp = xtest_display.display
+    xtest.insert_batch("Hi")
+    assert [c.args[1:] for c in xtest_display.fake_input.call_args_list] == [
+        (X.KeyPress, 10), (X.KeyPress, 27), (X.KeyRelease, 27), (X.KeyRelease, 10),
+        (X.KeyPress, 28), (X.KeyRelease, 28),
+    ]
+
+    mapping = SimpleNamespace(type=X.MappingNotify, request=X.MappingKeyboard)
+    disp.pending_events.side_effect = [1, 0]
+    disp.next_event.return_value = mapping
+    reads = disp.keycode_to_keysym.call_count
+    xtest.insert_batch("a")
+
+    disp.refresh_keyboard_mapping.assert_called_once_with(mapping)
+    assert disp.keycode_to_keysym.call_count == 2 * reads
+
+
+def test_paced_typing_uses_server_side_delays(xtest_display):
+    """Test typing_delay_ms becomes XTest event delays with no Python sleeps and one sync."""
+    from wispr_lite.integration.typing import xtest
+
+    assert xtest.insert_via_xtest("abc", 5)
+    press_delays = [c.kwargs.get('time', 0) for c in xtest_display.fake_input.call_args_list[::2]]
+    assert press_delays == [0, 5, 5]
+    xtest_display.display.flush.assert_not_called()
+    xtest_display.display.sync.assert_called_once()
+
+
+@pytest.mark.parametrize("old, new, deleted, added", [
+    ("hello", "hello world", 0, " world"),
+    ("hello world", "hello word", 2, "d"),
+    ("abc", "xyz", 3, "xyz"),
+    ("same", "same", 0, ""),
+    ("longer text", "long", 7, ""),
+])
+def test_partial_delta_from_common_prefix(monkeypatch, old, new, deleted, added):
+    """Test partial typing deletes the changed suffix and types only the new one."""
+    from wispr_lite.integration.typing import xtest
+
+    sent = []
+    monkeypatch.setattr(xtest, 'insert_batch', lambda chars, backspaces=0: sent.append((backspaces, chars)))
+
+    assert xtest.insert_partial(new, old, 0) == (True, new, len(new))
+    assert sent == [(deleted, added)]
+
+
+def test_common_characters_resolve_with_one_lookup(monkeypatch, xtest_display):
+    """Test lowercase letters, digits and spaces are prefilled; other characters are resolved once."""
+    from unittest.mock import Mock
+    from wispr_lite.integration.typing import xtest
+
+    xtest.insert_batch("a")
+    char_keysym = Mock(side_effect=xtest._char_keysym)
+    monkeypatch.setattr(xtest, '_char_keysym', char_keysym)
+
+    xtest.insert_batch("hello world")
+    char_keysym.assert_not_called()
+
+    xtest.insert_batch("Hi Hi")
+    assert char_keysym.call_count == 1
+
+
+def test_shift_held_across_runs_of_capitals(xtest_display):
+    """Test consecutive shifted characters share one Shift press and release."""
+    from Xlib import X
+    from wispr_lite.integration.typing import xtest
+
+    fake_input = xtest_display.fake_input
+    xtest.insert_batch("HEy")
+    assert [c.args[1:] for c in fake_input.call_args_list] == [
+        (X.KeyPress, 10),
+        (X.KeyPress, 27), (X.KeyRelease, 27),
+        (X.KeyPress, 24), (X.KeyRelease, 24),
+        (X.KeyRelease, 10),
+        (X.KeyPress, 44), (X.KeyRelease, 44),
+    ]
+
+    fake_input.reset_mock()
+    xtest.insert_batch("A")
+    assert fake_input.call_args_list[-1].args[1:] == (X.KeyRelease, 10)
+
+
+def test_xdotool_probe_deferred_until_undo_fallback(monkeypatch):
+    """Test creating a TextOutput doesn't look up xdotool; the undo fallback does."""
+    from unittest.mock import Mock
+    from wispr_lite.integration.typing import xtest
+
+    check = Mock(return_value=False)
+    monkeypatch.setattr(xtest, 'check_xdotool', check)
+    monkeypatch.setattr(core.clipboard, 'check_xclip', lambda: True)
+    monkeypatch.setattr(xtest, 'XLIB_AVAILABLE', False)
+
+    output = core.TextOutput(TypingConfig(strategy="clipboard"))
+    check.assert_not_called()
+
+    output.last_inserted_length = 3
+    assert not output.undo_last()
+    check.assert_called_once()
+
+
+def test_bulk_typing_is_wrapped_in_server_grab(xtest_display):
+    """Test undelayed typing grabs the server around the keys and paced typing does not."""
+    from wispr_lite.integration.typing import xtest
+
+    disp = xtest_display.display
+    calls = []
+    disp.grab_server.side_effect = lambda: calls.append('grab')
+    disp.ungrab_server.side_effect = lambda: calls.append('ungrab')
+    disp.sync.side_effect = lambda: calls.append('sync')
+    xtest_display.fake_input.side_effect = lambda *args, **kwargs: calls.append('key')
+
+    assert xtest.insert_via_xtest("ab", 0)
+    assert calls == ['grab'] + ['key'] * 4 + ['ungrab', 'sync']
+
+    calls.clear()
+    assert xtest.insert_via_xtest("ab", 5)
+    assert calls == ['key'] * 4 + ['sync']
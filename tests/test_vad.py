@@ -1,7 +1,9 @@
 """Tests for VAD module."""
 
 import struct
+import numpy as np
 import pytest
+from unittest.mock import Mock
 from wispr_lite.audio.vad import VAD, SilenceDetector
 from wispr_lite.config.schema import AudioConfig
 
@@ -30,6 +32,85 @@ def test_vad_energy_calculation():
 
     assert energy_silent < energy_loud
 
+    # Frames built directly from NumPy buffers
+    assert vad._calculate_energy(np.zeros(320, dtype=np.int16).tobytes()) == 0.0
+    assert vad._calculate_energy(np.full(320, 1000, dtype=np.int16).tobytes()) == pytest.approx(1000.0)
+
+    # Full-scale random samples match the straightforward float64 RMS
+    samples = np.random.default_rng(0).integers(-32768, 32768, 320).astype(np.int16)
+    expected = np.sqrt(np.mean(samples.astype(np.float64) ** 2))
+    assert vad._calculate_energy(samples.tobytes()) == pytest.approx(expected, rel=1e-6)
+
+    # Integer accumulation is exact even at full scale
+    assert vad._calculate_energy(np.full(320, -32768, dtype=np.int16).tobytes()) == 32768.0
+
+
+def test_vad_energy_short_circuits_webrtcvad():
+    """Test clearly silent or loud frames are decided by energy alone."""
+    vad = VAD(AudioConfig())
+    vad.vad = Mock()
+    vad.vad.is_speech.return_value = True
+
+    assert vad.is_speech(np.zeros(320, dtype=np.int16).tobytes()) is False
+    assert vad.is_speech(np.full(320, 1000, dtype=np.int16).tobytes()) is True
+    vad.vad.is_speech.assert_not_called()
+
+    # Ambiguous energy defers to webrtcvad
+    assert vad.is_speech(np.full(320, 300, dtype=np.int16).tobytes()) is True
+    vad.vad.is_speech.assert_called_once()
+
+
+def test_vad_batch_matches_per_frame():
+    """Test block classification agrees with frame-by-frame is_speech."""
+    vad = VAD(AudioConfig())
+    rng = np.random.default_rng(1)
+    levels = [0, 1000, 300, 50, 5000, 0]
+    frames = np.stack([
+        (rng.standard_normal(320) * level).astype(np.int16) for level in levels
+    ])
+
+    expected = [vad.is_speech(frame.tobytes()) for frame in frames]
+
+    assert vad.is_speech_batch(frames).tolist() == expected
+
+
+def test_vad_batch_passes_whole_30ms_frames_to_webrtcvad(caplog):
+    """Test ambiguous 30 ms frames reach webrtcvad as full byte buffers in a batch."""
+    vad = VAD(AudioConfig(frame_duration_ms=30))
+    t = np.arange(480) / 16000
+
+    def voiced(rms, f0):
+        wave = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 8))
+        return (wave / np.sqrt(np.mean(wave ** 2)) * rms).astype(np.int16)
+
+    noise = (np.random.default_rng(2).standard_normal(480) * 300).astype(np.int16)
+    # All within the energy band where webrtcvad decides
+    frames = np.stack([noise, voiced(300, 120), voiced(400, 180), voiced(450, 220)])
+
+    # webrtcvad keeps state across calls, so the reference gets its own instance
+    reference = VAD(AudioConfig(frame_duration_ms=30))
+    expected = [reference.is_speech(frame.tobytes()) for frame in frames]
+
+    assert vad.is_speech_batch(frames).tolist() == expected
+    assert any(expected)
+    assert not [r for r in caplog.records if r.levelname == 'ERROR']
+
+
+def test_silero_vad_uses_fixed_window():
+    """Test the Silero backend switches to 512-sample frames and scores them."""
+    config = AudioConfig(vad_backend="silero")
+    vad = VAD(config)
+    if vad.silero is None:
+        pytest.skip("Silero VAD model or onnxruntime not available")
+
+    assert vad.frame_duration_ms == 32
+
+    silent_frame = np.zeros(512, dtype=np.int16).tobytes()
+    assert vad.is_speech(silent_frame) is False
+
+    # 20 ms frames no longer match the expected size
+    assert vad.is_speech(np.zeros(320, dtype=np.int16).tobytes()) is False
+
 
 def test_silence_detector():
     """Test silence detector."""
@@ -42,26 +123,58 @@ def test_silence_detector():
     detector.update(is_speech=True)
     assert detector.silence_frame_count == 0
 
-    # Simulate silence until timeout
-    for _ in range(49):  # 49 frames of silence
-        result = detector.update(is_speech=False)
-        if result:
-            break
+    # 49 frames of silence is just under the 1000ms timeout
+    assert detector.update_many(49, is_speech=False) is False
 
-    # Should eventually timeout
+    # The 50th frame reaches the timeout
     assert detector.update(is_speech=False) is True
 
 
+def test_silence_detector_batch():
+    """Test batched silence detection matches per-frame updates."""
+    flags = np.array([True] + [False] * 49 + [True] + [False] * 60, dtype=bool)
+
+    batch_detector = SilenceDetector(silence_timeout_ms=1000, frame_duration_ms=20)
+    timeouts = batch_detector.update_batch(flags)
+
+    scalar_detector = SilenceDetector(silence_timeout_ms=1000, frame_duration_ms=20)
+    expected = [scalar_detector.update(is_speech=bool(flag)) for flag in flags]
+
+    assert timeouts.tolist() == expected
+    assert batch_detector.silence_frame_count == scalar_detector.silence_frame_count
+    assert not timeouts[:51].any()
+    assert timeouts[-11:].all()
+
+
 def test_silence_detector_reset():
     """Test silence detector reset."""
     detector = SilenceDetector(silence_timeout_ms=1000, frame_duration_ms=20)
 
     # Build up some silence
-    for _ in range(10):
-        detector.update(is_speech=False)
+    detector.update_many(10, is_speech=False)
 
     assert detector.silence_frame_count > 0
 
     # Reset
     detector.reset()
     assert detector.silence_frame_count == 0
+
+
+def test_silence_batch_numpy_fallback_matches_scalar():
+    """Test the vectorized fallback (used without numba) matches per-frame updates."""
+    from wispr_lite.audio.vad import _silence_batch_numpy
+
+    rng = np.random.default_rng(0)
+    for carried in (0, 7, 60):
+        flags = rng.random(300) < 0.05
+        detector = SilenceDetector(silence_timeout_ms=1000, frame_duration_ms=20)
+        detector.silence_frame_count = carried
+        expected = [detector.update(is_speech=bool(flag)) for flag in flags]
+
+        timeouts, count = _silence_batch_numpy(flags, detector.max_silence_frames, carried)
+
+        assert timeouts.tolist() == expected
+        assert count == detector.silence_frame_count
+
+    timeouts, count = _silence_batch_numpy(np.zeros(0, dtype=bool), 50, 12)
+    assert timeouts.size == 0 and count == 12
@@ -6,12 +6,14 @@ Coordinates all components and manages application lifecycle.
 import sys
 import signal
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
 
 import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GLib
 
-from wispr_lite.logging import get_logger, set_log_level
+from wispr_lite.logging import get_logger, set_log_level, LOG_LEVELS
 from wispr_lite.config.schema import Config
 from wispr_lite.audio.capture import AudioCapture
 from wispr_lite.audio.vad import VAD, SilenceDetector
@@ -48,40 +50,79 @@ class WisprLiteApp:
 
         # Load configuration
         self.config = Config.load()
-        set_log_level(getattr(__import__('logging'), self.config.log_level))
+        set_log_level(LOG_LEVELS.get(self.config.log_level, LOG_LEVELS["INFO"]))
 
         # Application state
         self.is_listening = False
         self.is_muted = False
         self.current_state = "idle"
+        # Whether partial transcripts are typed (off while a push-to-talk chord is held)
+        self._type_partials = True
+
+        # Latest overlay transcript waiting for the main loop (older partials are dropped)
+        self._pending_transcript: Optional[str] = None
+        self._transcript_flush_scheduled = False
+        self._transcript_lock = threading.Lock()
+
+        # Transcription runs on a single ASR thread; at most one utterance waits
+        # behind the running one (a newer utterance replaces a stale waiting one)
+        self._asr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asr")
+        self._asr_lock = threading.Lock()
+        self._pending_audio = None
+        self._asr_busy = False
+
+        # Components that probe the system (D-Bus connect, xclip/xdotool checks,
+        # VAD model load) are built in parallel; GTK widgets stay on the main thread
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="startup") as startup:
+            audio_future = startup.submit(self._create_audio_components)
+            text_output_future = startup.submit(TextOutput, self.config.typing)
+            hotkey_future = startup.submit(HotkeyManager, self.config.hotkeys)
+            dbus_future = startup.submit(create_dbus_service)
+
+            self.notification_manager = NotificationManager(
+                self.config.notifications,
+                action_callback=self._on_notification_action
+            )
+            self.asr_engine = create_asr_engine(self.config.asr)
 
-        # Initialize components
-        audio_capture = AudioCapture(self.config.audio)
-        vad = VAD(self.config.audio)
-        silence_detector = SilenceDetector(
-            self.config.audio.vad_silence_timeout_ms,
-            self.config.audio.frame_duration_ms
-        )
-        self.notification_manager = NotificationManager(
-            self.config.notifications,
-            action_callback=self._on_notification_action
-        )
-        self.asr_engine = create_asr_engine(self.config.asr)
+            # Wire up model download consent and progress callbacks
+            self.asr_engine.on_consent_needed = self._on_model_consent_needed
+            self.asr_engine.on_download_progress = self._on_model_download_progress
+
+            # Load the model in the background so the first dictation doesn't pay for it
+            self._start_model_preload()
 
-        # Wire up model download consent and progress callbacks
-        self.asr_engine.on_consent_needed = self._on_model_consent_needed
-        self.asr_engine.on_download_progress = self._on_model_download_progress
+            self.command_registry = CommandRegistry(self.config.commands)
 
-        self.text_output = TextOutput(self.config.typing)
-        # Wire up undo unavailable warning callback
-        self.text_output.on_undo_unavailable = self._on_undo_unavailable
+            # UI components
+            self.overlay = OverlayWindow(self.config.ui)
+            self.tray = TrayIcon()
 
-        self.command_registry = CommandRegistry(self.config.commands)
+            # Accessibility manager
+            self.accessibility_manager = AccessibilityManager()
+
+            # TextOutput may fall back to another typing strategy; settle that
+            # before the preferences window reads the config
+            self.text_output = text_output_future.result()
+            # Wire up undo unavailable warning callback
+            self.text_output.on_undo_unavailable = self._on_undo_unavailable
+
+            self.preferences = PreferencesWindow(self.config)
+
+            vad, audio_capture, silence_detector = audio_future.result()
+
+            # Hotkey manager
+            self.hotkey_manager = hotkey_future.result()
+
+            # D-Bus service
+            self.dbus_service = dbus_future.result()
 
         # Audio pipeline
         self.pipeline = AudioPipeline(audio_capture, vad, silence_detector, self.asr_engine)
         self.pipeline.on_state_change = self._update_state
         self.pipeline.on_transcript = self._handle_transcript
+        self.pipeline.on_partial_transcript = self._handle_partial_transcript
+        self.pipeline.on_finalize_partial = self._handle_final_transcript
         self.pipeline.on_stop_listening = self.stop_listening
         self.pipeline.on_worker_crash = self._handle_worker_crash
 
@@ -89,25 +130,26 @@ class WisprLiteApp:
         self.worker_crash_count = 0
         self.max_worker_restarts = 1
 
-        # UI components
-        self.overlay = OverlayWindow(self.config.ui)
-        self.tray = TrayIcon()
-        self.preferences = PreferencesWindow(self.config)
-
-        # Hotkey manager
-        self.hotkey_manager = HotkeyManager(self.config.hotkeys)
-
-        # D-Bus service
-        self.dbus_service = create_dbus_service()
-
-        # Accessibility manager
-        self.accessibility_manager = AccessibilityManager()
-
         # Setup callbacks
         self._setup_callbacks()
 
         logger.info("Wispr-Lite initialized successfully")
 
+    def _create_audio_components(self) -> Tuple[VAD, AudioCapture, SilenceDetector]:
+        """Create the VAD, audio capture, and silence detector.
+
+        Returns:
+            Tuple of (vad, audio_capture, silence_detector)
+        """
+        # The VAD decides the frame length (Silero needs fixed 32 ms windows)
+        vad = VAD(self.config.audio)
+        audio_capture = AudioCapture(self.config.audio, frame_duration_ms=vad.frame_duration_ms)
+        silence_detector = SilenceDetector(
+            self.config.audio.vad_silence_timeout_ms,
+            vad.frame_duration_ms
+        )
+        return vad, audio_capture, silence_detector
+
     def _setup_callbacks(self) -> None:
         """Setup callbacks between components."""
         # Tray callbacks
@@ -120,7 +162,7 @@ class WisprLiteApp:
         self.tray.on_quit = self.quit
 
         # Hotkey callbacks
-        self.hotkey_manager.on_push_to_talk_press = self.start_listening
+        self.hotkey_manager.on_push_to_talk_press = self._start_push_to_talk
         self.hotkey_manager.on_push_to_talk_release = self.stop_listening
         self.hotkey_manager.on_toggle = self.toggle_listening
         self.hotkey_manager.on_undo = self.undo_last_dictation
@@ -138,8 +180,16 @@ class WisprLiteApp:
         # Preferences callback
         self.preferences.on_save = self.on_preferences_saved
 
-    def start_listening(self) -> None:
-        """Start listening for audio."""
+    def _start_push_to_talk(self) -> None:
+        """Start listening from the push-to-talk hotkey."""
+        self.start_listening(push_to_talk=True)
+
+    def start_listening(self, push_to_talk: bool = False) -> None:
+        """Start listening for audio.
+
+        Args:
+            push_to_talk: The push-to-talk chord is held for the whole utterance
+        """
         if self.is_listening:
             return
 
@@ -156,6 +206,16 @@ class WisprLiteApp:
         # Update UI
         GLib.idle_add(self._update_state, "listening")
 
+        # Type-while-speaking decodes chunks during capture instead of after it
+        self.pipeline.streaming = (
+            self.config.typing.type_while_speaking and self.config.mode == "dictation"
+        )
+
+        # Typed keys would reach the focused app as shortcuts of the held chord,
+        # so push-to-talk partials only go to the overlay; the final text is
+        # typed after release
+        self._type_partials = not push_to_talk
+
         # Start pipeline
         self.pipeline.start()
 
@@ -181,47 +241,115 @@ class WisprLiteApp:
             self.start_listening()
 
     def _handle_transcript(self, audio_array) -> None:
-        """Handle transcription of audio array.
+        """Queue an utterance for transcription on the ASR thread.
+
+        Called on the pipeline thread, which returns to capture immediately.
+
+        Args:
+            audio_array: Audio samples as numpy array (only valid during this call)
+        """
+        # The pipeline reuses its buffer for the next utterance, so keep a copy
+        audio = audio_array.copy()
+
+        with self._asr_lock:
+            if self._pending_audio is not None:
+                logger.warning("Transcription backlog: dropping stale utterance")
+            self._pending_audio = audio
+            if self._asr_busy:
+                return
+            self._asr_busy = True
+
+        self._asr_executor.submit(self._run_transcription)
+
+    def _run_transcription(self) -> None:
+        """Transcribe queued utterances until none are waiting (ASR thread)."""
+        while True:
+            with self._asr_lock:
+                audio = self._pending_audio
+                self._pending_audio = None
+                if audio is None:
+                    self._asr_busy = False
+                    return
+
+            try:
+                self._transcribe_utterance(audio)
+            except Exception as e:
+                logger.error(f"Transcription failed: {e}", exc_info=True)
+                GLib.idle_add(self._update_state, "error")
+
+    def _transcribe_utterance(self, audio_array) -> None:
+        """Transcribe an utterance and dispatch the text (ASR thread).
 
         Args:
             audio_array: Audio samples as numpy array
         """
-        # Use streaming transcription if type-while-speaking is enabled
-        if self.config.typing.type_while_speaking and self.config.mode == "dictation":
-            final_text = ""
-            for partial_text, is_final in self.asr_engine.transcribe_streaming(
-                audio_array, self.config.audio.sample_rate
-            ):
-                # Update overlay with partial
-                GLib.idle_add(self.overlay.set_transcript, partial_text)
-
-                if is_final:
-                    final_text = partial_text
-                elif partial_text:
-                    # Type partial incrementally (delta from previous)
-                    self.text_output.insert_partial(partial_text)
-
-            if final_text:
-                logger.info(f"Transcribed: '{final_text}'")
-                # Finalize with corrections if needed
-                # (TextOutput tracks last_inserted_* internally)
-                self.text_output.finalize_partial(final_text)
+        # Short repeated commands can reuse an earlier transcription
+        text = self.asr_engine.transcribe(
+            audio_array,
+            self.config.audio.sample_rate,
+            use_cache=self.config.mode == "command"
+        )
 
-        else:
-            # Standard non-streaming transcription
-            text = self.asr_engine.transcribe(audio_array, self.config.audio.sample_rate)
+        if text:
+            logger.info("Transcribed: '%s'", text)
+
+            # Update overlay
+            self._post_transcript(text)
+
+            # Output based on mode
+            if self.config.mode == "dictation":
+                GLib.idle_add(self._output_dictation, text)
+            elif self.config.mode == "command":
+                GLib.idle_add(self._execute_command, text)
+
+    def _handle_partial_transcript(self, text: str) -> None:
+        """Handle text decoded while the user is still speaking.
 
-            if text:
-                logger.info(f"Transcribed: '{text}'")
+        Args:
+            text: Transcript of the utterance so far
+        """
+        self._post_transcript(text)
+        if self._type_partials:
+            # Type partial incrementally (delta from previous)
+            self.text_output.insert_partial(text)
 
-                # Update overlay
-                GLib.idle_add(self.overlay.set_transcript, text)
+    def _handle_final_transcript(self, text: str) -> None:
+        """Handle the final text of a streamed utterance.
 
-                # Output based on mode
-                if self.config.mode == "dictation":
-                    GLib.idle_add(self._output_dictation, text)
-                elif self.config.mode == "command":
-                    GLib.idle_add(self._execute_command, text)
+        Args:
+            text: Transcript of the whole utterance
+        """
+        if text:
+            logger.info("Transcribed: '%s'", text)
+            self._post_transcript(text)
+            # Finalize with corrections if needed
+            # (TextOutput tracks last_inserted_* internally)
+            self.text_output.finalize_partial(text)
+
+    def _post_transcript(self, text: str) -> None:
+        """Show text in the overlay, coalescing updates that arrive faster than the UI redraws.
+
+        Args:
+            text: Transcript to display
+        """
+        with self._transcript_lock:
+            self._pending_transcript = text
+            if self._transcript_flush_scheduled:
+                return
+            self._transcript_flush_scheduled = True
+
+        GLib.idle_add(self._flush_transcript)
+
+    def _flush_transcript(self) -> bool:
+        """Apply the most recent pending transcript to the overlay (main thread)."""
+        with self._transcript_lock:
+            text = self._pending_transcript
+            self._pending_transcript = None
+            self._transcript_flush_scheduled = False
+
+        if text is not None:
+            self.overlay.set_transcript(text)
+        return False
 
     def _output_dictation(self, text: str) -> None:
         """Output dictated text.
@@ -249,7 +377,7 @@ class WisprLiteApp:
         command = self.command_registry.match_command(text)
 
         if command:
-            logger.info(f"Executing command: {command}")
+            logger.info("Executing command: %s", command)
             success = self.command_registry.execute_command(command)
             if not success:
                 self.notification_manager.notify(
@@ -299,9 +427,13 @@ class WisprLiteApp:
             )
             GLib.idle_add(self.stop_listening)
 
-    def _on_model_consent_needed(self, model_size: str, consent_event: threading.Event, consent_result: list) -> None:
+    def _start_model_preload(self) -> None:
+        """Preload the ASR model on a background thread."""
+        threading.Thread(target=self.asr_engine.preload, name="asr-preload", daemon=True).start()
+
+    def _on_model_consent_needed(self, model_size: str, consent_future: Future) -> None:
         """Handle model download consent request."""
-        show_model_consent_dialog(model_size, consent_event, consent_result)
+        show_model_consent_dialog(model_size, consent_future)
 
     def _on_model_download_progress(self, model_size: str, progress: float) -> None:
         """Handle model download progress updates."""
@@ -377,7 +509,7 @@ class WisprLiteApp:
 
         self.tray.set_mode(self.config.mode)
         self.config.save()
-        logger.info(f"Mode changed to: {self.config.mode}")
+        logger.info("Mode changed to: %s", self.config.mode)
 
     def set_mode(self, mode: str) -> None:
         """Set the application mode.
@@ -389,7 +521,7 @@ class WisprLiteApp:
             self.config.mode = mode
             self.tray.set_mode(mode)
             self.config.save()
-            logger.info(f"Mode set to: {mode}")
+            logger.info("Mode set to: %s", mode)
 
     def toggle_mute(self) -> None:
         """Toggle microphone mute."""
@@ -428,7 +560,7 @@ class WisprLiteApp:
         logger.info("Opening preferences window")
         self.preferences.show_all()
         self.preferences.present()  # Bring window to front and give focus
-        logger.info(f"Preferences window shown, visible: {self.preferences.get_visible()}, realized: {self.preferences.get_realized()}")
+        logger.info("Preferences window shown, visible: %s, realized: %s", self.preferences.get_visible(), self.preferences.get_realized())
 
     def on_preferences_saved(self) -> None:
         """Handle preferences saved event."""
@@ -440,6 +572,9 @@ class WisprLiteApp:
         # Reload config from file
         self.config = Config.load()
 
+        # Notification flags were edited in place by the preferences window
+        self.notification_manager.refresh_severity_mask()
+
         # Update text_output config so smart_spacing and other settings take effect
         self.text_output.config = self.config.typing
 
@@ -448,8 +583,9 @@ class WisprLiteApp:
 
         # If model size changed, unload the old model so new one can be loaded
         if self.config.asr.model_size != old_model_size:
-            logger.info(f"Model size changed from {old_model_size} to {self.config.asr.model_size}, unloading old model")
+            logger.info("Model size changed from %s to %s, unloading old model", old_model_size, self.config.asr.model_size)
             self.asr_engine.unload()
+            self._start_model_preload()
 
         logger.info("Configuration reloaded - changes will take effect on next dictation")
 
@@ -517,7 +653,11 @@ class WisprLiteApp:
         # Restore accessibility settings
         self.accessibility_manager.restore()
 
-        # Unload ASR model
+        # Drop the waiting utterance and let a running transcription finish, so
+        # unloading can't pull the model out from under it (or trigger a reload)
+        with self._asr_lock:
+            self._pending_audio = None
+        self._asr_executor.shutdown(wait=True, cancel_futures=True)
         self.asr_engine.unload()
 
         # Close notifications
@@ -1,22 +1,37 @@
 """ASR engine interface and factory."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Iterator, Tuple
+from dataclasses import dataclass, field
+from typing import Optional, List
 import numpy as np
 
 from wispr_lite.config.schema import ASRConfig
 
 
+@dataclass
+class ChunkStream:
+    """Audio of one utterance fed to ASREngine.transcribe_chunk().
+
+    Owned by the caller, one per session, so a slow final decode can't touch
+    the next session's audio.
+    """
+
+    chunks: List[np.ndarray] = field(default_factory=list)
+    samples: int = 0
+    decoded_samples: int = 0
+
+
 class ASREngine(ABC):
     """Abstract base class for ASR backends."""
 
     @abstractmethod
-    def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
+    def transcribe(self, audio: np.ndarray, sample_rate: int, use_cache: bool = False) -> str:
         """Transcribe audio to text.
 
         Args:
-            audio: Audio data as numpy array
+            audio: Audio data as float32 numpy array scaled to [-1, 1]
             sample_rate: Sample rate in Hz
+            use_cache: Allow reusing the result for identical audio
 
         Returns:
             Transcribed text
@@ -24,20 +39,27 @@ class ASREngine(ABC):
         pass
 
     @abstractmethod
-    def transcribe_streaming(
-        self, audio: np.ndarray, sample_rate: int
-    ) -> Iterator[Tuple[str, bool]]:
-        """Transcribe audio with streaming partial results.
+    def transcribe_chunk(
+        self, stream: ChunkStream, audio_chunk: np.ndarray, sample_rate: int, is_last: bool = False
+    ) -> Optional[str]:
+        """Feed audio incrementally while the user is still speaking.
 
         Args:
-            audio: Audio data as numpy array
+            stream: State of the utterance being streamed (start each one with ChunkStream())
+            audio_chunk: New audio since the previous call (float32 in [-1, 1])
             sample_rate: Sample rate in Hz
+            is_last: True for the final chunk of the utterance
 
-        Yields:
-            Tuples of (text, is_final)
+        Returns:
+            Text for all audio so far when a decode ran, None if more audio is
+            needed first. Always returns text when is_last is True.
         """
         pass
 
+    def preload(self) -> None:
+        """Load the model ahead of first use (optional, no-op by default)."""
+        pass
+
     @abstractmethod
     def unload(self) -> None:
         """Unload the model to free resources."""
@@ -1,18 +1,134 @@
 """Faster-Whisper ASR backend using CTranslate2."""
 
+import hashlib
 import os
+import queue
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Iterator, Tuple, Callable
+from typing import Optional, Tuple, Callable, Dict, Any, FrozenSet, Set
 import numpy as np
 from faster_whisper import WhisperModel
 
 from wispr_lite.logging import get_logger
 from wispr_lite.config.schema import ASRConfig
-from wispr_lite.asr.engine import ASREngine
+from wispr_lite.asr.engine import ASREngine, ChunkStream
 
 logger = get_logger(__name__)
 
+# Number of recent transcriptions kept for repeated identical audio (command mode)
+TRANSCRIPT_CACHE_SIZE = 64
+
+# Minimum new audio between decodes of an utterance that is still being spoken
+STREAM_DECODE_INTERVAL_SEC = 1.0
+
+# Audio quieter than this (RMS, dB relative to full scale) is treated as silence
+MIN_SPEECH_DBFS = -40.0
+_MIN_SPEECH_RMS = 10.0 ** (MIN_SPEECH_DBFS / 20.0)
+
+# Utterances shorter than this decode greedily; beam search rarely changes their text
+SHORT_UTTERANCE_SEC = 2.0
+
+# /proc/cpuinfo flags for int8 dot-product instructions (x86 VNNI VPDPBUSD, ARM SDOT/UDOT)
+INT8_DOT_CPU_FLAGS = frozenset({"avx512_vnni", "avx_vnni", "asimddp"})
+
+
+@lru_cache(maxsize=1)
+def _cpu_int8_threads() -> int:
+    """Return the physical core count if the CPU has int8 dot-product instructions.
+
+    Returns:
+        Number of physical cores, or 0 if the CPU lacks int8 dot-product
+        support (or /proc/cpuinfo is unavailable)
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpuinfo = f.read()
+    except OSError:
+        return 0
+
+    flags = set()
+    cores = set()
+    physical_id = core_id = None
+    for line in cpuinfo.splitlines():
+        key, _, value = line.partition(":")
+        key = key.strip()
+        if key in ("flags", "Features"):
+            flags.update(value.split())
+        elif key == "physical id":
+            physical_id = value.strip()
+        elif key == "core id":
+            core_id = value.strip()
+            cores.add((physical_id, core_id))
+
+    if not flags & INT8_DOT_CPU_FLAGS:
+        return 0
+
+    # ARM cpuinfo has no core ids; assume no SMT there and 2-way SMT on x86 without topology info
+    if cores:
+        return len(cores)
+    logical = os.cpu_count() or 1
+    return logical if "asimddp" in flags else max(1, logical // 2)
+
+
+def _parse_cpu_list(text: str) -> Set[int]:
+    """Parse a sysfs CPU list such as "0-7,16"."""
+    cpus: Set[int] = set()
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+@lru_cache(maxsize=1)
+def _performance_cpus() -> FrozenSet[int]:
+    """Return the performance-core CPUs on hybrid processors.
+
+    Intel hybrid parts list P-cores in /sys/devices/cpu_core/cpus; on ARM
+    big.LITTLE the big cores have the highest cpu_capacity.
+
+    Returns:
+        Allowed CPUs on performance cores, or an empty set if the processor
+        isn't hybrid (or the topology can't be read)
+    """
+    try:
+        allowed = os.sched_getaffinity(0)
+        intel_p_cores = Path("/sys/devices/cpu_core/cpus")
+        if intel_p_cores.exists():
+            cpus = _parse_cpu_list(intel_p_cores.read_text())
+        else:
+            capacities = {
+                int(path.parent.name[3:]): int(path.read_text())
+                for path in Path("/sys/devices/system/cpu").glob("cpu[0-9]*/cpu_capacity")
+            }
+            if len(set(capacities.values())) < 2:
+                return frozenset()
+            top = max(capacities.values())
+            cpus = {cpu for cpu, capacity in capacities.items() if capacity == top}
+    except (AttributeError, OSError, ValueError):
+        return frozenset()
+
+    cpus &= allowed
+    # Nothing to gain if we may only run on performance cores anyway
+    if not cpus or cpus == allowed:
+        return frozenset()
+    return frozenset(cpus)
+
+
+def _physical_core_count(cpus: FrozenSet[int]) -> int:
+    """Count physical cores (SMT siblings counted once) among the given CPUs."""
+    cores = set()
+    for cpu in cpus:
+        try:
+            cores.add(Path(f"/sys/devices/system/cpu/cpu{cpu}/topology/core_cpus_list").read_text().strip())
+        except OSError:
+            cores.add(str(cpu))
+    return len(cores)
+
 
 class FasterWhisperBackend(ASREngine):
     """ASR backend using faster-whisper (CTranslate2)."""
@@ -26,179 +142,420 @@ class FasterWhisperBackend(ASREngine):
         self.config = config
         self.model: Optional[WhisperModel] = None
         self.model_loaded = False
+        self._device: Optional[str] = None  # Device the loaded model runs on
+        self._loaded_size: Optional[str] = None  # Model size of self.model
+        self._pinned = threading.local()  # Marks threads already pinned to performance cores
+
+        # Model sizes confirmed on disk; misses aren't cached so a finished download is seen
+        self._models_present: Set[str] = set()
+        self._load_lock = threading.Lock()
+
+        # LRU of audio digest -> text, used when callers opt in with use_cache
+        self._transcript_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+        # model.transcribe specialized for short/long audio, rebuilt when the
+        # model or decoding config changes (see _decoder())
+        self._decoder_key: Optional[Tuple] = None
+        self._transcribe_short: Optional[Callable] = None
+        self._transcribe_long: Optional[Callable] = None
 
         # Callbacks for consent and progress
-        self.on_consent_needed: Optional[Callable[[str, threading.Event, list], None]] = None
+        self.on_consent_needed: Optional[Callable[[str, Future], None]] = None
         self.on_download_progress: Optional[Callable[[str, float], None]] = None
 
+        # Progress callbacks run on their own thread so slow UI handlers can't stall loading
+        self._progress_queue: queue.Queue = queue.Queue()
+        self._progress_thread: Optional[threading.Thread] = None
+
         # Determine cache directory
         self.cache_dir = Path(
             os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
         ) / 'wispr-lite' / 'models'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"FasterWhisperBackend initialized: model={config.model_size}, device={config.device}")
+        logger.info("FasterWhisperBackend initialized: model=%s, device=%s", config.model_size, config.device)
 
-    def _model_exists(self) -> bool:
-        """Check if the model is already downloaded."""
-        model_path = self.cache_dir / f"models--Systran--faster-whisper-{self.config.model_size}"
+    def _model_exists(self, model_size: Optional[str] = None) -> bool:
+        """Check if the model is already downloaded.
+
+        A positive result is cached per model size; misses are re-checked on every call.
+
+        Args:
+            model_size: Model size to check (defaults to the configured one)
+        """
+        model_size = model_size or self.config.model_size
+        if model_size in self._models_present:
+            return True
+
+        present = self._model_exists_impl(model_size)
+        if present:
+            self._models_present.add(model_size)
+        return present
+
+    def _model_exists_impl(self, model_size: str) -> bool:
+        """Check the cache directory for the model files."""
+        model_path = self.cache_dir / f"models--Systran--faster-whisper-{model_size}"
         # Also check alternate naming
-        alt_path = self.cache_dir / self.config.model_size
+        alt_path = self.cache_dir / model_size
         return model_path.exists() or alt_path.exists()
 
+    def _has_model(self, model_size: str) -> bool:
+        """Whether the loaded model is the given size."""
+        return self.model_loaded and self._loaded_size == model_size
+
+    def _report_progress(self, model_size: str, progress: float) -> None:
+        """Queue a download progress update for the callback thread.
+
+        Args:
+            model_size: Model size being downloaded
+            progress: Progress value (0.0-1.0, or -1.0 for error)
+        """
+        if not self.on_download_progress:
+            return
+
+        if self._progress_thread is None:
+            self._progress_thread = threading.Thread(target=self._drain_progress, daemon=True)
+            self._progress_thread.start()
+
+        self._progress_queue.put((model_size, progress))
+
+    def _drain_progress(self) -> None:
+        """Deliver queued progress updates to on_download_progress in order."""
+        while True:
+            model_size, progress = self._progress_queue.get()
+            try:
+                if self.on_download_progress:
+                    self.on_download_progress(model_size, progress)
+            except Exception as e:
+                logger.error(f"Download progress callback failed: {e}")
+            finally:
+                self._progress_queue.task_done()
+
+    def flush_progress(self) -> None:
+        """Block until all queued progress updates have been delivered."""
+        self._progress_queue.join()
+
     def _load_model(self) -> None:
-        """Load the Whisper model lazily."""
-        if self.model_loaded:
+        """Load the Whisper model lazily (safe to call from several threads).
+
+        The config is read once, so a model size changed in preferences while
+        loading is picked up by the next call instead of being mixed into this one.
+        """
+        if self._has_model(self.config.model_size):
+            return
+
+        with self._load_lock:
+            config = self.config
+            model_size = config.model_size
+            if self._has_model(model_size):  # Loaded by another thread while we waited
+                return
+            # A load that finished after the model size changed left the old model behind
+            self.unload()
+
+            try:
+                # Check if model needs to be downloaded
+                needs_download = not self._model_exists(model_size)
+
+                if needs_download:
+                    logger.info("Model %s not found locally, download required", model_size)
+
+                    # Request consent; the callback resolves the future with the user's answer
+                    if self.on_consent_needed:
+                        consent_future: Future = Future()
+                        self.on_consent_needed(model_size, consent_future)
+
+                        if not consent_future.result():  # Block until the user responds
+                            logger.warning("Model download consent denied by user")
+                            raise RuntimeError(
+                                f"Model '{model_size}' not available locally. "
+                                "Please run 'scripts/preload_models.sh' to download models offline, "
+                                "or grant download permission when prompted."
+                            )
+
+                    # Notify download start
+                    self._report_progress(model_size, 0.0)
+
+                logger.info("Loading faster-whisper model: %s", model_size)
+
+                # Determine device and compute type
+                device = config.device
+                if device == "auto":
+                    try:
+                        import torch
+                        device = "cuda" if torch.cuda.is_available() else "cpu"
+                    except ImportError:
+                        device = "cpu"
+
+                compute_type = config.compute_type
+                if compute_type == "auto":
+                    compute_type = "int8_float16" if device == "cuda" else "int8"
+
+                # int8 on CPUs with VNNI/dotprod runs CTranslate2's int8 GEMM at
+                # several times fp32 throughput; one thread per physical core avoids SMT contention
+                model_kwargs: Dict[str, Any] = {}
+                if device == "cpu" and compute_type == "int8":
+                    cpu_threads = _cpu_int8_threads()
+                    if cpu_threads:
+                        model_kwargs.update(cpu_threads=cpu_threads, num_workers=1)
+                        logger.info("CPU has int8 dot-product support, using %s threads", cpu_threads)
+
+                # On hybrid CPUs keep inference on the performance cores; pin before
+                # loading so CTranslate2's worker threads inherit the affinity
+                perf_cpus = _performance_cpus() if device == "cpu" else frozenset()
+                if perf_cpus:
+                    self._pin_current_thread(perf_cpus)
+                    model_kwargs["cpu_threads"] = _physical_core_count(perf_cpus)
+                    logger.info("Hybrid CPU: pinning ASR to performance cores %s", sorted(perf_cpus))
+
+                logger.info("Using device=%s, compute_type=%s", device, compute_type)
+
+                self.model = WhisperModel(
+                    model_size,
+                    device=device,
+                    compute_type=compute_type,
+                    download_root=str(self.cache_dir),
+                    **model_kwargs,
+                )
+
+                # Notify download complete (if it was downloading)
+                if needs_download:
+                    self._report_progress(model_size, 1.0)
+
+                self.model_loaded = True
+                self._loaded_size = model_size
+                self._models_present.add(model_size)
+                self._device = device
+                logger.info("Model loaded successfully")
+
+            except Exception as e:
+                logger.error(f"Failed to load model: {e}")
+                # Notify download failed
+                self._report_progress(model_size, -1.0)
+                raise
+
+    def preload(self) -> None:
+        """Load and warm up the model ahead of the first utterance.
+
+        Only runs when the model is already on disk, so startup never prompts
+        for a download; otherwise loading stays lazy.
+        """
+        model_size = self.config.model_size
+        if self._has_model(model_size):
+            return
+
+        if not self._model_exists(model_size):
+            logger.info("Model %s not downloaded yet, skipping preload", model_size)
             return
 
         try:
-            # Check if model needs to be downloaded
-            needs_download = not self._model_exists()
-
-            if needs_download:
-                logger.info(f"Model {self.config.model_size} not found locally, download required")
-
-                # Request consent using threading.Event
-                if self.on_consent_needed:
-                    consent_event = threading.Event()
-                    consent_result = [False]  # Use a list to pass by reference
-                    self.on_consent_needed(self.config.model_size, consent_event, consent_result)
-                    consent_event.wait()  # Block until the user responds
-
-                    if not consent_result[0]:
-                        logger.warning("Model download consent denied by user")
-                        raise RuntimeError(
-                            f"Model '{self.config.model_size}' not available locally. "
-                            "Please run 'scripts/preload_models.sh' to download models offline, "
-                            "or grant download permission when prompted."
-                        )
-
-                # Notify download start
-                if self.on_download_progress:
-                    self.on_download_progress(self.config.model_size, 0.0)
+            self._load_model()
 
-            logger.info(f"Loading faster-whisper model: {self.config.model_size}")
+            # One short pass initializes CTranslate2 kernels/allocations before real audio arrives
+            segments, _ = self.model.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                language=self.config.language or "en",
+                beam_size=1,
+                vad_filter=False,
+            )
+            for _ in segments:
+                pass
+            logger.info("Model preloaded and warmed up")
 
-            # Determine device and compute type
-            device = self.config.device
-            if device == "auto":
-                try:
-                    import torch
-                    device = "cuda" if torch.cuda.is_available() else "cpu"
-                except ImportError:
-                    device = "cpu"
+        except Exception as e:
+            logger.warning(f"Model preload failed, will load on first use: {e}")
 
-            compute_type = self.config.compute_type
-            if compute_type == "auto":
-                compute_type = "int8_float16" if device == "cuda" else "int8"
+    def _pin_current_thread(self, cpus: FrozenSet[int]) -> None:
+        """Restrict the calling thread to the given CPUs (once per thread).
+
+        Args:
+            cpus: CPUs to run on
+        """
+        if getattr(self._pinned, "cpus", None) == cpus:
+            return
+        try:
+            os.sched_setaffinity(0, cpus)
+            self._pinned.cpus = cpus
+        except OSError as e:
+            logger.debug("Could not pin ASR thread to performance cores: %s", e)
 
-            logger.info(f"Using device={device}, compute_type={compute_type}")
+    def _decoder(self, n_samples: int, sample_rate: int) -> Callable:
+        """Return model.transcribe with decoding options bound for this audio length.
 
-            self.model = WhisperModel(
-                self.config.model_size,
-                device=device,
-                compute_type=compute_type,
-                download_root=str(self.cache_dir),
+        Args:
+            n_samples: Number of audio samples to decode
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Partial of model.transcribe taking the audio (and optional overrides)
+        """
+        if self._device == "cpu":
+            perf_cpus = _performance_cpus()
+            if perf_cpus:
+                self._pin_current_thread(perf_cpus)
+
+        key = (id(self.model), self.config.language, self.config.beam_size, self.config.best_of)
+        if key != self._decoder_key:
+            common = dict(language=self.config.language, vad_filter=False)  # We handle VAD separately
+            self._transcribe_long = partial(
+                self.model.transcribe,
+                beam_size=self.config.beam_size,
+                best_of=self.config.best_of,
+                **common,
+            )
+            self._transcribe_short = partial(
+                self.model.transcribe,
+                beam_size=1,
+                best_of=1,
+                without_timestamps=True,
+                **common,
             )
+            self._decoder_key = key
 
-            # Notify download complete (if it was downloading)
-            if needs_download and self.on_download_progress:
-                self.on_download_progress(self.config.model_size, 1.0)
+        if n_samples < SHORT_UTTERANCE_SEC * sample_rate:
+            return self._transcribe_short
+        return self._transcribe_long
 
-            self.model_loaded = True
-            logger.info("Model loaded successfully")
+    @staticmethod
+    def _prepare_audio(audio: np.ndarray) -> np.ndarray:
+        """Return audio as contiguous float32 in [-1, 1], without copying if it already is.
 
-        except Exception as e:
-            logger.error(f"Failed to load model: {e}")
-            # Notify download failed
-            if self.on_download_progress:
-                self.on_download_progress(self.config.model_size, -1.0)
-            raise
+        Args:
+            audio: Audio samples (float32, or raw int16 PCM)
+
+        Returns:
+            Array ready for the model
+        """
+        # Callers deliver contiguous float32 already scaled to [-1, 1]
+        if audio.dtype == np.float32 and audio.flags.c_contiguous:
+            return audio
 
-    def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
+        if audio.dtype == np.int16:
+            # Only raw int16 PCM needs scaling; scale the fresh copy in place
+            prepared = audio.astype(np.float32)
+            prepared *= 1.0 / 32768.0
+            return prepared
+
+        return np.ascontiguousarray(audio, dtype=np.float32)
+
+    @staticmethod
+    def _is_silent(audio: np.ndarray) -> bool:
+        """Check whether prepared audio is too quiet to contain speech.
+
+        Args:
+            audio: Contiguous float32 audio in [-1, 1]
+
+        Returns:
+            True if the RMS level is below MIN_SPEECH_DBFS
+        """
+        if not audio.size:
+            return True
+        # One pass, no squared temporary; compare RMS directly instead of taking a log
+        return float(np.sqrt(np.dot(audio, audio) / audio.size)) < _MIN_SPEECH_RMS
+
+    def _drop_decoders(self) -> None:
+        """Release the partials (they hold a reference to the model)."""
+        self._decoder_key = None
+        self._transcribe_short = None
+        self._transcribe_long = None
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int, use_cache: bool = False) -> str:
         """Transcribe audio to text.
 
         Args:
-            audio: Audio data as numpy array (float32)
+            audio: Audio data as numpy array (float32 in [-1, 1])
             sample_rate: Sample rate in Hz
+            use_cache: Reuse the result for byte-identical audio (short command utterances)
 
         Returns:
             Transcribed text
         """
-        self._load_model()
+        # Don't load or run the model on silence/noise
+        audio = self._prepare_audio(audio)
+        if self._is_silent(audio):
+            logger.debug("Audio below silence threshold, skipping transcription")
+            return ""
 
-        try:
-            # Ensure audio is float32
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
+        self._load_model()
 
-            # Normalize if needed
-            if np.max(np.abs(audio)) > 1.0:
-                audio = audio / 32768.0
+        cache_key = None
+        if use_cache:
+            digest = hashlib.blake2b(audio.tobytes(), digest_size=16)
+            digest.update(sample_rate.to_bytes(4, 'little'))
+            # Decoding options change with the config (same fields as the _decoder() key)
+            digest.update(repr((self.config.language, self.config.beam_size, self.config.best_of)).encode())
+            cache_key = digest.digest()
+            cached = self._transcript_cache.get(cache_key)
+            if cached is not None:
+                self._transcript_cache.move_to_end(cache_key)
+                logger.debug("Transcript cache hit")
+                return cached
 
-            segments, info = self.model.transcribe(
-                audio,
-                language=self.config.language,
-                beam_size=self.config.beam_size,
-                best_of=self.config.best_of,
-                vad_filter=False,  # We handle VAD separately
-            )
+        try:
+            segments, info = self._decoder(audio.size, sample_rate)(audio)
 
             # Combine all segments
             text = " ".join(segment.text.strip() for segment in segments)
 
-            logger.debug(f"Transcribed: '{text}' (language: {info.language})")
-            return text.strip()
+            logger.debug("Transcribed: '%s' (language: %s)", text, info.language)
+            text = text.strip()
+
+            if cache_key is not None:
+                self._transcript_cache[cache_key] = text
+                if len(self._transcript_cache) > TRANSCRIPT_CACHE_SIZE:
+                    self._transcript_cache.popitem(last=False)
+
+            return text
 
         except Exception as e:
             logger.error(f"Transcription error: {e}")
             return ""
 
-    def transcribe_streaming(
-        self, audio: np.ndarray, sample_rate: int
-    ) -> Iterator[Tuple[str, bool]]:
-        """Transcribe audio with streaming partial results.
+    def transcribe_chunk(
+        self, stream: ChunkStream, audio_chunk: np.ndarray, sample_rate: int, is_last: bool = False
+    ) -> Optional[str]:
+        """Feed audio incrementally and re-decode the utterance about once per second.
 
         Args:
-            audio: Audio data as numpy array (float32)
+            stream: State of the utterance being streamed
+            audio_chunk: New audio since the previous call (float32 in [-1, 1])
             sample_rate: Sample rate in Hz
+            is_last: True for the final chunk of the utterance
 
-        Yields:
-            Tuples of (text, is_final)
+        Returns:
+            Text for all audio so far when a decode ran, None if more audio is
+            needed first. Always returns text when is_last is True.
         """
         self._load_model()
 
+        if audio_chunk.size:
+            stream.chunks.append(self._prepare_audio(audio_chunk))
+            stream.samples += audio_chunk.size
+
+        pending = stream.samples - stream.decoded_samples
+        if not is_last and pending < STREAM_DECODE_INTERVAL_SEC * sample_rate:
+            return None
+
         try:
-            # Ensure audio is float32
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
+            if not stream.chunks:
+                return ""
 
-            # Normalize if needed
-            if np.max(np.abs(audio)) > 1.0:
-                audio = audio / 32768.0
+            # Keep the accumulated utterance as one contiguous array
+            if len(stream.chunks) > 1:
+                stream.chunks = [np.concatenate(stream.chunks)]
+            audio = stream.chunks[0]
 
-            segments, info = self.model.transcribe(
+            segments, _ = self._decoder(audio.size, sample_rate)(
                 audio,
-                language=self.config.language,
-                beam_size=self.config.beam_size,
-                best_of=self.config.best_of,
-                vad_filter=False,
+                without_timestamps=True,
+                condition_on_previous_text=False,
             )
-
-            # Yield each segment as it's processed
-            texts = []
-            for segment in segments:
-                texts.append(segment.text.strip())
-                current_text = " ".join(texts)
-                yield (current_text, False)  # Partial result
-
-            # Final result
-            final_text = " ".join(texts).strip()
-            yield (final_text, True)
+            text = " ".join(segment.text.strip() for segment in segments).strip()
+            stream.decoded_samples = stream.samples
+            return text
 
         except Exception as e:
-            logger.error(f"Streaming transcription error: {e}")
-            yield ("", True)
+            logger.error(f"Chunked transcription error: {e}")
+            return "" if is_last else None
 
     def unload(self) -> None:
         """Unload the model to free resources."""
@@ -207,10 +564,31 @@ class FasterWhisperBackend(ASREngine):
             del self.model
             self.model = None
             self.model_loaded = False
+            self._loaded_size = None
+            self._transcript_cache.clear()
+            self._drop_decoders()
 
-            # Force garbage collection
-            import gc
-            gc.collect()
+            # CTranslate2 frees the model in its destructor; only hand cached
+            # CUDA blocks back to the driver (no full-heap gc.collect())
+            if self._device == "cuda":
+                try:
+                    import torch
+                    torch.cuda.empty_cache()
+                    torch.cuda.ipc_collect()
+                except ImportError:
+                    pass
+            self._device = None
+
+    def reset(self) -> None:
+        """Drop the loaded model, cached model check, and callbacks so the instance can be reused."""
+        self.on_consent_needed = None
+        self.on_download_progress = None
+        self.model = None
+        self.model_loaded = False
+        self._loaded_size = None
+        self._models_present.clear()
+        self._transcript_cache.clear()
+        self._drop_decoders()
 
     def get_model_path(self) -> Path:
         """Get the path where the model is cached.
@@ -1,41 +1,59 @@
 """Audio capture using sounddevice (PortAudio).
 
-Captures audio in fixed-size frames and feeds them to a queue for VAD and ASR processing.
+Captures audio in fixed-size frames and feeds them to a lock-free ring for VAD and ASR processing.
 """
 
-import queue
 import threading
-from typing import Optional, Callable, List
+from typing import TYPE_CHECKING, Optional, Callable, List
 import numpy as np
-import sounddevice as sd
 
 from wispr_lite.logging import get_logger
 from wispr_lite.config.schema import AudioConfig
+from wispr_lite.audio.ring import FrameRing
+
+if TYPE_CHECKING:
+    import sounddevice
 
 logger = get_logger(__name__)
 
+# Audio buffered between the capture callback and the pipeline before frames are dropped
+RING_BUFFER_SEC = 10
+
+# Backlog handed to the pipeline after a stall; older frames are dropped so latency stays bounded
+MAX_BACKLOG_MS = 2000
+
 
 class AudioCapture:
     """Manages audio input from the microphone."""
 
-    def __init__(self, config: AudioConfig):
+    def __init__(self, config: AudioConfig, frame_duration_ms: Optional[int] = None):
         """Initialize audio capture.
 
         Args:
             config: Audio configuration
+            frame_duration_ms: Frame length override (defaults to config.frame_duration_ms)
         """
+        # Imported here rather than at module load: loading PortAudio probes the
+        # audio backends, which CLI invocations that never capture shouldn't pay for
+        import sounddevice as sd
+        self._sd = sd
+
         self.config = config
         self.sample_rate = config.sample_rate
         self.channels = config.channels
-        self.frame_duration_ms = config.frame_duration_ms
+        self.frame_duration_ms = frame_duration_ms or config.frame_duration_ms
         self.frame_size = int(self.sample_rate * self.frame_duration_ms / 1000)
 
-        self.audio_queue: queue.Queue = queue.Queue()
-        self.stream: Optional[sd.InputStream] = None
+        self.ring = FrameRing(
+            capacity=RING_BUFFER_SEC * 1000 // self.frame_duration_ms,
+            frame_size=self.frame_size,
+            max_pending=MAX_BACKLOG_MS // self.frame_duration_ms,
+        )
+        self.stream: Optional["sounddevice.InputStream"] = None
         self.is_recording = False
         self._lock = threading.Lock()
 
-        logger.info(f"AudioCapture initialized: {self.sample_rate}Hz, {self.channels}ch, {self.frame_duration_ms}ms frames")
+        logger.info("AudioCapture initialized: %sHz, %sch, %sms frames", self.sample_rate, self.channels, self.frame_duration_ms)
 
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
         """Callback for sounddevice stream.
@@ -50,12 +68,12 @@ class AudioCapture:
             logger.warning(f"Audio callback status: {status}")
 
         if self.is_recording:
-            # Convert to int16 and queue
-            audio_data = (indata[:, 0] * 32767).astype(np.int16).tobytes()
-            try:
-                self.audio_queue.put_nowait(audio_data)
-            except queue.Full:
-                logger.warning("Audio queue full, dropping frame")
+            if frames != self.frame_size:
+                logger.warning(f"Unexpected block size {frames}, dropping frame")
+                return
+            # Real-time thread: copy the int16 samples into the ring, no locks or allocation
+            if not self.ring.push(indata[:, 0]):
+                logger.warning("Audio ring full, dropping frame")
 
     def start(self) -> None:
         """Start audio capture."""
@@ -65,15 +83,18 @@ class AudioCapture:
                 return
 
             try:
-                device = self.config.device or sd.default.device[0]
-                logger.info(f"Starting audio capture on device: {device}")
+                device = self.config.device or self._sd.default.device[0]
+                logger.info("Starting audio capture on device: %s", device)
+                # Frames the previous session's reader left behind
+                self.ring.clear()
+                self.ring.resume()
 
-                self.stream = sd.InputStream(
+                self.stream = self._sd.InputStream(
                     device=device,
                     channels=self.channels,
                     samplerate=self.sample_rate,
                     blocksize=self.frame_size,
-                    dtype=np.float32,
+                    dtype='int16',  # Native 16-bit PCM for the VAD; no float round-trip per frame
                     callback=self._audio_callback
                 )
                 self.stream.start()
@@ -101,34 +122,45 @@ class AudioCapture:
                 except Exception as e:
                     logger.error(f"Error stopping audio stream: {e}")
 
-            # Clear the queue
-            while not self.audio_queue.empty():
-                try:
-                    self.audio_queue.get_nowait()
-                except queue.Empty:
-                    break
+            # Wake a reader blocked in get_frame(s); frames already captured stay
+            # readable so the end of the utterance isn't lost
+            self.ring.interrupt()
 
-    def get_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
-        """Get an audio frame from the queue.
+    def get_frame(self, timeout: Optional[float] = None) -> Optional[memoryview]:
+        """Get the next audio frame.
+
+        The returned view is only valid until the next get_frame() call.
 
         Args:
             timeout: Timeout in seconds, None for blocking
 
         Returns:
-            Audio frame as bytes, or None if timeout
+            Audio frame as a bytes view (16-bit PCM), or None if timeout
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        return self.ring.pop(timeout=timeout)
+
+    def get_frames(self, max_frames: int, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Get a block of consecutive audio frames.
+
+        The returned array is only valid until the next get_frame()/get_frames() call.
+
+        Args:
+            max_frames: Maximum number of frames to return
+            timeout: Seconds to wait for max_frames to accumulate, None for blocking
+
+        Returns:
+            int16 array of shape (n_frames, frame_size), or None if timeout
+        """
+        return self.ring.pop_many(max_frames, timeout=timeout)
+
+    @property
+    def dropped_frames(self) -> int:
+        """Frames skipped because the consumer fell more than MAX_BACKLOG_MS behind."""
+        return self.ring.dropped
 
     def clear_queue(self) -> None:
         """Clear all pending audio frames."""
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.ring.clear()
 
     @staticmethod
     def list_devices() -> List[dict]:
@@ -137,6 +169,7 @@ class AudioCapture:
         Returns:
             List of device info dictionaries
         """
+        import sounddevice as sd
         devices = sd.query_devices()
         input_devices = []
 
@@ -0,0 +1,162 @@
+"""Single-producer/single-consumer frame ring for audio capture.
+
+The PortAudio callback runs on a real-time thread, so handing frames to the
+pipeline must not take locks or allocate. Frames are copied into a
+preallocated int16 array; the producer only advances ``_head`` and the
+consumer only advances ``_tail`` (plain int stores, atomic under the GIL).
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+
+class FrameRing:
+    """Fixed-capacity ring of equally sized int16 audio frames."""
+
+    def __init__(
+        self,
+        capacity: int,
+        frame_size: int,
+        poll_interval: float = 0.005,
+        max_pending: Optional[int] = None,
+    ):
+        """Initialize the ring.
+
+        Args:
+            capacity: Maximum number of frames held before new frames are dropped
+            frame_size: Samples per frame
+            poll_interval: Consumer sleep between checks while waiting for a frame
+            max_pending: Backlog kept for the consumer; older frames are skipped
+                on pop so a stalled reader resumes on fresh audio (None = no limit)
+        """
+        self.capacity = capacity
+        self.frame_size = frame_size
+        self.poll_interval = poll_interval
+        self.max_pending = max_pending
+        self.buffer = np.zeros((capacity, frame_size), dtype=np.int16)
+        # Frames the consumer skipped to stay within max_pending
+        self.dropped = 0
+
+        # Total frames written (producer) / released (consumer); slot = index % capacity
+        self._head = 0
+        self._tail = 0
+        # The consumer's current frames are released on its next pop so the
+        # producer can't overwrite a view that is still being read
+        self._holding = 0
+        # Set by interrupt() so a waiting consumer returns without the full timeout
+        self._interrupted = False
+
+    def push(self, samples: np.ndarray) -> bool:
+        """Copy one frame into the ring (producer side, never blocks).
+
+        Args:
+            samples: frame_size int16 samples
+
+        Returns:
+            False if the ring was full and the frame was dropped
+        """
+        head = self._head
+        if head - self._tail >= self.capacity:
+            return False
+        np.copyto(self.buffer[head % self.capacity], samples, casting="unsafe")
+        self._head = head + 1
+        return True
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[memoryview]:
+        """Return the next frame as a byte view (consumer side).
+
+        The view stays valid until the next call to pop() or clear().
+
+        Args:
+            timeout: Seconds to wait for a frame, None to wait indefinitely
+
+        Returns:
+            Frame bytes, or None if no frame arrived before the timeout
+        """
+        self._release()
+        if not self._wait(1, timeout):
+            return None
+
+        self._holding = 1
+        return memoryview(self.buffer[self._tail % self.capacity]).cast('B')
+
+    def pop_many(self, max_frames: int, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Return up to max_frames pending frames as one (n, frame_size) block (consumer side).
+
+        Waits until max_frames are pending or the timeout passes, then returns
+        whatever is available. The block is a view into the ring (no copy), so it
+        may hold fewer frames where the ring wraps around. It stays valid until
+        the next call to pop(), pop_many() or clear().
+
+        Args:
+            max_frames: Largest number of frames to return
+            timeout: Seconds to wait for max_frames, None to wait indefinitely
+
+        Returns:
+            int16 array of shape (n, frame_size) with n >= 1, or None if no frame arrived
+        """
+        self._release()
+        self._wait(min(max_frames, self.capacity), timeout)
+
+        pending = self._head - self._tail
+        if not pending:
+            return None
+
+        start = self._tail % self.capacity
+        n = min(pending, max_frames, self.capacity - start)
+        self._holding = n
+        return self.buffer[start:start + n]
+
+    def _release(self) -> None:
+        """Free the slots handed out by the previous pop and skip stale backlog."""
+        self._tail += self._holding
+        self._holding = 0
+
+        # Drop oldest-first: only the consumer moves _tail, so skipping here
+        # needs no coordination with the real-time producer
+        if self.max_pending is not None:
+            backlog = self._head - self._tail
+            if backlog > self.max_pending:
+                self._tail += backlog - self.max_pending
+                self.dropped += backlog - self.max_pending
+
+    def _wait(self, n_frames: int, timeout: Optional[float]) -> bool:
+        """Sleep until n_frames are pending or the timeout passes.
+
+        Returns:
+            True if n_frames are pending
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._head - self._tail < n_frames:
+            if self._interrupted:
+                return False
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(self.poll_interval, remaining))
+            else:
+                time.sleep(self.poll_interval)
+        return True
+
+    def interrupt(self) -> None:
+        """Make current and future waits return at once (e.g. when capture stops).
+
+        pop()/pop_many() still return frames that are already pending.
+        """
+        self._interrupted = True
+
+    def resume(self) -> None:
+        """Let pop()/pop_many() wait for frames again after interrupt()."""
+        self._interrupted = False
+
+    def clear(self) -> None:
+        """Drop all pending frames (consumer side)."""
+        self._tail = self._head
+        self._holding = 0
+
+    def __len__(self) -> int:
+        """Number of frames waiting to be read."""
+        return self._head - self._tail - self._holding
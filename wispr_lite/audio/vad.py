@@ -1,15 +1,199 @@
-"""Voice Activity Detection using webrtcvad with energy-based fallback."""
+"""Voice Activity Detection using webrtcvad or Silero with energy-based fallback."""
 
-import struct
-import math
-from typing import Optional
-import webrtcvad
+from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
 
 from wispr_lite.logging import get_logger
 from wispr_lite.config.schema import AudioConfig
 
 logger = get_logger(__name__)
 
+# Silero v5 takes fixed 512-sample windows (32 ms at 16 kHz) plus 64 samples of context
+SILERO_SAMPLE_RATE = 16000
+SILERO_WINDOW_SAMPLES = 512
+SILERO_CONTEXT_SAMPLES = 64
+SILERO_FRAME_MS = SILERO_WINDOW_SAMPLES * 1000 // SILERO_SAMPLE_RATE
+SILERO_THRESHOLD = 0.5
+
+# Frames below this fraction of the energy threshold are silence without asking webrtcvad
+SILENCE_ENERGY_RATIO = 0.5
+
+
+def _silence_batch(
+    speech_flags: np.ndarray, max_silence_frames: int, silence_frame_count: int
+) -> Tuple[np.ndarray, int]:
+    """Run silence accounting over a batch of per-frame speech flags.
+
+    Args:
+        speech_flags: Boolean array, True where a frame contains speech
+        max_silence_frames: Consecutive silent frames that trigger a timeout
+        silence_frame_count: Silent frames counted before this batch
+
+    Returns:
+        Tuple of (per-frame timeout flags, silent frame count after the batch)
+    """
+    timeouts = np.zeros(speech_flags.size, dtype=np.bool_)
+    count = silence_frame_count
+    for i in range(speech_flags.size):
+        if speech_flags[i]:
+            count = 0
+        else:
+            count += 1
+        timeouts[i] = count >= max_silence_frames
+    return timeouts, count
+
+
+def _silence_batch_numpy(
+    speech_flags: np.ndarray, max_silence_frames: int, silence_frame_count: int
+) -> Tuple[np.ndarray, int]:
+    """Vectorized _silence_batch (fallback without Numba); same arguments and result."""
+    n = speech_flags.size
+    if not n:
+        return np.zeros(0, dtype=np.bool_), silence_frame_count
+
+    # Silent run length after each frame: distance to the latest speech frame,
+    # or the carried-over count plus the frames so far if there was none yet
+    index = np.arange(n)
+    last_speech = np.maximum.accumulate(np.where(speech_flags, index, -1))
+    counts = np.where(last_speech >= 0, index - last_speech, silence_frame_count + index + 1)
+    return counts >= max_silence_frames, int(counts[-1])
+
+
+def _frame_rms(samples: np.ndarray) -> float:
+    """Compute the RMS of int16 samples in one pass, without a float copy.
+
+    Args:
+        samples: 16-bit PCM samples
+
+    Returns:
+        RMS in int16 units
+    """
+    # Exact integer sum of squares; int64 can't overflow for any realistic frame
+    acc = 0
+    for i in range(samples.size):
+        x = np.int64(samples[i])
+        acc += x * x
+    return np.sqrt(acc / samples.size)
+
+
+if NUMBA_AVAILABLE:
+    _silence_batch = numba.njit(cache=True)(_silence_batch)
+    _frame_rms = numba.njit(cache=True, fastmath=True)(_frame_rms)
+else:
+    _silence_batch = _silence_batch_numpy  # noqa: F811
+
+    def _frame_rms(samples: np.ndarray) -> float:  # noqa: F811
+        """Compute the RMS of int16 samples (vectorized fallback without Numba)."""
+        # Integer dot product: int16 squares fit easily in an int64 accumulator
+        widened = samples.astype(np.int64)
+        return np.sqrt(int(np.dot(widened, widened)) / widened.size)
+
+
+def _default_silero_model_path() -> Optional[Path]:
+    """Find the Silero ONNX model bundled with faster-whisper, if any."""
+    try:
+        from faster_whisper.utils import get_assets_path
+    except ImportError:
+        return None
+
+    candidates = sorted(Path(get_assets_path()).glob("silero_vad*.onnx"))
+    return candidates[-1] if candidates else None
+
+
+class SileroVAD:
+    """Streaming Silero VAD (v5 window layout) on onnxruntime.
+
+    Accepts both the upstream v5 export (single ``state`` tensor of shape
+    (2, 1, 128) plus ``sr``) and the faster-whisper export, which splits the
+    state into ``h`` and ``c``.
+    """
+
+    def __init__(self, model_path: Path):
+        """Load the ONNX model.
+
+        Args:
+            model_path: Path to a Silero VAD ONNX model
+
+        Raises:
+            ValueError: If the model does not take 512-sample windows with context
+        """
+        opts = onnxruntime.SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = 1
+        opts.log_severity_level = 4
+        self.session = onnxruntime.InferenceSession(
+            str(model_path), providers=["CPUExecutionProvider"], sess_options=opts
+        )
+
+        inputs = {i.name: i for i in self.session.get_inputs()}
+        if "state" in inputs:
+            self._state_names = ("state",)
+        elif "h" in inputs and "c" in inputs:
+            self._state_names = ("h", "c")
+        else:
+            raise ValueError(f"Unsupported Silero model inputs: {sorted(inputs)}")
+
+        width = inputs["input"].shape[-1]
+        if isinstance(width, int) and width != SILERO_CONTEXT_SAMPLES + SILERO_WINDOW_SAMPLES:
+            raise ValueError(f"Unsupported Silero window size: {width}")
+
+        self._state_shapes = [
+            tuple(d if isinstance(d, int) else 1 for d in inputs[name].shape)
+            for name in self._state_names
+        ]
+        self._feeds = {}
+        if "sr" in inputs:
+            self._feeds["sr"] = np.array(SILERO_SAMPLE_RATE, dtype=np.int64)
+
+        # Context samples followed by the current window, reused across calls
+        self._window = np.zeros(
+            (1, SILERO_CONTEXT_SAMPLES + SILERO_WINDOW_SAMPLES), dtype=np.float32
+        )
+        self._feeds["input"] = self._window
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear recurrent state and context between utterances."""
+        for name, shape in zip(self._state_names, self._state_shapes):
+            self._feeds[name] = np.zeros(shape, dtype=np.float32)
+        self._window[:] = 0.0
+
+    def speech_prob(self, frame: bytes) -> float:
+        """Return the speech probability of one 512-sample int16 frame.
+
+        Args:
+            frame: Raw audio frame (16-bit PCM, 512 samples)
+
+        Returns:
+            Probability in [0, 1]
+        """
+        window = self._window[0]
+        # Slide the previous window's tail into the context slot, then scale the new samples in place
+        window[:SILERO_CONTEXT_SAMPLES] = window[-SILERO_CONTEXT_SAMPLES:]
+        np.multiply(
+            np.frombuffer(frame, dtype=np.int16), 1.0 / 32768.0,
+            out=window[SILERO_CONTEXT_SAMPLES:], casting="unsafe"
+        )
+
+        outputs = self.session.run(None, self._feeds)
+        for name, value in zip(self._state_names, outputs[1:]):
+            self._feeds[name] = value
+
+        return float(np.ravel(outputs[0])[0])
+
 
 class VAD:
     """Voice Activity Detector with webrtcvad and energy fallback."""
@@ -25,14 +209,58 @@ class VAD:
         self.vad_mode = config.vad_mode
         self.frame_duration_ms = config.frame_duration_ms
 
-        # Initialize webrtcvad
+        # Initialize webrtcvad (imported lazily so the CLI path never loads it)
+        import webrtcvad
         self.vad = webrtcvad.Vad(self.vad_mode)
 
+        # Silero replaces webrtcvad when requested and usable; frames become 32 ms
+        self.silero: Optional[SileroVAD] = None
+        if config.vad_backend == "silero":
+            self.silero = self._load_silero(config)
+            if self.silero:
+                self.frame_duration_ms = SILERO_FRAME_MS
+
         # Energy-based fallback parameters
         self.energy_threshold = 500  # Adjustable threshold
         self.use_energy_fallback = True
 
-        logger.info(f"VAD initialized: mode={self.vad_mode}, energy_fallback={self.use_energy_fallback}")
+        # Bytes per frame (16-bit samples), checked on every frame
+        self.frame_bytes = int(self.sample_rate * self.frame_duration_ms / 1000) * 2
+
+        backend = "silero" if self.silero else "webrtc"
+        logger.info("VAD initialized: backend=%s, mode=%s, energy_fallback=%s", backend, self.vad_mode, self.use_energy_fallback)
+
+    def _load_silero(self, config: AudioConfig) -> Optional[SileroVAD]:
+        """Load the Silero model, or return None to keep using webrtcvad.
+
+        Args:
+            config: Audio configuration
+
+        Returns:
+            SileroVAD instance, or None if Silero can't be used
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            logger.warning("Silero VAD requires onnxruntime; falling back to webrtcvad")
+            return None
+        if self.sample_rate != SILERO_SAMPLE_RATE:
+            logger.warning(f"Silero VAD requires {SILERO_SAMPLE_RATE}Hz audio; falling back to webrtcvad")
+            return None
+
+        model_path = Path(config.silero_model_path).expanduser() if config.silero_model_path else _default_silero_model_path()
+        if not model_path or not model_path.exists():
+            logger.warning("Silero VAD model not found; falling back to webrtcvad")
+            return None
+
+        try:
+            return SileroVAD(model_path)
+        except Exception as e:
+            logger.warning(f"Failed to load Silero VAD from {model_path}: {e}; falling back to webrtcvad")
+            return None
+
+    def reset(self) -> None:
+        """Clear detector state between utterances."""
+        if self.silero:
+            self.silero.reset()
 
     def is_speech(self, frame: bytes) -> bool:
         """Determine if the audio frame contains speech.
@@ -44,24 +272,24 @@ class VAD:
             True if speech is detected, False otherwise
         """
         # Validate frame size
-        expected_size = int(self.sample_rate * self.frame_duration_ms / 1000) * 2  # 2 bytes per sample
-        if len(frame) != expected_size:
-            logger.warning(f"Invalid frame size: {len(frame)} (expected {expected_size})")
+        if len(frame) != self.frame_bytes:
+            logger.warning(f"Invalid frame size: {len(frame)} (expected {self.frame_bytes})")
             return False
 
         try:
-            # Try webrtcvad first
-            is_speech_webrtc = self.vad.is_speech(frame, self.sample_rate)
+            if self.silero:
+                return self.silero.speech_prob(frame) >= SILERO_THRESHOLD
 
-            # If using energy fallback, combine with energy detection
+            # If using energy fallback, combine with energy detection. Energy is
+            # cheap, so it decides clear-cut frames without calling webrtcvad
             if self.use_energy_fallback:
                 energy = self._calculate_energy(frame)
-                is_speech_energy = energy > self.energy_threshold
+                if energy > self.energy_threshold:
+                    return True
+                if energy < self.energy_threshold * SILENCE_ENERGY_RATIO:
+                    return False
 
-                # Return True if either detector says speech
-                return is_speech_webrtc or is_speech_energy
-
-            return is_speech_webrtc
+            return self.vad.is_speech(frame, self.sample_rate)
 
         except Exception as e:
             logger.error(f"VAD error: {e}")
@@ -71,6 +299,43 @@ class VAD:
                 return energy > self.energy_threshold
             return False
 
+    def is_speech_batch(self, frames: np.ndarray) -> np.ndarray:
+        """Classify a block of consecutive frames.
+
+        Energies for the whole block come from one vectorized pass; webrtcvad
+        (or Silero) is only called for the rows energy can't decide.
+
+        Args:
+            frames: int16 array of shape (n_frames, samples_per_frame)
+
+        Returns:
+            Boolean array, True where a frame contains speech
+        """
+        n_frames = frames.shape[0]
+        if frames.shape[1] * 2 != self.frame_bytes:
+            logger.warning(f"Invalid frame size: {frames.shape[1] * 2} (expected {self.frame_bytes})")
+            return np.zeros(n_frames, dtype=np.bool_)
+
+        if self.silero or not self.use_energy_fallback:
+            # No energy pre-pass to share (Silero also carries state across windows)
+            return np.array(
+                [self.is_speech(memoryview(row).cast('B')) for row in frames], dtype=np.bool_
+            )
+
+        widened = frames.astype(np.int64)
+        energies = np.sqrt(np.einsum('ij,ij->i', widened, widened) / frames.shape[1])
+
+        flags = energies > self.energy_threshold
+        ambiguous = np.flatnonzero(~flags & (energies >= self.energy_threshold * SILENCE_ENERGY_RATIO))
+        for i in ambiguous:
+            try:
+                # webrtcvad takes len() as a byte count, so pass bytes, not the int16 row
+                flags[i] = self.vad.is_speech(memoryview(frames[i]).cast('B'), self.sample_rate)
+            except Exception as e:
+                logger.error(f"VAD error: {e}")
+                # Energy alone already says "not above threshold"
+        return flags
+
     def _calculate_energy(self, frame: bytes) -> float:
         """Calculate the energy (RMS) of an audio frame.
 
@@ -80,14 +345,9 @@ class VAD:
         Returns:
             Energy level
         """
-        # Convert bytes to list of 16-bit integers
-        samples = struct.unpack(f"{len(frame) // 2}h", frame)
-
-        # Calculate RMS
-        sum_squares = sum(sample ** 2 for sample in samples)
-        rms = math.sqrt(sum_squares / len(samples))
-
-        return rms
+        # View bytes as 16-bit samples; the kernel accumulates squares in int64
+        samples = np.frombuffer(frame, dtype=np.int16)
+        return float(_frame_rms(samples))
 
     def set_energy_threshold(self, threshold: float) -> None:
         """Set the energy threshold for fallback detection.
@@ -96,7 +356,7 @@ class VAD:
             threshold: Energy threshold
         """
         self.energy_threshold = threshold
-        logger.info(f"Energy threshold set to {threshold}")
+        logger.info("Energy threshold set to %s", threshold)
 
     def calibrate(self, silence_frames: list) -> None:
         """Calibrate the energy threshold based on silence samples.
@@ -114,7 +374,7 @@ class VAD:
 
         # Set threshold above the max silence energy
         self.energy_threshold = max_energy * 2.0
-        logger.info(f"Calibrated energy threshold to {self.energy_threshold} (avg silence: {avg_energy}, max: {max_energy})")
+        logger.info("Calibrated energy threshold to %s (avg silence: %s, max: %s)", self.energy_threshold, avg_energy, max_energy)
 
 
 class SilenceDetector:
@@ -148,6 +408,40 @@ class SilenceDetector:
             self.silence_frame_count += 1
             return self.silence_frame_count >= self.max_silence_frames
 
+    def update_many(self, n_frames: int, is_speech: bool) -> bool:
+        """Update silence detection state for a run of identical frames.
+
+        Args:
+            n_frames: Number of consecutive frames
+            is_speech: Whether these frames contain speech
+
+        Returns:
+            True if silence timeout reached, False otherwise
+        """
+        if is_speech:
+            self.silence_frame_count = 0
+            return False
+        else:
+            self.silence_frame_count += n_frames
+            return self.silence_frame_count >= self.max_silence_frames
+
+    def update_batch(self, speech_flags: np.ndarray) -> np.ndarray:
+        """Update silence detection state for a batch of frames (e.g. offline audio).
+
+        Uses a Numba-compiled kernel when numba is installed.
+
+        Args:
+            speech_flags: Boolean array, True where a frame contains speech
+
+        Returns:
+            Boolean array, True for each frame at which the silence timeout is reached
+        """
+        flags = np.ascontiguousarray(speech_flags, dtype=np.bool_)
+        timeouts, self.silence_frame_count = _silence_batch(
+            flags, self.max_silence_frames, self.silence_frame_count
+        )
+        return timeouts
+
     def reset(self) -> None:
         """Reset the silence counter."""
         self.silence_frame_count = 0
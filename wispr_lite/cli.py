@@ -11,9 +11,55 @@ from wispr_lite.logging import get_logger
 logger = get_logger(__name__)
 
 
+# Daemon well-known name and object path (see wispr_lite.integration.dbus)
+BUS_NAME = 'org.wispr_lite.Daemon'
+OBJECT_PATH = '/org/wispr_lite/Daemon'
+
+# Milliseconds to wait for the daemon to acknowledge a command
+DBUS_CALL_TIMEOUT_MS = 5000
+
+
 def send_dbus_command(method: str, *args) -> int:
     """Send a command to running daemon via D-Bus.
 
+    Uses a direct GDBus call when PyGObject is available and falls back to
+    dbus-python otherwise.
+
+    Args:
+        method: D-Bus method name
+        *args: Method arguments (strings)
+
+    Returns:
+        Exit code (0 on success)
+    """
+    try:
+        from gi.repository import Gio, GLib
+    except ImportError:
+        return _send_dbus_python_command(method, *args)
+
+    try:
+        bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        params = GLib.Variant(f"({'s' * len(args)})", tuple(str(a) for a in args)) if args else None
+        bus.call_sync(
+            BUS_NAME, OBJECT_PATH, BUS_NAME, method, params,
+            None, Gio.DBusCallFlags.NONE, DBUS_CALL_TIMEOUT_MS, None
+        )
+        return 0
+
+    except GLib.Error as e:
+        if "org.freedesktop.DBus.Error.ServiceUnknown" in str(e):
+            logger.error("Wispr-Lite daemon not running. Start the application first.")
+        else:
+            logger.error(f"D-Bus error: {e}")
+        return 1
+    except Exception as e:
+        logger.error(f"Failed to send command: {e}")
+        return 1
+
+
+def _send_dbus_python_command(method: str, *args) -> int:
+    """Send a command through dbus-python (fallback without PyGObject).
+
     Args:
         method: D-Bus method name
         *args: Method arguments
@@ -24,13 +70,16 @@ def send_dbus_command(method: str, *args) -> int:
     try:
         import dbus
         bus = dbus.SessionBus()
-        proxy = bus.get_object('org.wispr_lite.Daemon', '/org/wispr_lite/Daemon')
-        interface = dbus.Interface(proxy, 'org.wispr_lite.Daemon')
+        proxy = bus.get_object(BUS_NAME, OBJECT_PATH)
+        interface = dbus.Interface(proxy, BUS_NAME)
 
         method_func = getattr(interface, method)
         method_func(*args)
         return 0
 
+    except ImportError as e:
+        logger.error(f"Failed to send command: {e}")
+        return 1
     except dbus.exceptions.DBusException as e:
         if "org.freedesktop.DBus.Error.ServiceUnknown" in str(e):
             logger.error("Wispr-Lite daemon not running. Start the application first.")
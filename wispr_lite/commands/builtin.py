@@ -1,5 +1,9 @@
 """Built-in commands for command mode."""
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from wispr_lite.logging import get_logger
 
 logger = get_logger(__name__)
@@ -30,10 +34,14 @@ DEFAULT_COMMANDS = {
 }
 
 
-def get_default_commands() -> dict:
+@lru_cache(maxsize=1)
+def get_default_commands() -> Mapping[str, Any]:
     """Get the default built-in commands.
 
+    The same read-only view is returned on every call; use
+    ``dict(get_default_commands())`` for a mutable copy.
+
     Returns:
-        Dictionary of default commands
+        Read-only mapping of default commands
     """
-    return DEFAULT_COMMANDS.copy()
+    return MappingProxyType(DEFAULT_COMMANDS)
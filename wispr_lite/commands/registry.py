@@ -3,14 +3,36 @@
 Matches transcribed text to configured actions.
 """
 
+import string
 from typing import Dict, Any, Optional
 import subprocess
 
+try:
+    from gi.repository import Gio
+    GIO_AVAILABLE = True
+except ImportError:
+    GIO_AVAILABLE = False
+
 from wispr_lite.logging import get_logger
 from wispr_lite.config.schema import CommandConfig
 
 logger = get_logger(__name__)
 
+# Trie key holding the command that ends at a node (never produced by _trie_word())
+_COMMAND_KEY = ""
+
+
+def _trie_word(word: str) -> str:
+    """Normalize a word for the command trie ("Terminal." -> "terminal").
+
+    Args:
+        word: One whitespace-separated word of a command name or transcript
+
+    Returns:
+        Casefolded word without surrounding punctuation (empty for punctuation only)
+    """
+    return word.strip(string.punctuation).casefold()
+
 
 class CommandRegistry:
     """Registry for command mode actions."""
@@ -24,7 +46,20 @@ class CommandRegistry:
         self.config = config
         self.commands = config.commands or {}
 
-        logger.info(f"CommandRegistry initialized with {len(self.commands)} commands")
+        # Lowercased prefix and names for exact matches (transcripts are compared lowercased)
+        self._prefix_lower = (config.prefix or "").lower()
+        self._commands_lower = {name.lower(): cmd for name, cmd in self.commands.items()}
+
+        # Word-level prefix trie of command names; matching walks the transcript's
+        # words once, independent of how many commands are configured
+        self._trie: Dict[str, Any] = {}
+        for cmd_name, cmd_config in self.commands.items():
+            node = self._trie
+            for word in filter(None, map(_trie_word, cmd_name.split())):
+                node = node.setdefault(word, {})
+            node[_COMMAND_KEY] = cmd_config
+
+        logger.info("CommandRegistry initialized with %d commands", len(self.commands))
 
     def match_command(self, text: str) -> Optional[Dict[str, Any]]:
         """Match transcribed text to a command.
@@ -38,24 +73,38 @@ class CommandRegistry:
         text_lower = text.lower().strip()
 
         # Remove prefix if present
-        if self.config.prefix and text_lower.startswith(self.config.prefix.lower()):
-            text_lower = text_lower[len(self.config.prefix):].strip()
+        if self._prefix_lower and text_lower.startswith(self._prefix_lower):
+            text_lower = text_lower[len(self._prefix_lower):].strip()
 
         # Exact match
-        if text_lower in self.commands:
-            return self.commands[text_lower]
-
-        # Fuzzy match (starts with)
-        for cmd_name, cmd_config in self.commands.items():
-            if text_lower.startswith(cmd_name.lower()):
-                # Extract query if URL action
-                if cmd_config.get('action') == 'url' and '{query}' in cmd_config.get('target', ''):
-                    query = text_lower[len(cmd_name):].strip()
-                    cmd_config = cmd_config.copy()
-                    cmd_config['query'] = query
-                return cmd_config
-
-        return None
+        command = self._commands_lower.get(text_lower)
+        if command is not None:
+            return command
+
+        # Fuzzy match (starts with): longest command that prefixes the text word
+        # by word, ignoring the punctuation Whisper adds ("Open terminal.")
+        words = text_lower.split()
+        node = self._trie
+        match = None
+        for depth, word in enumerate(words, 1):
+            key = _trie_word(word)
+            if not key:
+                continue
+            node = node.get(key)
+            if node is None:
+                break
+            if _COMMAND_KEY in node:
+                match = (depth, node[_COMMAND_KEY])
+
+        if match is None:
+            return None
+
+        depth, cmd_config = match
+        # Extract query if URL action
+        if cmd_config.get('action') == 'url' and '{query}' in cmd_config.get('target', ''):
+            cmd_config = cmd_config.copy()
+            cmd_config['query'] = " ".join(words[depth:])
+        return cmd_config
 
     def execute_command(self, command: Dict[str, Any]) -> bool:
         """Execute a command.
@@ -98,7 +147,15 @@ class CommandRegistry:
         Returns:
             True if successful
         """
-        logger.info(f"Launching app: {app}")
+        logger.info("Launching app: %s", app)
+
+        # Launch installed applications from their .desktop entry in-process
+        if GIO_AVAILABLE:
+            desktop_id = app if app.endswith('.desktop') else f"{app}.desktop"
+            app_info = Gio.DesktopAppInfo.new(desktop_id)
+            if app_info is not None:
+                return app_info.launch([], None)
+
         subprocess.Popen([app], start_new_session=True)
         return True
 
@@ -113,7 +170,12 @@ class CommandRegistry:
             True if successful
         """
         url = url_template.replace('{query}', query)
-        logger.info(f"Opening URL: {url}")
+        logger.info("Opening URL: %s", url)
+
+        # Hand the URI to the default handler directly instead of forking xdg-open
+        if GIO_AVAILABLE:
+            return Gio.AppInfo.launch_default_for_uri(url, None)
+
         subprocess.Popen(['xdg-open', url], start_new_session=True)
         return True
 
@@ -139,7 +201,7 @@ class CommandRegistry:
                 logger.info("Shell command cancelled by user")
                 return False
 
-        logger.info(f"Running shell command: {command}")
+        logger.info("Running shell command: %s", command)
 
         # Parse command into args to avoid shell=True
         import shlex
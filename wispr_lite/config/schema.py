@@ -1,16 +1,64 @@
 """Configuration schema for Wispr-Lite using dataclasses."""
 
+import copy
 import os
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, FrozenSet, Tuple
 import yaml
 
+try:
+    # libyaml-backed loader/dumper are several times faster than the pure-Python ones
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 from wispr_lite.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+# Modifier names accepted in hotkey strings, mapped to their canonical name
+HOTKEY_MODIFIERS = {
+    'ctrl': 'ctrl',
+    'control': 'ctrl',
+    'shift': 'shift',
+    'alt': 'alt',
+    'super': 'super',
+    'win': 'super',
+    'cmd': 'super',
+}
+
+
+@dataclass(frozen=True)
+class ParsedHotkey:
+    """A hotkey string split into canonical modifiers and a main key."""
+    mods: FrozenSet[str]
+    key: str = ""  # empty for modifier-only hotkeys such as "ctrl+super"
+
+
+@lru_cache(maxsize=64)
+def parse_hotkey(hotkey_str: str) -> ParsedHotkey:
+    """Parse a hotkey string such as "ctrl+shift+space".
+
+    Args:
+        hotkey_str: Hotkey string
+
+    Returns:
+        Parsed hotkey (cached per distinct string)
+    """
+    mods = set()
+    key = ""
+    for part in hotkey_str.lower().split('+'):
+        part = part.strip()
+        if part in HOTKEY_MODIFIERS:
+            mods.add(HOTKEY_MODIFIERS[part])
+        elif part:
+            key = part
+    return ParsedHotkey(frozenset(mods), key)
+
+
 @dataclass
 class HotkeyConfig:
     """Hotkey configuration."""
@@ -19,6 +67,16 @@ class HotkeyConfig:
     command_mode: str = ""
     undo_last: str = "ctrl+shift+z"
 
+    @property
+    def parsed(self) -> Dict[str, ParsedHotkey]:
+        """Parsed form of each hotkey, keyed by field name."""
+        return {
+            'push_to_talk': parse_hotkey(self.push_to_talk),
+            'toggle': parse_hotkey(self.toggle),
+            'command_mode': parse_hotkey(self.command_mode),
+            'undo_last': parse_hotkey(self.undo_last),
+        }
+
 
 @dataclass
 class AudioConfig:
@@ -28,6 +86,8 @@ class AudioConfig:
     channels: int = 1
     frame_duration_ms: int = 20
     vad_mode: int = 3  # webrtcvad aggressiveness (0-3)
+    vad_backend: str = "webrtc"  # webrtc or silero (32 ms frames, needs onnxruntime)
+    silero_model_path: Optional[str] = None  # None = model bundled with faster-whisper
     vad_silence_timeout_ms: int = 3000
 
 
@@ -86,6 +146,33 @@ class CommandConfig:
     commands: Dict[str, Any] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=4)
+def _config_path(config_home: str) -> Path:
+    """Create the config directory once per location and return the config file path."""
+    config_dir = Path(config_home) / 'wispr-lite'
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir / 'config.yaml'
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Return the dataclass field names of a config section."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _section_to_dict(section: Any) -> Dict[str, Any]:
+    """Convert a config section to a dict.
+
+    Sections hold scalars and plain containers, so one level of getattr plus a
+    copy of containers replaces asdict()'s recursive reflection.
+    """
+    data = {}
+    for name in _field_names(type(section)):
+        value = getattr(section, name)
+        data[name] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+    return data
+
+
 @dataclass
 class Config:
     """Main configuration."""
@@ -104,9 +191,7 @@ class Config:
     @classmethod
     def get_config_path(cls) -> Path:
         """Get the config file path."""
-        config_dir = Path(os.environ.get('XDG_CONFIG_HOME', Path.home() / '.config')) / 'wispr-lite'
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / 'config.yaml'
+        return _config_path(os.environ.get('XDG_CONFIG_HOME', str(Path.home() / '.config')))
 
     @classmethod
     def load(cls) -> 'Config':
@@ -114,14 +199,14 @@ class Config:
         config_path = cls.get_config_path()
 
         if not config_path.exists():
-            logger.info(f"Config not found at {config_path}, creating default")
+            logger.info("Config not found at %s, creating default", config_path)
             config = cls()
             config.save()
             return config
 
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YamlLoader) or {}
 
             # Nested dataclass deserialization
             hotkeys = HotkeyConfig(**data.get('hotkeys', {}))
@@ -145,7 +230,10 @@ class Config:
                 log_level=data.get('log_level', 'INFO')
             )
 
-            logger.info(f"Loaded config from {config_path}")
+            # Remember what's on disk so an unchanged save can be skipped
+            config._saved_data = config.to_dict()
+
+            logger.info("Loaded config from %s", config_path)
             return config
 
         except Exception as e:
@@ -157,13 +245,22 @@ class Config:
         config_path = self.get_config_path()
 
         try:
-            data = asdict(self)
+            data = self.to_dict()
+            if data == getattr(self, '_saved_data', None) and config_path.exists():
+                logger.debug("Config unchanged, not rewriting")
+                return
+
             with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            logger.info(f"Saved config to {config_path}")
+                yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            self._saved_data = data
+            logger.info("Saved config to %s", config_path)
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
-        return asdict(self)
+        data = {}
+        for name in _field_names(Config):
+            value = getattr(self, name)
+            data[name] = _section_to_dict(value) if is_dataclass(value) else value
+        return data
@@ -6,10 +6,19 @@ Manages system accessibility features that may interfere with wispr-lite.
 import subprocess
 from typing import Optional
 
+try:
+    from gi.repository import Gio
+    GIO_AVAILABLE = True
+except ImportError:
+    GIO_AVAILABLE = False
+
 from wispr_lite.logging import get_logger
 
 logger = get_logger(__name__)
 
+KEYBOARD_A11Y_SCHEMA = 'org.cinnamon.desktop.a11y.keyboard'
+BOUNCE_KEYS_KEY = 'bouncekeys-enable'
+
 
 class AccessibilityManager:
     """Manages accessibility settings for wispr-lite compatibility."""
@@ -18,6 +27,26 @@ class AccessibilityManager:
         """Initialize accessibility manager."""
         self.bounce_keys_original_state: Optional[bool] = None
         self.bounce_keys_managed = False
+        self._settings = self._open_settings()
+
+    def _open_settings(self) -> Optional["Gio.Settings"]:
+        """Open the keyboard accessibility settings in-process via GIO.
+
+        Returns:
+            Gio.Settings, or None if GIO or the Cinnamon schema is unavailable
+            (callers then fall back to the gsettings CLI)
+        """
+        if not GIO_AVAILABLE:
+            return None
+        try:
+            # Gio.Settings.new() aborts the process on an unknown schema, so look it up first
+            source = Gio.SettingsSchemaSource.get_default()
+            if source is None or source.lookup(KEYBOARD_A11Y_SCHEMA, True) is None:
+                return None
+            return Gio.Settings.new(KEYBOARD_A11Y_SCHEMA)
+        except Exception as e:
+            logger.debug("Could not open %s settings: %s", KEYBOARD_A11Y_SCHEMA, e)
+            return None
 
     def _get_bounce_keys_state(self) -> Optional[bool]:
         """Get current Bounce Keys state.
@@ -25,9 +54,12 @@ class AccessibilityManager:
         Returns:
             True if enabled, False if disabled, None if unable to determine
         """
+        if self._settings is not None:
+            return self._settings.get_boolean(BOUNCE_KEYS_KEY)
+
         try:
             result = subprocess.run(
-                ['gsettings', 'get', 'org.cinnamon.desktop.a11y.keyboard', 'bouncekeys-enable'],
+                ['gsettings', 'get', KEYBOARD_A11Y_SCHEMA, BOUNCE_KEYS_KEY],
                 capture_output=True,
                 text=True,
                 timeout=2
@@ -36,7 +68,7 @@ class AccessibilityManager:
                 value = result.stdout.strip().lower()
                 return value == 'true'
         except Exception as e:
-            logger.debug(f"Could not get Bounce Keys state: {e}")
+            logger.debug("Could not get Bounce Keys state: %s", e)
         return None
 
     def _set_bounce_keys_state(self, enabled: bool) -> bool:
@@ -48,10 +80,17 @@ class AccessibilityManager:
         Returns:
             True if successful
         """
+        if self._settings is not None:
+            if not self._settings.set_boolean(BOUNCE_KEYS_KEY, enabled):
+                return False
+            # Writes go to dconf asynchronously; flush so a restore on exit isn't lost
+            Gio.Settings.sync()
+            return True
+
         try:
             value = 'true' if enabled else 'false'
             result = subprocess.run(
-                ['gsettings', 'set', 'org.cinnamon.desktop.a11y.keyboard', 'bouncekeys-enable', value],
+                ['gsettings', 'set', KEYBOARD_A11Y_SCHEMA, BOUNCE_KEYS_KEY, value],
                 capture_output=True,
                 text=True,
                 timeout=2
@@ -3,48 +3,53 @@
 Provides Cinnamon-specific functionality.
 """
 
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
 from wispr_lite.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+# The session environment doesn't change while the daemon runs, so detection is done once
+@lru_cache(maxsize=1)
 def is_cinnamon() -> bool:
     """Check if running on Cinnamon desktop.
 
     Returns:
         True if Cinnamon is detected
     """
-    import os
     desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
     return 'cinnamon' in desktop or desktop == 'x-cinnamon'
 
 
+@lru_cache(maxsize=1)
 def is_wayland() -> bool:
     """Check if running on Wayland session.
 
     Returns:
         True if Wayland is detected
     """
-    import os
     session_type = os.environ.get('XDG_SESSION_TYPE', '').lower()
     wayland_display = os.environ.get('WAYLAND_DISPLAY', '')
     return session_type == 'wayland' or bool(wayland_display)
 
 
-def get_desktop_info() -> dict:
+@lru_cache(maxsize=1)
+def get_desktop_info() -> Mapping[str, object]:
     """Get desktop environment information.
 
     Returns:
-        Dictionary with desktop info
+        Read-only mapping with desktop info (shared between callers)
     """
-    import os
-
-    return {
+    return MappingProxyType({
         'current_desktop': os.environ.get('XDG_CURRENT_DESKTOP', 'unknown'),
         'session_type': os.environ.get('XDG_SESSION_TYPE', 'unknown'),
         'is_cinnamon': is_cinnamon(),
         'is_wayland': is_wayland(),
-    }
+    })
 
 
 def get_wayland_limitations() -> list:
@@ -9,6 +9,7 @@ try:
     import dbus
     import dbus.service
     from dbus.mainloop.glib import DBusGMainLoop
+    from gi.repository import GLib
     DBUS_AVAILABLE = True
 except ImportError:
     DBUS_AVAILABLE = False
@@ -22,6 +23,23 @@ BUS_NAME = "org.wispr_lite.Daemon"
 OBJECT_PATH = "/org/wispr_lite/Daemon"
 
 
+def _run_once(callback: Callable, *args) -> bool:
+    """Run a deferred callback; returning False removes the idle source."""
+    callback(*args)
+    return False
+
+
+def _dispatch(callback: Optional[Callable], *args) -> None:
+    """Queue a callback on the main loop so the D-Bus reply goes out first.
+
+    Args:
+        callback: App callback, or None if not connected
+        *args: Arguments for the callback
+    """
+    if callback:
+        GLib.idle_add(_run_once, callback, *args)
+
+
 if DBUS_AVAILABLE:
     class WisprLiteDBusService(dbus.service.Object):
         """D-Bus service for Wispr-Lite."""
@@ -52,20 +70,17 @@ if DBUS_AVAILABLE:
         @dbus.service.method(BUS_NAME, in_signature='', out_signature='')
         def Toggle(self):
             """Toggle listening state."""
-            if self.on_toggle:
-                self.on_toggle()
+            _dispatch(self.on_toggle)
 
         @dbus.service.method(BUS_NAME, in_signature='', out_signature='')
         def Start(self):
             """Start listening."""
-            if self.on_start:
-                self.on_start()
+            _dispatch(self.on_start)
 
         @dbus.service.method(BUS_NAME, in_signature='', out_signature='')
         def Stop(self):
             """Stop listening."""
-            if self.on_stop:
-                self.on_stop()
+            _dispatch(self.on_stop)
 
         @dbus.service.method(BUS_NAME, in_signature='s', out_signature='')
         def SetMode(self, mode: str):
@@ -74,20 +89,17 @@ if DBUS_AVAILABLE:
             Args:
                 mode: Mode to set (dictation or command)
             """
-            if self.on_set_mode:
-                self.on_set_mode(mode)
+            _dispatch(self.on_set_mode, str(mode))
 
         @dbus.service.method(BUS_NAME, in_signature='', out_signature='')
         def OpenPreferences(self):
             """Open preferences window."""
-            if self.on_open_preferences:
-                self.on_open_preferences()
+            _dispatch(self.on_open_preferences)
 
         @dbus.service.method(BUS_NAME, in_signature='', out_signature='')
         def Undo(self):
             """Undo last dictation."""
-            if self.on_undo:
-                self.on_undo()
+            _dispatch(self.on_undo)
 
         @dbus.service.signal(BUS_NAME, signature='s')
         def StateChanged(self, state: str):
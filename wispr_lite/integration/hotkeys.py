@@ -5,14 +5,66 @@ Provides cross-platform hotkey support for push-to-talk and toggle modes.
 
 import threading
 import time
-from typing import Optional, Callable, Set
+from functools import lru_cache
+from typing import Optional, Callable, Dict, FrozenSet, Set, Tuple
 from pynput import keyboard
 
+try:
+    from gi.repository import GLib
+    GLIB_AVAILABLE = True
+except ImportError:
+    GLIB_AVAILABLE = False
+
 from wispr_lite.logging import get_logger
-from wispr_lite.config.schema import HotkeyConfig
+from wispr_lite.config.schema import HotkeyConfig, ParsedHotkey, parse_hotkey
 
 logger = get_logger(__name__)
 
+# Left/right (and Super/Command) variants map to the key hotkeys are expressed in
+MODIFIER_VARIANTS = {
+    keyboard.Key.ctrl_l: keyboard.Key.ctrl_l,
+    keyboard.Key.ctrl_r: keyboard.Key.ctrl_l,
+    keyboard.Key.shift_l: keyboard.Key.shift_l,
+    keyboard.Key.shift_r: keyboard.Key.shift_l,
+    keyboard.Key.alt_l: keyboard.Key.alt_l,
+    keyboard.Key.alt_r: keyboard.Key.alt_l,
+    keyboard.Key.cmd: keyboard.Key.cmd,
+    keyboard.Key.cmd_l: keyboard.Key.cmd,
+    keyboard.Key.cmd_r: keyboard.Key.cmd,
+}
+
+# Canonical modifier names (see config.schema.HOTKEY_MODIFIERS) to the keys matched against
+MODIFIER_KEYS = {
+    'ctrl': keyboard.Key.ctrl_l,
+    'shift': keyboard.Key.shift_l,
+    'alt': keyboard.Key.alt_l,
+    'super': keyboard.Key.cmd,
+}
+
+
+@lru_cache(maxsize=64)
+def hotkey_to_keys(hotkey: ParsedHotkey) -> FrozenSet[keyboard.Key]:
+    """Convert a parsed hotkey into the set of keys that must be held.
+
+    Args:
+        hotkey: Parsed hotkey
+
+    Returns:
+        Frozen set of keyboard.Key/KeyCode objects (cached per distinct hotkey)
+    """
+    keys = {MODIFIER_KEYS[mod] for mod in hotkey.mods if mod in MODIFIER_KEYS}
+
+    if hotkey.key == 'space':
+        keys.add(keyboard.Key.space)
+    elif len(hotkey.key) == 1:
+        # Single character
+        try:
+            keys.add(keyboard.KeyCode.from_char(hotkey.key))
+        except Exception as e:
+            logger.warning(f"Failed to parse key '{hotkey.key}': {e}")
+
+    return frozenset(keys)
+
 
 class HotkeyManager:
     """Manages global hotkey registration and callbacks."""
@@ -26,11 +78,18 @@ class HotkeyManager:
         self.config = config
         self.listener: Optional[keyboard.Listener] = None
         self.currently_pressed: Set[keyboard.Key] = set()
+        # Normalized view of currently_pressed, kept up to date on each event; the
+        # count covers both variants of a modifier being held at once
+        self._normalized_pressed: Dict[keyboard.Key, int] = {}
+        # Held hotkey keys as a bitmask (see _key_bit)
+        self._pressed_mask = 0
 
         # Conflict detection
         self.on_conflict_detected: Optional[Callable[[str], None]] = None
         self.hotkey_test_passed = False
         self.conflict_warning_shown = False
+        # Pending one-shot conflict check (GLib source id, or Timer without GLib)
+        self._conflict_check = None
 
         # Watchdog for listener health monitoring
         self.last_event_time = time.time()
@@ -45,83 +104,93 @@ class HotkeyManager:
         self.on_toggle: Optional[Callable] = None
         self.on_undo: Optional[Callable] = None
 
-        # Parse hotkey strings to key combinations
-        self.ptt_keys = self._parse_hotkey(config.push_to_talk)
-        self.toggle_keys = self._parse_hotkey(config.toggle)
-        self.undo_keys = self._parse_hotkey(config.undo_last) if config.undo_last else set()
+        # Convert pre-parsed hotkeys to key combinations
+        parsed = config.parsed
+        self.ptt_keys = hotkey_to_keys(parsed['push_to_talk'])
+        self.toggle_keys = hotkey_to_keys(parsed['toggle'])
+        self.undo_keys = hotkey_to_keys(parsed['undo_last'])
+
+        # One bit per key used by any hotkey; a hotkey matches when all its bits are held
+        self._key_bit: Dict[keyboard.Key, int] = {}
+        for key in self.ptt_keys | self.toggle_keys | self.undo_keys:
+            self._key_bit[key] = 1 << len(self._key_bit)
+        self._ptt_mask = self._keys_to_mask(self.ptt_keys)
+        self._toggle_mask = self._keys_to_mask(self.toggle_keys)
+        self._undo_mask = self._keys_to_mask(self.undo_keys)
+
+        # Configured hotkeys only, most specific combination first, so holding
+        # ctrl+shift+super isn't taken for ctrl+super
+        self._press_handlers: Tuple[Tuple[int, Callable[[], None]], ...] = tuple(sorted(
+            (
+                (mask, handler)
+                for mask, handler in (
+                    (self._ptt_mask, self._handle_ptt_press),
+                    (self._toggle_mask, self._handle_toggle),
+                    (self._undo_mask, self._handle_undo),
+                )
+                if mask
+            ),
+            key=lambda handler: -handler[0].bit_count(),
+        ))
 
-        logger.info(f"HotkeyManager initialized: PTT={config.push_to_talk}, Toggle={config.toggle}")
+        logger.info("HotkeyManager initialized: PTT=%s, Toggle=%s", config.push_to_talk, config.toggle)
 
-    def _parse_hotkey(self, hotkey_str: str) -> Set[keyboard.Key]:
+    def _parse_hotkey(self, hotkey_str: str) -> FrozenSet[keyboard.Key]:
         """Parse a hotkey string into a set of keys.
 
         Args:
             hotkey_str: Hotkey string (e.g., "ctrl+space")
 
         Returns:
-            Set of keyboard.Key objects
+            Frozen set of keyboard.Key objects
         """
-        if not hotkey_str:
-            return set()
-
-        keys = set()
-        parts = hotkey_str.lower().split('+')
-
-        for part in parts:
-            part = part.strip()
-
-            # Map common modifiers
-            if part in ('ctrl', 'control'):
-                keys.add(keyboard.Key.ctrl_l)
-            elif part in ('shift',):
-                keys.add(keyboard.Key.shift_l)
-            elif part in ('alt',):
-                keys.add(keyboard.Key.alt_l)
-            elif part in ('super', 'win', 'cmd'):
-                keys.add(keyboard.Key.cmd)
-            elif part == 'space':
-                keys.add(keyboard.Key.space)
-            elif len(part) == 1:
-                # Single character
-                try:
-                    keys.add(keyboard.KeyCode.from_char(part))
-                except Exception as e:
-                    logger.warning(f"Failed to parse key '{part}': {e}")
+        return hotkey_to_keys(parse_hotkey(hotkey_str))
 
-        return keys
+    def _keys_to_mask(self, keys: FrozenSet[keyboard.Key]) -> int:
+        """Combine the bits of a hotkey's keys into one mask."""
+        mask = 0
+        for key in keys:
+            mask |= self._key_bit[key]
+        return mask
 
-    def _keys_match(self, target_keys: Set[keyboard.Key]) -> bool:
-        """Check if currently pressed keys match target.
+    def _keys_match(self, target_mask: int) -> bool:
+        """Check if all keys of a hotkey are held (extra keys are allowed).
 
         Args:
-            target_keys: Target key combination
+            target_mask: Bitmask of the target key combination
 
         Returns:
             True if keys match
         """
-        if not target_keys:
-            return False
-
-        # Normalize the currently pressed keys
-        normalized_pressed = set()
-        for key in self.currently_pressed:
-            if isinstance(key, keyboard.Key):
-                # Handle left/right variants of modifiers
-                if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-                    normalized_pressed.add(keyboard.Key.ctrl_l)
-                elif key in (keyboard.Key.shift_l, keyboard.Key.shift_r):
-                    normalized_pressed.add(keyboard.Key.shift_l)
-                elif key in (keyboard.Key.alt_l, keyboard.Key.alt_r):
-                    normalized_pressed.add(keyboard.Key.alt_l)
-                elif key in (keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r):
-                    # Normalize Super/Windows/Command key variants (all three: cmd, cmd_l, cmd_r)
-                    normalized_pressed.add(keyboard.Key.cmd)
-                else:
-                    normalized_pressed.add(key)
-            else:
-                normalized_pressed.add(key)
-
-        return normalized_pressed == target_keys
+        return bool(target_mask) and (self._pressed_mask & target_mask) == target_mask
+
+    def _track_press(self, key) -> None:
+        """Record a key as held (auto-repeat presses are ignored)."""
+        if key in self.currently_pressed:
+            return
+        self.currently_pressed.add(key)
+        normalized = MODIFIER_VARIANTS.get(key, key)
+        self._normalized_pressed[normalized] = self._normalized_pressed.get(normalized, 0) + 1
+        self._pressed_mask |= self._key_bit.get(normalized, 0)
+
+    def _track_release(self, key) -> None:
+        """Record a key as no longer held."""
+        if key not in self.currently_pressed:
+            return
+        self.currently_pressed.remove(key)
+        normalized = MODIFIER_VARIANTS.get(key, key)
+        remaining = self._normalized_pressed[normalized] - 1
+        if remaining:
+            self._normalized_pressed[normalized] = remaining
+        else:
+            del self._normalized_pressed[normalized]
+            self._pressed_mask &= ~self._key_bit.get(normalized, 0)
+
+    def _clear_pressed(self) -> None:
+        """Forget all held keys."""
+        self.currently_pressed.clear()
+        self._normalized_pressed.clear()
+        self._pressed_mask = 0
 
     def _on_press(self, key) -> None:
         """Handle key press event.
@@ -130,26 +199,34 @@ class HotkeyManager:
             key: Key that was pressed
         """
         self.last_event_time = time.time()  # Update heartbeat
-        self.currently_pressed.add(key)
-
-        # Check for hotkey matches
-        if self._keys_match(self.ptt_keys):
-            self.mark_hotkey_working()  # Mark as working on first use
-            if self.on_push_to_talk_press:
-                self.on_push_to_talk_press()
-
-        elif self._keys_match(self.toggle_keys):
-            self.mark_hotkey_working()  # Mark as working on first use
-            if self.on_toggle:
-                self.on_toggle()
-            # Clear pressed keys to avoid repeated triggers
-            self.currently_pressed.clear()
-
-        elif self.undo_keys and self._keys_match(self.undo_keys):
-            self.mark_hotkey_working()  # Mark as working on first use
-            if self.on_undo:
-                self.on_undo()
-            self.currently_pressed.clear()
+        self._track_press(key)
+
+        # Check for hotkey matches (masks are non-zero, see __init__)
+        pressed = self._pressed_mask
+        for mask, handler in self._press_handlers:
+            if pressed & mask == mask:
+                if not self.hotkey_test_passed:
+                    self.mark_hotkey_working()  # Mark as working on first use
+                handler()
+                break
+
+    def _handle_ptt_press(self) -> None:
+        """Push-to-talk combination pressed."""
+        if self.on_push_to_talk_press:
+            self.on_push_to_talk_press()
+
+    def _handle_toggle(self) -> None:
+        """Toggle combination pressed."""
+        if self.on_toggle:
+            self.on_toggle()
+        # Clear pressed keys to avoid repeated triggers
+        self._clear_pressed()
+
+    def _handle_undo(self) -> None:
+        """Undo combination pressed."""
+        if self.on_undo:
+            self.on_undo()
+        self._clear_pressed()
 
     def _on_release(self, key) -> None:
         """Handle key release event.
@@ -158,11 +235,10 @@ class HotkeyManager:
             key: Key that was released
         """
         self.last_event_time = time.time()  # Update heartbeat
-        if key in self.currently_pressed:
-            self.currently_pressed.remove(key)
+        self._track_release(key)
 
         # Check if PTT hotkey was released
-        if self.ptt_keys and not self._keys_match(self.ptt_keys):
+        if self._ptt_mask and not self._keys_match(self._ptt_mask):
             # At least one PTT key was released
             if self.on_push_to_talk_release:
                 # Only trigger if we had all PTT keys pressed before
@@ -185,7 +261,7 @@ class HotkeyManager:
 
             # Check for common conflicts after a short delay
             if not self.conflict_warning_shown:
-                threading.Timer(2.0, self._check_for_conflicts).start()
+                self._schedule_conflict_check()
 
             # Start watchdog to monitor listener health
             if self.watchdog_enabled:
@@ -202,6 +278,34 @@ class HotkeyManager:
                 )
             raise
 
+    def _schedule_conflict_check(self) -> None:
+        """Run _check_for_conflicts once, 2 seconds from now."""
+        self._cancel_conflict_check()
+
+        if GLIB_AVAILABLE:
+            # One-shot source on the app's main loop; no thread per start()
+            def run_once() -> bool:
+                self._conflict_check = None
+                self._check_for_conflicts()
+                return False
+
+            self._conflict_check = GLib.timeout_add_seconds(2, run_once)
+        else:
+            timer = threading.Timer(2.0, self._check_for_conflicts)
+            timer.daemon = True
+            timer.start()
+            self._conflict_check = timer
+
+    def _cancel_conflict_check(self) -> None:
+        """Cancel a pending conflict check, if any."""
+        if self._conflict_check is None:
+            return
+        if isinstance(self._conflict_check, threading.Timer):
+            self._conflict_check.cancel()
+        else:
+            GLib.source_remove(self._conflict_check)
+        self._conflict_check = None
+
     def _check_for_conflicts(self) -> None:
         """Check for common hotkey conflicts and warn if detected."""
         if self.conflict_warning_shown or self.hotkey_test_passed:
@@ -283,7 +387,7 @@ class HotkeyManager:
             return
 
         self.restart_count += 1
-        logger.info(f"Attempting to restart hotkey listener (attempt {self.restart_count}/{self.max_restarts})")
+        logger.info("Attempting to restart hotkey listener (attempt %s/%s)", self.restart_count, self.max_restarts)
 
         try:
             # Stop old listener
@@ -295,7 +399,7 @@ class HotkeyManager:
                 self.listener = None
 
             # Start new listener
-            self.currently_pressed.clear()
+            self._clear_pressed()
             self.listener = keyboard.Listener(
                 on_press=self._on_press,
                 on_release=self._on_release
@@ -316,6 +420,8 @@ class HotkeyManager:
 
     def stop(self) -> None:
         """Stop listening for hotkeys."""
+        self._cancel_conflict_check()
+
         # Stop watchdog first
         self.watchdog_enabled = False
         if self.watchdog_timer is not None:
@@ -325,7 +431,7 @@ class HotkeyManager:
         if self.listener is not None:
             self.listener.stop()
             self.listener = None
-            self.currently_pressed.clear()
+            self._clear_pressed()
             logger.info("Hotkey listener stopped")
 
     def __enter__(self):
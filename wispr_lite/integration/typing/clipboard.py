@@ -3,30 +3,62 @@
 Handles clipboard save/restore with MIME type support and paste simulation.
 """
 
+import select
+import shutil
 import subprocess
+import threading
 import time
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 
 try:
-    from Xlib import X, XK, display
+    # Real locks for every Display created from here on: the clipboard owner's
+    # serve thread blocks in next_event() while own() makes round-trips on
+    # the same connection from the typing thread
+    import Xlib.threaded  # noqa: F401
+    from Xlib import X, Xatom, display
     from Xlib.ext import xtest
+    from Xlib.protocol import event as xevent
     XLIB_AVAILABLE = True
 except ImportError:
     XLIB_AVAILABLE = False
 
 from wispr_lite.logging import get_logger
+from wispr_lite.integration.typing.xtest import keysym_keycode, send_input
 
 logger = get_logger(__name__)
 
+# MIME types preserved across a clipboard paste besides plain text
+PRESERVED_TARGETS = ('text/html', 'text/uri-list')
 
+# Seconds to wait for the selection owner to answer a conversion request
+SELECTION_TIMEOUT = 1.0
+
+# Longest wait for the focused app to fetch pasted text before the clipboard is restored
+PASTE_TRANSFER_TIMEOUT = 0.1
+
+# Settle time after handing the clipboard to xclip, which gives no ownership signal
+XCLIP_SETTLE_DELAY = 0.05
+
+# X connection and private window used to read selections in-process
+_selection_reader = None
+_selection_reader_lock = threading.Lock()
+
+# Targets a restored plain-text selection is offered as (STRING is Latin-1 by definition)
+UTF8_TEXT_TARGETS = ('UTF8_STRING', 'text/plain;charset=utf-8')
+
+# In-process owner that serves pasted and restored selections, started on first use
+_clipboard_owner = None
+_clipboard_owner_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
 def check_xclip() -> bool:
-    """Check if xclip is available."""
-    try:
-        subprocess.run(["xclip", "-version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    """Check if xclip is available (a PATH lookup, cached for the process)."""
+    if shutil.which("xclip") is None:
         logger.warning("xclip not found, clipboard operations may fail")
         return False
+    return True
 
 
 def get_clipboard(selection: str = 'clipboard') -> Optional[str]:
@@ -47,7 +79,7 @@ def get_clipboard(selection: str = 'clipboard') -> Optional[str]:
         )
         return result.stdout if result.returncode == 0 else None
     except Exception as e:
-        logger.debug(f"Failed to get {selection}: {e}")
+        logger.debug("Failed to get %s: %s", selection, e)
         return None
 
 
@@ -91,7 +123,7 @@ def get_clipboard_targets(selection: str = 'clipboard') -> Optional[list]:
             return targets
         return None
     except Exception as e:
-        logger.debug(f"Failed to get {selection} targets: {e}")
+        logger.debug("Failed to get %s targets: %s", selection, e)
         return None
 
 
@@ -117,7 +149,7 @@ def get_clipboard_content_by_target(
             return result.stdout
         return None
     except Exception as e:
-        logger.debug(f"Failed to get {selection} content for {target}: {e}")
+        logger.debug("Failed to get %s content for %s: %s", selection, target, e)
         return None
 
 
@@ -143,19 +175,217 @@ def set_clipboard_content_by_target(
         )
         return True
     except Exception as e:
-        logger.debug(f"Failed to set {selection} content for {target}: {e}")
+        logger.debug("Failed to set %s content for %s: %s", selection, target, e)
         return False
 
 
+def _get_selection_reader():
+    """Return the cached X display and requestor window, connecting on first use.
+
+    Returns:
+        Tuple of (display, window)
+    """
+    global _selection_reader
+    if _selection_reader is None:
+        disp = display.Display()
+        window = disp.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        _selection_reader = (disp, window)
+    return _selection_reader
+
+
+def _close_selection_reader() -> None:
+    """Drop the cached selection connection so the next read reconnects."""
+    global _selection_reader
+    if _selection_reader is not None:
+        try:
+            _selection_reader[0].close()
+        except Exception:
+            pass
+        _selection_reader = None
+
+
+def _wait_for_selection_notify(disp, selection_atom: int, target_atom: int):
+    """Wait for the owner's reply to a ConvertSelection request.
+
+    Returns:
+        SelectionNotify event, or None on timeout
+    """
+    deadline = time.monotonic() + SELECTION_TIMEOUT
+    while True:
+        while disp.pending_events():
+            event = disp.next_event()
+            if (event.type == X.SelectionNotify
+                    and event.selection == selection_atom
+                    and event.target == target_atom):
+                return event
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        select.select([disp], [], [], remaining)
+
+
+def _convert_selection(disp, window, selection_atom: int, target: str):
+    """Fetch one target of a selection into our window's property.
+
+    Args:
+        disp: X display
+        window: Requestor window
+        selection_atom: Selection atom (CLIPBOARD or PRIMARY)
+        target: Target name (e.g. 'TARGETS', 'UTF8_STRING', 'text/html')
+
+    Returns:
+        The property (with .value), or None if the owner can't provide the target
+    """
+    target_atom = disp.intern_atom(target)
+    property_atom = disp.intern_atom('WISPR_LITE_SELECTION')
+
+    window.convert_selection(selection_atom, target_atom, property_atom, X.CurrentTime)
+    disp.flush()
+
+    event = _wait_for_selection_notify(disp, selection_atom, target_atom)
+    if event is None:
+        raise TimeoutError(f"No reply from selection owner for {target}")
+    if event.property == X.NONE:
+        return None
+
+    return _take_property(disp, window, property_atom, target)
+
+
+def _take_property(disp, window, property_atom: int, target: str):
+    """Read and delete a property the selection owner stored on our window.
+
+    Returns:
+        The property (with .value), or None if it wasn't set
+    """
+    prop = window.get_full_property(property_atom, X.AnyPropertyType)
+    window.delete_property(property_atom)
+    if prop is not None and prop.property_type == disp.intern_atom('INCR'):
+        # Large selections arrive in chunks; leave those to xclip
+        raise ValueError(f"Incremental transfer for {target}")
+    return prop
+
+
+def _convert_multiple(disp, window, selection_atom: int, targets: list) -> Optional[dict]:
+    """Fetch several targets with one MULTIPLE conversion (ICCCM 2.6.2).
+
+    Args:
+        disp: X display
+        window: Requestor window
+        selection_atom: Selection atom (CLIPBOARD or PRIMARY)
+        targets: Target names to fetch
+
+    Returns:
+        Target name to property (None where the owner refused it), or None if
+        the owner didn't perform the MULTIPLE conversion
+    """
+    multiple_atom = disp.intern_atom('MULTIPLE')
+    pairs_atom = disp.intern_atom('WISPR_LITE_MULTIPLE')
+    property_atoms = [disp.intern_atom(f'WISPR_LITE_SELECTION_{i}') for i in range(len(targets))]
+
+    # (target, property) atom pairs the owner fills in
+    pairs = []
+    for target, property_atom in zip(targets, property_atoms):
+        pairs.extend((disp.intern_atom(target), property_atom))
+    window.change_property(pairs_atom, disp.intern_atom('ATOM_PAIR'), 32, pairs)
+
+    window.convert_selection(selection_atom, multiple_atom, pairs_atom, X.CurrentTime)
+    disp.flush()
+
+    event = _wait_for_selection_notify(disp, selection_atom, multiple_atom)
+    if event is None:
+        raise TimeoutError("No reply from selection owner for MULTIPLE")
+    if event.property == X.NONE:
+        window.delete_property(pairs_atom)
+        return None
+
+    # The owner replaces the property of each pair it couldn't convert with None
+    answered = window.get_full_property(pairs_atom, X.AnyPropertyType)
+    window.delete_property(pairs_atom)
+    if answered is None:
+        return None
+
+    results = {}
+    for i, target in enumerate(targets):
+        if answered.value[2 * i + 1] == X.NONE:
+            results[target] = None
+        else:
+            results[target] = _take_property(disp, window, property_atoms[i], target)
+    return results
+
+
+def _property_bytes(prop) -> bytes:
+    """Return a format-8 property value as bytes."""
+    value = prop.value
+    return value.encode('latin-1') if isinstance(value, str) else bytes(value)
+
+
+def _read_selection_via_xlib(selection: str) -> dict:
+    """Read a selection's text, targets and preserved MIME types in-process.
+
+    Args:
+        selection: X selection ('clipboard' or 'primary')
+
+    Returns:
+        Dictionary in the same form as save_clipboard_data()
+    """
+    disp, window = _get_selection_reader()
+    selection_atom = disp.intern_atom(selection.upper())
+    data = {'text': None, 'targets': None, 'mime_data': {}}
+
+    if disp.get_selection_owner(selection_atom) == X.NONE:
+        return data
+
+    prop = _convert_selection(disp, window, selection_atom, 'TARGETS')
+    if prop is not None:
+        data['targets'] = [disp.get_atom_name(atom) for atom in prop.value]
+
+    available = data['targets'] or []
+    wanted = ['UTF8_STRING'] + [t for t in PRESERVED_TARGETS if t in available]
+
+    # Text and MIME data in one owner round-trip when the owner supports MULTIPLE
+    props = None
+    if 'MULTIPLE' in available:
+        props = _convert_multiple(disp, window, selection_atom, wanted)
+    if props is None:
+        props = {target: _convert_selection(disp, window, selection_atom, target) for target in wanted}
+
+    prop = props['UTF8_STRING']
+    if prop is not None:
+        data['text'] = _property_bytes(prop).decode('utf-8', errors='replace')
+    else:
+        prop = _convert_selection(disp, window, selection_atom, 'STRING')
+        if prop is not None:
+            data['text'] = _property_bytes(prop).decode('latin-1')
+
+    for mime_type in wanted[1:]:
+        prop = props[mime_type]
+        if prop is not None and prop.value:
+            data['mime_data'][mime_type] = _property_bytes(prop)
+
+    return data
+
+
 def save_clipboard_data(selection: str = 'clipboard') -> dict:
     """Save clipboard data including MIME types.
 
+    Reads the selection over a persistent X connection when python-xlib is
+    available, falling back to one xclip call per target.
+
     Args:
         selection: X selection ('clipboard' or 'primary')
 
     Returns:
         Dictionary with 'text' and 'mime_data' keys
     """
+    if XLIB_AVAILABLE:
+        with _selection_reader_lock:
+            try:
+                return _read_selection_via_xlib(selection)
+            except Exception as e:
+                _close_selection_reader()
+                logger.debug("Reading %s via Xlib failed, using xclip: %s", selection, e)
+
     data = {
         'text': get_clipboard(selection),
         'targets': get_clipboard_targets(selection),
@@ -164,7 +394,7 @@ def save_clipboard_data(selection: str = 'clipboard') -> dict:
 
     # Save content for important MIME types
     if data['targets']:
-        for mime_type in ['text/html', 'text/uri-list']:
+        for mime_type in PRESERVED_TARGETS:
             if mime_type in data['targets']:
                 content = get_clipboard_content_by_target(mime_type, selection)
                 if content:
@@ -173,31 +403,243 @@ def save_clipboard_data(selection: str = 'clipboard') -> dict:
     return data
 
 
+class _ClipboardOwner:
+    """Owns X selections and serves their contents from memory.
+
+    A daemon thread answers SelectionRequest events for every target
+    registered with own(), so a restore needs no helper processes.
+    """
+
+    def __init__(self):
+        """Connect to the X server and start serving requests."""
+        self.display = display.Display()
+        self.window = self.display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self.targets_atom = self.display.intern_atom('TARGETS')
+        # Largest property that fits in one ChangeProperty request (no INCR support)
+        self.max_data_size = self.display.display.info.max_request_length * 4 - 24
+        # Resource IDs of one client differ only in these bits
+        self.resource_id_mask = self.display.display.info.resource_id_mask
+
+        # Selection atom -> {target atom: data}
+        self._contents: Dict[int, Dict[int, bytes]] = {}
+        # Selection atom -> set once the pasting client has received data (not
+        # just TARGETS); armed by expect_paste()
+        self._transferred: Dict[int, threading.Event] = {}
+        # Selection atom -> resource ID base of the client expected to paste
+        self._paste_clients: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def own(self, selection: str, contents: Dict[str, bytes]) -> bool:
+        """Take ownership of a selection and serve the given targets.
+
+        Args:
+            selection: X selection ('clipboard' or 'primary')
+            contents: Target name (MIME type) to data
+
+        Returns:
+            True if we became the selection owner
+        """
+        if any(len(data) > self.max_data_size for data in contents.values()):
+            return False
+
+        selection_atom = self.display.intern_atom(selection.upper())
+        targets = {self.display.intern_atom(target): data for target, data in contents.items()}
+        with self._lock:
+            self._contents[selection_atom] = targets
+            self._transferred.pop(selection_atom, None)
+
+        self.window.set_selection_owner(selection_atom, X.CurrentTime)
+        return self.display.get_selection_owner(selection_atom) == self.window
+
+    def expect_paste(self, selection: str) -> None:
+        """Watch for the focused application fetching the selection.
+
+        Call right before sending the paste chord, so a fast app's fetch can't
+        be answered before the watch starts. Only data fetches by the focused
+        client count: TARGETS queries and fetches by other clients, such as a
+        clipboard manager copying the new contents as soon as ownership
+        changes, don't. If the focused client can't be determined, no fetch
+        counts.
+
+        Args:
+            selection: X selection ('clipboard' or 'primary')
+        """
+        selection_atom = self.display.intern_atom(selection.upper())
+        focus = self.display.get_input_focus().focus
+        transferred = threading.Event()
+
+        with self._lock:
+            self._transferred[selection_atom] = transferred
+            # PointerRoot and None come back as ints; the root window names no client
+            if isinstance(focus, int) or focus.id == self.display.screen().root.id:
+                self._paste_clients.pop(selection_atom, None)
+            else:
+                self._paste_clients[selection_atom] = focus.id & ~self.resource_id_mask
+
+    def wait_for_transfer(self, selection: str, timeout: float) -> bool:
+        """Wait until the client armed by expect_paste() has read the selection.
+
+        Args:
+            selection: X selection ('clipboard' or 'primary')
+            timeout: Seconds to wait
+
+        Returns:
+            True if the contents were transferred before the timeout
+        """
+        with self._lock:
+            transferred = self._transferred.get(self.display.intern_atom(selection.upper()))
+        return transferred is not None and transferred.wait(timeout)
+
+    def _serve(self) -> None:
+        """Answer selection requests until the connection closes."""
+        try:
+            while True:
+                event = self.display.next_event()
+                if event.type == X.SelectionRequest:
+                    self._answer(event)
+                elif event.type == X.SelectionClear:
+                    # Another application took the selection; forget our copy
+                    with self._lock:
+                        self._contents.pop(event.selection, None)
+        except Exception as e:
+            logger.debug("Clipboard owner stopped: %s", e)
+
+    def _answer(self, request) -> None:
+        """Store the requested target on the requestor and notify it."""
+        # Obsolete clients pass None as the property and expect the target name
+        prop = request.property or request.target
+
+        with self._lock:
+            contents = self._contents.get(request.selection)
+            transferred = self._transferred.get(request.selection)
+            paste_client = self._paste_clients.get(request.selection)
+
+        if contents is None:
+            prop = X.NONE
+        elif request.target == self.targets_atom:
+            request.requestor.change_property(
+                prop, Xatom.ATOM, 32, [self.targets_atom, *contents]
+            )
+        elif request.target in contents:
+            request.requestor.change_property(prop, request.target, 8, contents[request.target])
+        else:
+            prop = X.NONE
+
+        notify = xevent.SelectionNotify(
+            time=request.time,
+            requestor=request.requestor,
+            selection=request.selection,
+            target=request.target,
+            property=prop,
+        )
+        request.requestor.send_event(notify)
+        self.display.flush()
+
+        if (
+            transferred is not None
+            and prop != X.NONE
+            and request.target != self.targets_atom
+            and request.requestor.id & ~self.resource_id_mask == paste_client
+        ):
+            transferred.set()
+
+
+def _get_clipboard_owner() -> _ClipboardOwner:
+    """Return the shared selection owner, starting it on first use."""
+    global _clipboard_owner
+    with _clipboard_owner_lock:
+        if _clipboard_owner is None:
+            _clipboard_owner = _ClipboardOwner()
+        return _clipboard_owner
+
+
+def _close_clipboard_owner() -> None:
+    """Drop the shared selection owner so the next restore reconnects."""
+    global _clipboard_owner
+    with _clipboard_owner_lock:
+        if _clipboard_owner is not None:
+            try:
+                _clipboard_owner.display.close()
+            except Exception:
+                pass
+            _clipboard_owner = None
+
+
+def _text_contents(text: str) -> Dict[str, bytes]:
+    """Encode plain text for every text target an owner should offer."""
+    encoded = text.encode('utf-8')
+    contents = {target: encoded for target in UTF8_TEXT_TARGETS}
+    contents['STRING'] = text.encode('latin-1', errors='replace')
+    return contents
+
+
+def _own_text(text: str, selection: str) -> Optional[_ClipboardOwner]:
+    """Set a selection to text through the in-process owner.
+
+    Args:
+        text: Text to set
+        selection: X selection ('clipboard' or 'primary')
+
+    Returns:
+        The owner if it confirmed ownership, None to fall back to xclip
+    """
+    if not XLIB_AVAILABLE:
+        return None
+    try:
+        owner = _get_clipboard_owner()
+        if owner.own(selection, _text_contents(text)):
+            return owner
+    except Exception as e:
+        _close_clipboard_owner()
+        logger.debug("In-process set of %s failed, using xclip: %s", selection, e)
+    return None
+
+
 def restore_clipboard_with_targets(
     saved_data: dict, selection: str = 'clipboard'
 ) -> None:
     """Restore clipboard with awareness of MIME types.
 
+    With python-xlib, every saved target is served at once by an in-process
+    selection owner; otherwise each target is set through xclip.
+
     Args:
         saved_data: Dictionary with 'text', 'targets', and 'mime_data'
         selection: X selection ('clipboard' or 'primary')
     """
+    if XLIB_AVAILABLE:
+        contents = dict(saved_data.get('mime_data') or {})
+        if saved_data.get('text'):
+            for target, data in _text_contents(saved_data['text']).items():
+                contents.setdefault(target, data)
+
+        try:
+            if contents and _get_clipboard_owner().own(selection, contents):
+                logger.debug("Restored %s in-process (%d targets)", selection, len(contents))
+                return
+        except Exception as e:
+            _close_clipboard_owner()
+            logger.debug("In-process restore of %s failed, using xclip: %s", selection, e)
+
     try:
         # Restore MIME types if we have them
         if saved_data.get('mime_data'):
             for mime_type, content in saved_data['mime_data'].items():
                 set_clipboard_content_by_target(content, mime_type, selection)
-                logger.debug(f"Restored {selection} MIME type: {mime_type}")
+                logger.debug("Restored %s MIME type: %s", selection, mime_type)
 
         # Always restore plain text as fallback
         if saved_data.get('text'):
             set_clipboard(saved_data['text'], selection)
 
         logger.debug(
-            f"Restored {selection} (targets: {len(saved_data.get('targets', []))})"
+            "Restored %s (targets: %d)", selection, len(saved_data.get('targets') or [])
         )
     except Exception as e:
-        logger.debug(f"Failed to restore {selection}: {e}")
+        logger.debug("Failed to restore %s: %s", selection, e)
 
 
 def simulate_paste() -> None:
@@ -206,29 +648,19 @@ def simulate_paste() -> None:
         logger.error("python-xlib not available for paste simulation")
         return
 
-    try:
-        disp = display.Display()
-
-        # Get keycodes
-        ctrl_code = disp.keysym_to_keycode(XK.string_to_keysym("Control_L"))
-        v_code = disp.keysym_to_keycode(XK.string_to_keysym("v"))
+    def send(disp) -> None:
+        ctrl_code = keysym_keycode(disp, "Control_L")
+        v_code = keysym_keycode(disp, "v")
 
-        # Press Ctrl
+        # Ctrl down, V down, V up, Ctrl up; the requests are queued in order
         xtest.fake_input(disp, X.KeyPress, ctrl_code)
-        disp.sync()
-
-        # Press V
         xtest.fake_input(disp, X.KeyPress, v_code)
-        disp.sync()
-
-        # Release V
         xtest.fake_input(disp, X.KeyRelease, v_code)
-        disp.sync()
-
-        # Release Ctrl
         xtest.fake_input(disp, X.KeyRelease, ctrl_code)
-        disp.sync()
 
+    try:
+        # The whole chord goes out with one sync
+        send_input(send)
     except Exception as e:
         logger.error(f"Failed to simulate paste: {e}")
         raise
@@ -239,6 +671,9 @@ def insert_via_clipboard(
 ) -> bool:
     """Insert text via clipboard and paste.
 
+    With python-xlib the selection is set, saved and restored in-process and
+    xclip is only a fallback, so either one is enough.
+
     Args:
         text: Text to insert
         preserve_clipboard: Whether to preserve and restore clipboard
@@ -247,8 +682,8 @@ def insert_via_clipboard(
     Returns:
         True if successful
     """
-    if not xclip_available:
-        logger.error("xclip not available for clipboard strategy")
+    if not xclip_available and not XLIB_AVAILABLE:
+        logger.error("Neither xclip nor python-xlib available for clipboard strategy")
         return False
 
     try:
@@ -260,24 +695,33 @@ def insert_via_clipboard(
             saved_clipboard = save_clipboard_data('clipboard')
             saved_primary = save_clipboard_data('primary')
 
-        # Set clipboard to text
-        set_clipboard(text, 'clipboard')
+        # Set clipboard to text; the in-process owner confirms ownership with
+        # a round-trip, xclip only after its own process has started serving
+        owner = _own_text(text, 'clipboard')
+        if owner is None:
+            set_clipboard(text, 'clipboard')
+            time.sleep(XCLIP_SETTLE_DELAY)
 
-        # Small delay to ensure clipboard is set
-        time.sleep(0.05)
+        # Watch for the focused app's fetch before it can happen
+        if preserve_clipboard and owner is not None:
+            owner.expect_paste('clipboard')
 
         # Simulate Ctrl+V
         simulate_paste()
 
         # Restore clipboard and primary if configured
         if preserve_clipboard:
-            time.sleep(0.1)  # Wait for paste to complete
+            # Restore as soon as the focused app has fetched the text
+            if owner is not None:
+                owner.wait_for_transfer('clipboard', PASTE_TRANSFER_TIMEOUT)
+            else:
+                time.sleep(PASTE_TRANSFER_TIMEOUT)
             if saved_clipboard and saved_clipboard.get('text') is not None:
                 restore_clipboard_with_targets(saved_clipboard, 'clipboard')
             if saved_primary and saved_primary.get('text') is not None:
                 restore_clipboard_with_targets(saved_primary, 'primary')
 
-        logger.debug(f"Inserted text via clipboard: {len(text)} chars")
+        logger.debug("Inserted text via clipboard: %d chars", len(text))
         return True
 
     except Exception as e:
@@ -3,6 +3,7 @@
 Provides high-level TextOutput class that dispatches to clipboard or XTest strategies.
 """
 
+import re
 from typing import Optional
 
 from wispr_lite.logging import get_logger
@@ -11,6 +12,15 @@ from wispr_lite.integration.typing import clipboard, xtest
 
 logger = get_logger(__name__)
 
+# Characters that end a sentence for smart spacing/capitalization
+SENTENCE_END_CHARS = frozenset('.!?')
+
+# Leading punctuation that attaches to the previous text (no smart space before it)
+LEADING_PUNCTUATION = frozenset('.,!?;:')
+
+# First letter of a transcript (any script; digits and underscores excluded)
+_FIRST_LETTER_RE = re.compile(r'[^\W\d_]')
+
 
 class TextOutput:
     """Handles typing/pasting transcribed text."""
@@ -22,6 +32,7 @@ class TextOutput:
             config: Typing configuration
         """
         self.config = config
+        self._last_nonspace_char = ""
         self.last_inserted_text = ""
         self.last_inserted_length = 0
 
@@ -32,9 +43,6 @@ class TextOutput:
         # Check xclip availability for clipboard strategy
         self.xclip_available = clipboard.check_xclip()
 
-        # Check xdotool availability for undo fallback
-        self.xdotool_available = xtest.check_xdotool()
-
         # Track if we've shown undo warning
         self.undo_warning_shown = False
 
@@ -46,7 +54,23 @@ class TextOutput:
             logger.warning("python-xlib not available, falling back to clipboard")
             self.config.strategy = "clipboard"
 
-        logger.info(f"TextOutput initialized: strategy={self.config.strategy}")
+        logger.info("TextOutput initialized: strategy=%s", self.config.strategy)
+
+    @property
+    def xdotool_available(self) -> bool:
+        """Whether xdotool can be used for undo (looked up on first use, only needed without XLib)."""
+        return xtest.check_xdotool()
+
+    @property
+    def last_inserted_text(self) -> str:
+        """Text of the last insertion (used for undo and smart spacing)."""
+        return self._last_inserted_text
+
+    @last_inserted_text.setter
+    def last_inserted_text(self, text: str) -> None:
+        self._last_inserted_text = text
+        # Smart spacing/capitalization only look at the final non-space character
+        self._last_nonspace_char = next((c for c in reversed(text) if not c.isspace()), "")
 
     def insert_text(self, text: str) -> bool:
         """Insert text into the active window.
@@ -62,17 +86,21 @@ class TextOutput:
 
         # Smart spacing: auto-add space after sentence-ending punctuation
         if self.config.smart_spacing and self.last_inserted_text:
-            logger.debug(f"Smart spacing check: last_text='{self.last_inserted_text[-20:]}', new_text='{text[:20]}'")
+            # Lazy %-args: the slices are only formatted when DEBUG is enabled (default is INFO)
+            logger.debug(
+                "Smart spacing check: last_text=%r, new_text=%r",
+                self.last_inserted_text[-20:], text[:20]
+            )
             # Check if last text ended with sentence-ending punctuation
-            if self.last_inserted_text.rstrip().endswith(('.', '!', '?')):
+            if self._last_nonspace_char in SENTENCE_END_CHARS:
                 # Check if new text doesn't start with whitespace or punctuation
-                if text and not text[0].isspace() and text[0] not in '.,!?;:':
+                if text and not text[0].isspace() and text[0] not in LEADING_PUNCTUATION:
                     text = ' ' + text
-                    logger.info(f"Smart spacing: added space before '{text[:20]}'")
+                    logger.debug("Smart spacing: added space before %r", text[:20])
                 else:
-                    logger.debug(f"Smart spacing: text already starts with whitespace/punctuation")
+                    logger.debug("Smart spacing: text already starts with whitespace/punctuation")
             else:
-                logger.debug(f"Smart spacing: previous text doesn't end with sentence punctuation")
+                logger.debug("Smart spacing: previous text doesn't end with sentence punctuation")
         elif not self.config.smart_spacing:
             logger.debug("Smart spacing disabled in config")
         elif not self.last_inserted_text:
@@ -87,17 +115,21 @@ class TextOutput:
                 should_capitalize = True
                 logger.debug("Smart capitalization: first text, capitalizing")
             # Capitalize if previous text ended with sentence-ending punctuation
-            elif self.last_inserted_text.rstrip().endswith(('.', '!', '?')):
+            elif self._last_nonspace_char in SENTENCE_END_CHARS:
                 should_capitalize = True
                 logger.debug("Smart capitalization: previous sentence ended, capitalizing")
 
             if should_capitalize and text:
-                # Find the first letter to capitalize (skip leading whitespace/punctuation)
-                for i, char in enumerate(text):
-                    if char.isalpha():
-                        text = text[:i] + char.upper() + text[i+1:]
-                        logger.info(f"Smart capitalization: capitalized first letter to '{text[:20]}'")
-                        break
+                # Usually the text starts with the letter; otherwise skip leading whitespace/punctuation
+                if text[0].isalpha():
+                    text = text[0].upper() + text[1:]
+                    logger.debug("Smart capitalization: capitalized first letter to %r", text[:20])
+                else:
+                    match = _FIRST_LETTER_RE.search(text)
+                    if match:
+                        i = match.start()
+                        text = text[:i] + text[i].upper() + text[i + 1:]
+                        logger.debug("Smart capitalization: capitalized first letter to %r", text[:20])
 
         # Track for undo
         self.last_inserted_text = text
@@ -3,11 +3,17 @@
 Handles XLib/XTest typing, delta typing for partials, and undo operations.
 """
 
+import atexit
+import shutil
+import string
 import subprocess
-import time
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
 
 try:
     from Xlib import X, XK, display
+    from Xlib import error as xerror
     from Xlib.ext import xtest
     XLIB_AVAILABLE = True
 except ImportError:
@@ -17,100 +23,288 @@ from wispr_lite.logging import get_logger
 
 logger = get_logger(__name__)
 
+# X connection shared by all synthetic input (typing, undo, paste), opened on first use
+_input_display = None
+# Serializes use of the shared connection; hold it for a whole key sequence
+input_lock = threading.RLock()
+# keysym -> (keycode, shift needed), built from the keyboard mapping of _keymap_display
+_keymap: Dict[int, Tuple[int, bool]] = {}
+_keymap_display = None
+# char -> (keycode, shift needed) on the same mapping; prefilled with the common
+# dictation characters, other characters are added on first use
+_char_keys: Dict[str, Tuple[int, bool]] = {}
 
-def check_xdotool() -> bool:
-    """Check if xdotool is available."""
-    try:
-        subprocess.run(["xdotool", "version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        logger.debug("xdotool not found, undo fallback unavailable")
-        return False
+# Characters whose keys are resolved as soon as the keysym table is built
+PREFILLED_CHARS = string.ascii_lowercase + string.digits + " .,"
+
+# Largest undelayed batch (keystrokes) typed under a server grab; the grab
+# freezes every other client until the batch is processed
+MAX_GRABBED_KEYSTROKES = 2000
+
+
+def get_input_display():
+    """Return the shared X display for XTest input, connecting on first use.
+
+    Callers must hold input_lock while using the display.
+
+    Returns:
+        Xlib display connection
+    """
+    global _input_display
+    if _input_display is None:
+        _input_display = display.Display()
+    return _input_display
+
+
+def close_input_display() -> None:
+    """Drop the shared X display so the next use reconnects."""
+    global _input_display
+    with input_lock:
+        if _input_display is not None:
+            try:
+                _input_display.close()
+            except Exception:
+                pass
+            _input_display = None
+        _reset_keymap()
+
+
+atexit.register(close_input_display)
 
 
-def type_character(disp, char: str) -> None:
-    """Type a single character using XTest.
+def send_input(send: Callable[["display.Display"], None], retry: bool = True) -> None:
+    """Queue synthetic input on the shared display and sync once.
+
+    If the X server has closed the cached connection (e.g. after a display
+    reset), reconnects and sends again once; nothing reached the server over
+    the closed socket. Any other error drops the connection and propagates.
+
+    Args:
+        send: Called with the display to queue fake_input events
+        retry: Resend after a closed connection; pass False if part of the
+            sequence may already have taken effect (e.g. server-delayed events)
+
+    Raises:
+        Exception: X errors from sending or syncing
+    """
+    with input_lock:
+        for attempt in range(2):
+            try:
+                disp = get_input_display()
+                _apply_mapping_changes(disp)
+                send(disp)
+                # One round-trip for the whole sequence
+                disp.sync()
+                return
+            except xerror.ConnectionClosedError:
+                close_input_display()
+                if attempt or not retry:
+                    raise
+                logger.debug("X connection closed, reconnecting")
+            except Exception:
+                close_input_display()
+                raise
+
+
+def _reset_keymap() -> None:
+    """Forget the keysym table so it is rebuilt on next use."""
+    global _keymap_display
+    _keymap.clear()
+    _char_keys.clear()
+    _keymap_display = None
+
+
+def _keymap_for(disp) -> Dict[int, Tuple[int, bool]]:
+    """Return the keysym -> (keycode, shift needed) table for a display.
+
+    Built once per display from the client-side keyboard mapping. A keysym on
+    a key's unshifted level wins over one that needs Shift, matching
+    keysym_to_keycode().
+
+    Args:
+        disp: X display
+
+    Returns:
+        Table mapping keysym to (keycode, shift needed)
+    """
+    global _keymap_display
+    if disp is not _keymap_display:
+        _reset_keymap()
+        info = disp.display.info
+        for index in (0, 1):
+            for keycode in range(info.min_keycode, info.max_keycode + 1):
+                keysym = disp.keycode_to_keysym(keycode, index)
+                if keysym and keysym not in _keymap:
+                    _keymap[keysym] = (keycode, index == 1)
+        for char in PREFILLED_CHARS:
+            _char_keys[char] = _keymap.get(_char_keysym(char), (0, False))
+        _keymap_display = disp
+    return _keymap
+
+
+def _apply_mapping_changes(disp) -> None:
+    """Process events queued on the display, refreshing the keymap on MappingNotify.
 
     Args:
         disp: X display
-        char: Character to type
     """
-    # Special handling for characters that need specific keysym names
-    char_map = {
-        ' ': 'space',
-        '.': 'period',
-        ',': 'comma',
-        '!': 'exclam',
-        '?': 'question',
-        ':': 'colon',
-        ';': 'semicolon',
-        "'": 'apostrophe',
-        '"': 'quotedbl',
-        '-': 'minus',
-        '_': 'underscore',
-        '(': 'parenleft',
-        ')': 'parenright',
-        '[': 'bracketleft',
-        ']': 'bracketright',
-        '{': 'braceleft',
-        '}': 'braceright',
-        '/': 'slash',
-        '\\': 'backslash',
-        '@': 'at',
-        '#': 'numbersign',
-        '$': 'dollar',
-        '%': 'percent',
-        '^': 'asciicircum',
-        '&': 'ampersand',
-        '*': 'asterisk',
-        '+': 'plus',
-        '=': 'equal',
-        '<': 'less',
-        '>': 'greater',
-        '|': 'bar',
-        '~': 'asciitilde',
-        '`': 'grave',
-    }
-
-    if char in char_map:
-        keysym = XK.string_to_keysym(char_map[char])
-    else:
-        # Get keysym for character
-        keysym = XK.string_to_keysym(char)
-        if keysym == 0:
-            # Try unicode keysym
-            keysym = ord(char) | 0x01000000
-
-    # Get keycode
-    keycode = disp.keysym_to_keycode(keysym)
-    if keycode == 0:
-        logger.warning(f"No keycode for character: {char}")
-        return
-
-    # Check if shift is needed for this character
-    # We check all modifier combinations to find if this keysym requires shift
-    shift_needed = False
-    if keycode != 0:
-        # Check keysym at index 0 (unshifted) and 1 (shifted)
-        unshifted = disp.keycode_to_keysym(keycode, 0)
-        shifted = disp.keycode_to_keysym(keycode, 1)
-
-        # If our target keysym matches the shifted version but not unshifted, we need shift
-        if keysym == shifted and keysym != unshifted:
-            shift_needed = True
-
-    # Get shift keycode
-    if shift_needed:
-        shift_keycode = disp.keysym_to_keycode(XK.string_to_keysym('Shift_L'))
-        xtest.fake_input(disp, X.KeyPress, shift_keycode)
-
-    # Simulate key press and release
-    xtest.fake_input(disp, X.KeyPress, keycode)
-    xtest.fake_input(disp, X.KeyRelease, keycode)
-
-    # Release shift if we pressed it
-    if shift_needed:
-        xtest.fake_input(disp, X.KeyRelease, shift_keycode)
+    while disp.pending_events():
+        event = disp.next_event()
+        if event.type == X.MappingNotify and event.request == X.MappingKeyboard:
+            disp.refresh_keyboard_mapping(event)
+            _reset_keymap()
+            logger.debug("Keyboard mapping changed, rebuilding keysym table")
+
+
+def keysym_keycode(disp, name: str) -> int:
+    """Return the keycode for a keysym name (from the cached keysym table).
+
+    Args:
+        disp: X display
+        name: Keysym name, e.g. "BackSpace"
+
+    Returns:
+        Keycode, or 0 if no key produces the keysym
+    """
+    return _keymap_for(disp).get(XK.string_to_keysym(name), (0, False))[0]
+
+
+@lru_cache(maxsize=1)
+def check_xdotool() -> bool:
+    """Check if xdotool is available (a PATH lookup, cached for the process)."""
+    if shutil.which("xdotool") is None:
+        logger.debug("xdotool not found, undo fallback unavailable")
+        return False
+    return True
+
+
+# Keysym names for characters whose keysym isn't the character itself
+CHAR_KEYSYM_NAMES = {
+    ' ': 'space',
+    '.': 'period',
+    ',': 'comma',
+    '!': 'exclam',
+    '?': 'question',
+    ':': 'colon',
+    ';': 'semicolon',
+    "'": 'apostrophe',
+    '"': 'quotedbl',
+    '-': 'minus',
+    '_': 'underscore',
+    '(': 'parenleft',
+    ')': 'parenright',
+    '[': 'bracketleft',
+    ']': 'bracketright',
+    '{': 'braceleft',
+    '}': 'braceright',
+    '/': 'slash',
+    '\\': 'backslash',
+    '@': 'at',
+    '#': 'numbersign',
+    '$': 'dollar',
+    '%': 'percent',
+    '^': 'asciicircum',
+    '&': 'ampersand',
+    '*': 'asterisk',
+    '+': 'plus',
+    '=': 'equal',
+    '<': 'less',
+    '>': 'greater',
+    '|': 'bar',
+    '~': 'asciitilde',
+    '`': 'grave',
+}
+
+
+@lru_cache(maxsize=1024)
+def _char_keysym(char: str) -> int:
+    """Return the keysym that types a character."""
+    if char in CHAR_KEYSYM_NAMES:
+        return XK.string_to_keysym(CHAR_KEYSYM_NAMES[char])
+    keysym = XK.string_to_keysym(char)
+    if keysym == 0:
+        # Try unicode keysym
+        keysym = ord(char) | 0x01000000
+    return keysym
+
+
+def _char_key(disp, char: str) -> Tuple[int, bool]:
+    """Return (keycode, shift needed) for a character; keycode 0 if untypeable."""
+    keymap = _keymap_for(disp)
+    key = _char_keys.get(char)
+    if key is None:
+        key = _char_keys[char] = keymap.get(_char_keysym(char), (0, False))
+    return key
+
+
+def insert_batch(chars: str, backspaces: int = 0, key_delay_ms: int = 0) -> None:
+    """Send backspaces then chars as one queued key sequence with a single sync.
+
+    Undelayed batches of up to MAX_GRABBED_KEYSTROKES are sent under a server
+    grab so the server replays them without switching to other clients.
+    Paced typing is left ungrabbed since the user should see it appear.
+
+    Args:
+        chars: Characters to type
+        backspaces: Backspaces to press before typing
+        key_delay_ms: Pause between keystrokes, applied by the X server (XTest
+            event delay) so no Python thread sleeps; the final sync returns
+            once the last keystroke has been processed
+
+    Raises:
+        Exception: X errors; the shared connection is dropped first
+    """
+    delay = max(key_delay_ms, 0)
+    grab = not delay and len(chars) + backspaces <= MAX_GRABBED_KEYSTROKES
+
+    def send(disp) -> None:
+        if not grab:
+            queue_keys(disp)
+            return
+        # Queued with the keys, so the grab is released before the single sync
+        disp.grab_server()
+        try:
+            queue_keys(disp)
+        finally:
+            disp.ungrab_server()
+
+    def queue_keys(disp) -> None:
+        # XTest delay before the first event of each keystroke; none before the first
+        pending_delay = 0
+
+        if backspaces > 0:
+            backspace_code = keysym_keycode(disp, "BackSpace")
+            for _ in range(backspaces):
+                xtest.fake_input(disp, X.KeyPress, backspace_code, time=pending_delay)
+                xtest.fake_input(disp, X.KeyRelease, backspace_code)
+                pending_delay = delay
+
+        # Shift stays down across a run of shifted characters ("HELLO" is one
+        # Shift press, not five)
+        shift_keycode = keysym_keycode(disp, 'Shift_L') if chars else 0
+        shift_held = False
+        for char in chars:
+            keycode, shift_needed = _char_key(disp, char)
+            if keycode == 0:
+                logger.warning(f"No keycode for character: {char}")
+                continue
+
+            if shift_needed != shift_held:
+                xtest.fake_input(
+                    disp, X.KeyPress if shift_needed else X.KeyRelease, shift_keycode, time=pending_delay
+                )
+                shift_held = shift_needed
+                pending_delay = 0
+
+            xtest.fake_input(disp, X.KeyPress, keycode, time=pending_delay)
+            xtest.fake_input(disp, X.KeyRelease, keycode)
+            pending_delay = delay
+
+        if shift_held:
+            xtest.fake_input(disp, X.KeyRelease, shift_keycode)
+
+    # The server may already have acted on part of a delayed sequence, so it is not resent
+    send_input(send, retry=not delay)
 
 
 def insert_via_xtest(text: str, typing_delay_ms: int) -> bool:
@@ -128,17 +322,8 @@ def insert_via_xtest(text: str, typing_delay_ms: int) -> bool:
         return False
 
     try:
-        disp = display.Display()
-        root = disp.screen().root
-
-        # Type each character
-        for char in text:
-            type_character(disp, char)
-            if typing_delay_ms > 0:
-                time.sleep(typing_delay_ms / 1000.0)
-
-        disp.sync()
-        logger.debug(f"Inserted text via XTest: {len(text)} chars")
+        insert_batch(text, key_delay_ms=typing_delay_ms)
+        logger.debug("Inserted text via XTest: %d chars", len(text))
         return True
 
     except Exception as e:
@@ -146,6 +331,25 @@ def insert_via_xtest(text: str, typing_delay_ms: int) -> bool:
         return False
 
 
+def _common_prefix_len(old: str, new: str) -> int:
+    """Length of the common prefix of two strings.
+
+    Partials usually extend the previous one, which startswith() settles in C;
+    otherwise a binary search over slice comparisons finds the first mismatch
+    in O(log n) Python steps instead of one per character.
+    """
+    if new.startswith(old):
+        return len(old)
+    lo, hi = 0, min(len(old), len(new))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[:mid] == new[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
 def insert_partial(
     new_text: str,
     current_partial_text: str,
@@ -153,10 +357,12 @@ def insert_partial(
 ) -> tuple[bool, str, int]:
     """Insert partial text incrementally (delta from previous partial).
 
+    The delta is sent as one batch, so typing_delay_ms is not applied within it.
+
     Args:
         new_text: New partial transcription
         current_partial_text: Current partial text
-        typing_delay_ms: Delay between keystrokes in milliseconds
+        typing_delay_ms: Delay between keystrokes in milliseconds (unused)
 
     Returns:
         Tuple of (success, updated_partial_text, updated_length)
@@ -168,12 +374,7 @@ def insert_partial(
 
     try:
         # Calculate delta
-        common_prefix_len = 0
-        for i, (old_char, new_char) in enumerate(zip(current_partial_text, new_text)):
-            if old_char == new_char:
-                common_prefix_len = i + 1
-            else:
-                break
+        common_prefix_len = _common_prefix_len(current_partial_text, new_text)
 
         # How many characters to delete
         chars_to_delete = len(current_partial_text) - common_prefix_len
@@ -181,22 +382,9 @@ def insert_partial(
         # New characters to type
         chars_to_add = new_text[common_prefix_len:]
 
-        disp = display.Display()
-
-        # Delete old suffix
-        if chars_to_delete > 0:
-            backspace_code = disp.keysym_to_keycode(XK.string_to_keysym("BackSpace"))
-            for _ in range(chars_to_delete):
-                xtest.fake_input(disp, X.KeyPress, backspace_code)
-                xtest.fake_input(disp, X.KeyRelease, backspace_code)
-
-        # Type new suffix
-        for char in chars_to_add:
-            type_character(disp, char)
+        insert_batch(chars_to_add, backspaces=chars_to_delete)
 
-        disp.sync()
-
-        logger.debug(f"Partial delta: -{chars_to_delete}, +{len(chars_to_add)}")
+        logger.debug("Partial delta: -%d, +%d", chars_to_delete, len(chars_to_add))
         return True, new_text, len(new_text)
 
     except Exception as e:
@@ -218,19 +406,9 @@ def undo_via_xlib(num_chars: int, typing_delay_ms: int) -> bool:
         return False
 
     try:
-        disp = display.Display()
-        backspace_code = disp.keysym_to_keycode(XK.string_to_keysym("BackSpace"))
-
-        # Press backspace for each character
-        for _ in range(num_chars):
-            xtest.fake_input(disp, X.KeyPress, backspace_code)
-            xtest.fake_input(disp, X.KeyRelease, backspace_code)
-            if typing_delay_ms > 0:
-                time.sleep(typing_delay_ms / 1000.0)
-
-        disp.sync()
+        insert_batch("", backspaces=num_chars, key_delay_ms=typing_delay_ms)
 
-        logger.info(f"Undid {num_chars} characters via XLib")
+        logger.info("Undid %s characters via XLib", num_chars)
         return True
 
     except Exception as e:
@@ -249,18 +427,16 @@ def undo_via_xdotool(num_chars: int, typing_delay_ms: int) -> bool:
         True if successful
     """
     try:
-        # Use xdotool to type backspaces
-        for _ in range(num_chars):
-            subprocess.run(
-                ["xdotool", "key", "BackSpace"],
-                capture_output=True,
-                check=True,
-                timeout=0.5
-            )
-            if typing_delay_ms > 0:
-                time.sleep(typing_delay_ms / 1000.0)
-
-        logger.info(f"Undid {num_chars} characters via xdotool")
+        # One xdotool process presses all backspaces; --delay paces keystrokes
+        # within the sequence (with --repeat it would only apply inside each repetition)
+        subprocess.run(
+            ["xdotool", "key", "--delay", str(max(typing_delay_ms, 0)), *(["BackSpace"] * num_chars)],
+            capture_output=True,
+            check=True,
+            timeout=0.5 + num_chars * max(typing_delay_ms, 0) / 1000.0
+        )
+
+        logger.info("Undid %s characters via xdotool", num_chars)
         return True
 
     except Exception as e:
@@ -7,8 +7,18 @@ Logs are stored under ~/.local/state/wispr-lite/logs.
 import logging
 import logging.handlers
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+# Config log_level names -> logging levels
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 
 def get_log_dir() -> Path:
@@ -18,26 +28,9 @@ def get_log_dir() -> Path:
     return log_dir
 
 
-def get_logger(name: str = 'wispr_lite', level: Optional[int] = None) -> logging.Logger:
-    """Get or create a logger with file and console handlers.
-
-    Args:
-        name: Logger name, defaults to 'wispr_lite'
-        level: Logging level; defaults to INFO
-
-    Returns:
-        Configured logger instance
-    """
-    logger = logging.getLogger(name)
-
-    # Only configure if not already configured
-    if logger.handlers:
-        if level is not None:
-            logger.setLevel(level)
-        return logger
-
-    logger.setLevel(level or logging.INFO)
-
+@lru_cache(maxsize=1)
+def _handlers() -> Tuple[logging.Handler, ...]:
+    """Create the shared file and console handlers (once per process)."""
     # File handler with rotation
     log_file = get_log_dir() / 'wispr-lite.log'
     file_handler = logging.handlers.RotatingFileHandler(
@@ -52,15 +45,44 @@ def get_logger(name: str = 'wispr_lite', level: Optional[int] = None) -> logging
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_formatter = logging.Formatter('%(levelname)s - %(message)s')
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
+    return file_handler, console_handler
+
+
+@lru_cache(maxsize=None)
+def _configure(top_level_name: str) -> None:
+    """Attach the shared handlers to a top-level logger (once per name)."""
+    logger = logging.getLogger(top_level_name)
+    logger.setLevel(logging.INFO)
+    for handler in _handlers():
+        logger.addHandler(handler)
+
+
+def get_logger(name: str = 'wispr_lite', level: Optional[int] = None) -> logging.Logger:
+    """Get a logger that writes to the log file and console.
+
+    Handlers live on the top-level logger ('wispr_lite' for all package
+    modules) and are created once; module loggers inherit its level and
+    propagate to it, so set_log_level() applies everywhere.
+
+    Args:
+        name: Logger name, defaults to 'wispr_lite'
+        level: Logging level for this logger; defaults to inheriting INFO
+
+    Returns:
+        Configured logger instance
+    """
+    _configure(name.partition('.')[0])
+
+    logger = logging.getLogger(name)
+    if level is not None:
+        logger.setLevel(level)
     return logger
 
 
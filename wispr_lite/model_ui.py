@@ -4,6 +4,10 @@ Handles consent dialogs and progress notifications for model downloads.
 """
 
 import threading
+import time
+from concurrent.futures import Future
+from typing import Dict
+
 from gi.repository import GLib
 
 from wispr_lite.logging import get_logger
@@ -12,6 +16,14 @@ from wispr_lite.ui.notifications import NotificationManager, Severity
 
 logger = get_logger(__name__)
 
+# Minimum seconds between intermediate download progress notifications
+PROGRESS_INTERVAL = 0.1
+
+# Latest intermediate progress per model waiting for the scheduled flush
+_pending_progress: Dict[str, float] = {}
+_last_progress_emit = 0.0
+_progress_lock = threading.Lock()
+
 
 def get_model_size_mb(model_size: str) -> str:
     """Get approximate model download size in MB."""
@@ -27,19 +39,18 @@ def get_model_size_mb(model_size: str) -> str:
 
 def show_model_consent_dialog(
     model_size: str,
-    consent_event: threading.Event,
-    consent_result: list
+    consent_future: Future
 ) -> None:
     """Show model download consent dialog on GTK main thread.
 
     Args:
         model_size: Model size being requested
-        consent_event: Event to set when the user responds
-        consent_result: A list to store the boolean result
+        consent_future: Future resolved with the boolean result when the user responds
     """
-    logger.info(f"Requesting consent to download model: {model_size}")
+    logger.info("Requesting consent to download model: %s", model_size)
 
     def show_dialog():
+        result = False
         try:
             result = show_confirmation_dialog(
                 "Model Download Required",
@@ -48,10 +59,9 @@ def show_model_consent_dialog(
                 f"Model will be cached in ~/.cache/wispr-lite/models/\n"
                 f"This is a one-time download per model size."
             )
-            consent_result[0] = result
-            logger.info(f"Model download consent: {'granted' if result else 'denied'}")
+            logger.info("Model download consent: %s", 'granted' if result else 'denied')
         finally:
-            consent_event.set()  # Signal the waiting thread
+            consent_future.set_result(result)  # Wake the waiting thread
 
     GLib.idle_add(show_dialog)
 
@@ -98,12 +108,65 @@ def notify_model_download_progress(
             1.0
         )
     else:
-        # Progress update
-        GLib.idle_add(
-            notification_manager.notify,
-            "Downloading Model",
-            Severity.PROGRESS,
-            "model_download",
-            f"Downloading Whisper '{model_size}' model...",
-            progress
-        )
+        _throttle_progress(notification_manager, model_size, progress)
+        return
+
+    # Start/finish/failure always show; drop a coalesced update that would now be stale
+    with _progress_lock:
+        _pending_progress.pop(model_size, None)
+
+
+def _throttle_progress(
+    notification_manager: NotificationManager,
+    model_size: str,
+    progress: float
+) -> None:
+    """Show an intermediate progress update at most every PROGRESS_INTERVAL.
+
+    Updates arriving sooner are coalesced: only the latest value per model is
+    kept and shown by a single scheduled flush.
+
+    Args:
+        notification_manager: Notification manager instance
+        model_size: Model size being downloaded
+        progress: Progress value (0.0-1.0)
+    """
+    global _last_progress_emit
+
+    with _progress_lock:
+        flush_scheduled = bool(_pending_progress)
+        wait = _last_progress_emit + PROGRESS_INTERVAL - time.monotonic()
+        if flush_scheduled or wait > 0:
+            _pending_progress[model_size] = progress
+            if not flush_scheduled:
+                GLib.timeout_add(max(1, int(wait * 1000)), _flush_progress, notification_manager)
+            return
+        _last_progress_emit = time.monotonic()
+
+    GLib.idle_add(_show_progress, notification_manager, model_size, progress)
+
+
+def _flush_progress(notification_manager: NotificationManager) -> bool:
+    """Show the coalesced progress updates (GLib timeout callback)."""
+    global _last_progress_emit
+
+    with _progress_lock:
+        pending = list(_pending_progress.items())
+        _pending_progress.clear()
+        _last_progress_emit = time.monotonic()
+
+    for model_size, progress in pending:
+        _show_progress(notification_manager, model_size, progress)
+    return False
+
+
+def _show_progress(notification_manager: NotificationManager, model_size: str, progress: float) -> bool:
+    """Show one intermediate progress notification (runs on the GTK main loop)."""
+    notification_manager.notify(
+        "Downloading Model",
+        Severity.PROGRESS,
+        "model_download",
+        f"Downloading Whisper '{model_size}' model...",
+        progress
+    )
+    return False
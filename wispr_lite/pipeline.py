@@ -3,6 +3,7 @@
 Handles audio capture, VAD, silence detection, and transcription dispatch.
 """
 
+import queue
 import threading
 import numpy as np
 
@@ -11,10 +12,19 @@ from gi.repository import GLib
 from wispr_lite.logging import get_logger
 from wispr_lite.audio.capture import AudioCapture
 from wispr_lite.audio.vad import VAD, SilenceDetector
-from wispr_lite.asr.engine import ASREngine
+from wispr_lite.asr.engine import ASREngine, ChunkStream
 
 logger = get_logger(__name__)
 
+# Speech sent to the ASR engine per chunk while type-while-speaking is active
+STREAM_CHUNK_MS = 1000
+
+# Audio handed from capture to VAD per loop iteration; frames are classified as one block
+PROCESS_BATCH_MS = 200
+
+# Initial capacity of the utterance buffer (grows if a longer utterance arrives)
+UTTERANCE_BUFFER_SEC = 60
+
 
 class AudioPipeline:
     """Manages audio capture and transcription pipeline."""
@@ -42,7 +52,21 @@ class AudioPipeline:
         # Processing state
         self.processing_thread = None
         self.stop_processing = threading.Event()
-        self.audio_buffer = []
+
+        # Speech samples of the current utterance as float32 in [-1, 1], allocated
+        # once and filled frame by frame; ASR gets a view instead of a joined copy
+        self._utterance = np.empty(UTTERANCE_BUFFER_SEC * vad.sample_rate, dtype=np.float32)
+        self._utterance_len = 0
+
+        # Streaming (type-while-speaking): speech is fed to the ASR engine in
+        # chunks by a second worker while capture continues
+        self.streaming = False
+        self._chunk_start = 0
+        self._chunk_queue = None
+        self._stream_thread = None
+
+        # Capture ring drop count already counted as silence
+        self._dropped_seen = 0
 
         # Callbacks
         self.on_state_change = None
@@ -56,12 +80,22 @@ class AudioPipeline:
     def start(self) -> None:
         """Start audio processing pipeline."""
         logger.info("Starting audio pipeline")
-        self.audio_buffer.clear()
+        self._utterance_len = 0
+        self._chunk_start = 0
+        self.vad.reset()
         self.silence_detector.reset()
 
         # Start audio capture
         self.audio_capture.start()
 
+        # Fresh queue per session so a stale sentinel can't end the next stream
+        self._chunk_queue = queue.Queue() if self.streaming else None
+        if self.streaming:
+            self._stream_thread = threading.Thread(
+                target=self._stream_transcribe, args=(self._chunk_queue,), daemon=True
+            )
+            self._stream_thread.start()
+
         # Start processing thread
         self.stop_processing.clear()
         self.processing_thread = threading.Thread(target=self._process_audio, daemon=True)
@@ -71,15 +105,17 @@ class AudioPipeline:
         """Stop audio processing pipeline."""
         logger.info("Stopping audio pipeline")
 
-        # Stop audio capture
+        # Stop capture first, which wakes the thread if it is waiting for frames;
+        # the thread then drains what capture delivered before it stopped
         self.audio_capture.stop()
-
-        # Signal processing thread to stop
         self.stop_processing.set()
 
         # Wait for processing to complete
         if self.processing_thread:
             self.processing_thread.join(timeout=5.0)
+        if self._stream_thread:
+            self._stream_thread.join(timeout=5.0)
+            self._stream_thread = None
 
     def _set_thread_priority(self) -> None:
         """Attempt to set higher priority for audio processing thread (best-effort)."""
@@ -96,12 +132,12 @@ class AudioPipeline:
             try:
                 # Attempt to set nice value
                 new_nice = os.nice(target_nice - current_nice)
-                logger.info(f"Set process nice value to {new_nice} (audio processing priority increased)")
+                logger.info("Set process nice value to %s (audio processing priority increased)", new_nice)
             except PermissionError:
                 # Don't have permission for negative nice - that's OK
-                logger.debug(f"Cannot set negative nice value (requires privileges), using default priority")
+                logger.debug("Cannot set negative nice value (requires privileges), using default priority")
             except Exception as e:
-                logger.debug(f"Failed to adjust process priority: {e}")
+                logger.debug("Failed to adjust process priority: %s", e)
 
             # On Linux, also try setting real-time priority if we have the capability
             if sys.platform.startswith('linux'):
@@ -113,59 +149,191 @@ class AudioPipeline:
                     # and requires root. Just rely on nice for now.
                     pass
                 except Exception as e:
-                    logger.debug(f"RT scheduling not available: {e}")
+                    logger.debug("RT scheduling not available: %s", e)
 
         except Exception as e:
-            logger.debug(f"Priority adjustment failed (continuing with default): {e}")
+            logger.debug("Priority adjustment failed (continuing with default): %s", e)
 
     def _process_audio(self) -> None:
         """Process audio frames in background thread with crash recovery."""
         # Attempt to increase thread priority for better audio latency
         self._set_thread_priority()
 
+        # Bind this session's queue; a crash restart replaces self._chunk_queue
+        chunk_queue = self._chunk_queue
+        batch_frames = max(1, PROCESS_BATCH_MS // self.vad.frame_duration_ms)
+        self._dropped_seen = self.audio_capture.dropped_frames
+
         try:
             while not self.stop_processing.is_set():
-                # Get audio frame
-                frame = self.audio_capture.get_frame(timeout=0.1)
-                if not frame:
+                # Get a block of frames (a view into the capture ring)
+                frames = self.audio_capture.get_frames(batch_frames, timeout=PROCESS_BATCH_MS / 1000)
+                if frames is None:
                     continue
-
-                # VAD check
-                is_speech = self.vad.is_speech(frame)
-
-                if is_speech:
-                    self.audio_buffer.append(frame)
-                    self.silence_detector.reset()
-                else:
-                    # Check silence timeout (for toggle mode)
-                    if self.silence_detector.update(False):
-                        logger.info("Silence timeout reached")
-                        if self.on_stop_listening:
-                            GLib.idle_add(self.on_stop_listening)
+                if self._process_block(frames, chunk_queue):
+                    break
+            else:
+                # Capture has stopped; frames still in the ring are the end of the utterance
+                while True:
+                    frames = self.audio_capture.get_frames(batch_frames, timeout=0)
+                    if frames is None or self._process_block(frames, chunk_queue):
                         break
 
             # Process accumulated audio
-            if self.audio_buffer:
+            if self._utterance_len:
                 if self.on_state_change:
                     GLib.idle_add(self.on_state_change, "processing")
-                self._transcribe_and_output()
+                if self.streaming:
+                    # Earlier chunks are already decoded; only the tail remains
+                    chunk_queue.put((self._take_chunk(), True))
+                    self._utterance_len = 0
+                    self._chunk_start = 0
+                else:
+                    self._transcribe_and_output()
 
         except Exception as e:
             logger.error(f"Worker thread crashed: {e}", exc_info=True)
             if self.on_worker_crash:
                 self.on_worker_crash()
 
+        finally:
+            # Make sure the stream worker exits even without speech or after a crash
+            if chunk_queue is not None:
+                chunk_queue.put(None)
+
+    def _process_block(self, frames: np.ndarray, chunk_queue) -> bool:
+        """Run VAD and silence detection on a block of frames and keep the speech.
+
+        Args:
+            frames: int16 frames from the capture ring, one per row
+            chunk_queue: This session's streaming queue (None when not streaming)
+
+        Returns:
+            True if the silence timeout ended the utterance
+        """
+        # Frames the capture ring skipped while we lagged still count as
+        # elapsed silence, otherwise a stall would push the timeout back
+        dropped = self.audio_capture.dropped_frames
+        if dropped != self._dropped_seen:
+            logger.debug("Capture dropped %s frames", dropped - self._dropped_seen)
+            stalled_out = self.silence_detector.update_many(dropped - self._dropped_seen, is_speech=False)
+            self._dropped_seen = dropped
+            if stalled_out:
+                self._on_silence_timeout()
+                return True
+
+        # VAD check for the whole block
+        speech_flags = self.vad.is_speech_batch(frames)
+
+        # Check silence timeout (for toggle mode); speech after it is discarded
+        timeouts = self.silence_detector.update_batch(speech_flags)
+        timed_out = timeouts.any()
+        if timed_out:
+            end = int(np.argmax(timeouts))
+            frames = frames[:end]
+            speech_flags = speech_flags[:end]
+
+        if speech_flags.any():
+            self._append_speech(frames[speech_flags])
+
+            samples_per_chunk = STREAM_CHUNK_MS * self.vad.sample_rate // 1000
+            if self.streaming and self._utterance_len - self._chunk_start >= samples_per_chunk:
+                chunk_queue.put((self._take_chunk(), False))
+
+        if timed_out:
+            self._on_silence_timeout()
+        return bool(timed_out)
+
+    def _on_silence_timeout(self) -> None:
+        """Ask the app to stop listening after the silence timeout (toggle mode)."""
+        logger.info("Silence timeout reached")
+        if self.on_stop_listening:
+            GLib.idle_add(self.on_stop_listening)
+
+    def _append_speech(self, frames: np.ndarray) -> None:
+        """Convert int16 speech frames into the utterance buffer.
+
+        Args:
+            frames: 16-bit PCM samples, one frame per row
+        """
+        samples = frames.reshape(-1)
+        start = self._utterance_len
+        end = start + samples.size
+
+        if end > self._utterance.size:
+            grown = np.empty(max(end, 2 * self._utterance.size), dtype=np.float32)
+            grown[:start] = self._utterance[:start]
+            self._utterance = grown
+
+        # Scale straight into the buffer; no intermediate float array
+        np.multiply(samples, 1.0 / 32768.0, out=self._utterance[start:end], casting="unsafe")
+        self._utterance_len = end
+
+    def _take_chunk(self) -> np.ndarray:
+        """Copy out speech added since the previous streaming chunk."""
+        # A copy, since the stream worker may still hold it when the next session refills the buffer
+        chunk = self._utterance[self._chunk_start:self._utterance_len].copy()
+        self._chunk_start = self._utterance_len
+        return chunk
+
+    def _stream_transcribe(self, chunk_queue: queue.Queue) -> None:
+        """Feed speech chunks to the ASR engine while the user is still talking.
+
+        Chunks that queued up behind a slow decode are merged, so a lagging
+        worker catches up with one decode of the latest audio.
+
+        Args:
+            chunk_queue: Queue of (float32 samples, is_last) items, ended by None
+        """
+        sample_rate = self.vad.sample_rate
+        # This session's utterance; never shared with a later session
+        stream = ChunkStream()
+
+        try:
+            while True:
+                items = [chunk_queue.get()]
+                while True:
+                    try:
+                        items.append(chunk_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                chunks = [item for item in items if item is not None]
+                is_last = any(last for _, last in chunks)
+                if not is_last and len(chunks) < len(items):
+                    # Capture ended without a final chunk; drop any partial utterance
+                    return
+
+                chunk = chunks[0][0] if len(chunks) == 1 else np.concatenate([c for c, _ in chunks])
+                text = self.asr_engine.transcribe_chunk(stream, chunk, sample_rate, is_last=is_last)
+
+                if is_last:
+                    if self.on_finalize_partial:
+                        self.on_finalize_partial(text or "")
+                    return
+
+                if text and self.on_partial_transcript:
+                    self.on_partial_transcript(text)
+
+        except Exception as e:
+            logger.error(f"Streaming transcription failed: {e}", exc_info=True)
+            if self.on_state_change:
+                GLib.idle_add(self.on_state_change, "error")
+
     def _transcribe_and_output(self) -> None:
-        """Transcribe accumulated audio and output text."""
-        if not self.audio_buffer:
+        """Transcribe accumulated audio and output text.
+
+        on_transcript receives a read-only view into the utterance buffer that is
+        only valid for the duration of the call.
+        """
+        if not self._utterance_len:
             return
 
         try:
-            # Convert audio buffer to numpy array
-            audio_bytes = b''.join(self.audio_buffer)
-            audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+            audio_array = self._utterance[:self._utterance_len]
+            audio_array.flags.writeable = False
 
-            logger.info(f"Transcribing {len(audio_array)} samples")
+            logger.info("Transcribing %d samples", len(audio_array))
 
             # Delegate transcription to callback
             if self.on_transcript:
@@ -177,4 +345,4 @@ class AudioPipeline:
                 GLib.idle_add(self.on_state_change, "error")
 
         finally:
-            self.audio_buffer.clear()
+            self._utterance_len = 0
@@ -4,7 +4,8 @@ Implements rate limiting, deduplication, and desktop DND awareness.
 """
 
 import time
-from typing import Dict, Optional, List, Tuple, Callable
+from collections import deque
+from typing import Deque, Dict, Optional, List, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -21,6 +22,9 @@ from wispr_lite.config.schema import NotificationConfig
 
 logger = get_logger(__name__)
 
+# How long a DND lookup over D-Bus is reused before querying again
+DND_CACHE_SEC = 2.0
+
 
 class Severity(Enum):
     """Notification severity levels."""
@@ -30,6 +34,15 @@ class Severity(Enum):
     PROGRESS = "progress"
 
 
+# Bit assigned to each severity in NotificationManager's enabled-severity mask
+SEVERITY_BITS = {
+    Severity.INFO: 1,
+    Severity.WARNING: 2,
+    Severity.ERROR: 4,
+    Severity.PROGRESS: 8,
+}
+
+
 @dataclass
 class NotificationState:
     """State for a notification key."""
@@ -44,17 +57,25 @@ class NotificationManager:
     def __init__(
         self,
         config: NotificationConfig,
-        action_callback: Optional[Callable[[str], None]] = None
+        action_callback: Optional[Callable[[str], None]] = None,
+        time_func: Callable[[], float] = time.time
     ):
         """Initialize notification manager.
 
         Args:
             config: Notification configuration
             action_callback: Optional callback for notification actions, receives action_id
+            time_func: Clock used for rate limiting (injectable for tests)
         """
         self.config = config
         self.enabled = NOTIFY_AVAILABLE and config.enabled
         self.action_callback = action_callback
+        self._now = time_func
+        self.refresh_severity_mask()
+
+        # Cached DND state and the time it was queried
+        self._dnd_active = False
+        self._dnd_checked_at: Optional[float] = None
 
         if not NOTIFY_AVAILABLE:
             logger.warning("libnotify not available, notifications disabled")
@@ -66,9 +87,9 @@ class NotificationManager:
 
         # State tracking
         self.states: Dict[str, NotificationState] = {}
-        self.global_toast_times: List[float] = []
+        self.global_toast_times: Deque[float] = deque()  # oldest first
 
-        logger.info(f"NotificationManager initialized (enabled={self.enabled})")
+        logger.info("NotificationManager initialized (enabled=%s)", self.enabled)
 
     def notify(
         self,
@@ -92,46 +113,53 @@ class NotificationManager:
         if not self.enabled:
             return
 
-        key = key or event
-
-        # Check DND
+        # Check DND first: it is the common reason to drop a notification
         if self.config.respect_dnd and self._is_dnd_active():
-            logger.debug(f"DND active, suppressing notification: {event}")
+            logger.debug("DND active, suppressing notification: %s", event)
             return
 
+        key = key or event
+
         # Apply severity policy
         if not self._should_show_severity(severity):
-            logger.debug(f"Severity {severity.value} disabled, skipping: {event}")
+            logger.debug("Severity %s disabled, skipping: %s", severity.value, event)
             return
 
         # Rate limiting (except for progress updates)
         if severity != Severity.PROGRESS:
             if not self._check_rate_limit(key):
-                logger.debug(f"Rate limited: {key}")
+                logger.debug("Rate limited: %s", key)
                 return
 
         # Show or update notification
         self._show_notification(event, text, severity, key, progress, actions)
 
+    def refresh_severity_mask(self) -> None:
+        """Recompute the enabled-severity mask; call after changing config.show_* flags."""
+        mask = 0
+        if self.config.show_info:
+            mask |= SEVERITY_BITS[Severity.INFO]
+        if self.config.show_warnings:
+            mask |= SEVERITY_BITS[Severity.WARNING]
+        if self.config.show_errors:
+            mask |= SEVERITY_BITS[Severity.ERROR]
+        if self.config.show_progress:
+            mask |= SEVERITY_BITS[Severity.PROGRESS]
+        self._severity_mask = mask
+
     def _should_show_severity(self, severity: Severity) -> bool:
         """Check if notifications for this severity are enabled."""
-        if severity == Severity.INFO:
-            return self.config.show_info
-        elif severity == Severity.WARNING:
-            return self.config.show_warnings
-        elif severity == Severity.ERROR:
-            return self.config.show_errors
-        elif severity == Severity.PROGRESS:
-            return self.config.show_progress
-        return True
+        return bool(self._severity_mask & SEVERITY_BITS[severity])
 
     def _check_rate_limit(self, key: str) -> bool:
         """Check if notification passes rate limits."""
-        now = time.time()
+        now = self._now()
 
-        # Global rate limit
-        self.global_toast_times = [t for t in self.global_toast_times if now - t < 60]
-        if len(self.global_toast_times) >= self.config.max_toasts_per_minute:
+        # Global rate limit: evict toasts older than the 60s window from the front
+        toast_times = self.global_toast_times
+        while toast_times and now - toast_times[0] >= 60:
+            toast_times.popleft()
+        if len(toast_times) >= self.config.max_toasts_per_minute:
             return False
 
         # Per-key cooldown
@@ -154,7 +182,7 @@ class NotificationManager:
         actions: Optional[List[Tuple[str, str]]]
     ) -> None:
         """Show or update a notification."""
-        now = time.time()
+        now = self._now()
 
         # Get or create state
         if key not in self.states:
@@ -203,7 +231,7 @@ class NotificationManager:
 
             # Reset count after showing
             if state.count > 1:
-                logger.debug(f"Showed coalesced notification: {title}")
+                logger.debug("Showed coalesced notification: %s", title)
             state.count = 0
 
         except Exception as e:
@@ -217,7 +245,7 @@ class NotificationManager:
             action_id: ID of the clicked action
             user_data: User data (unused)
         """
-        logger.info(f"Notification action clicked: {action_id}")
+        logger.info("Notification action clicked: %s", action_id)
 
         # Call the action callback if provided
         if self.action_callback:
@@ -227,7 +255,19 @@ class NotificationManager:
                 logger.error(f"Error handling notification action '{action_id}': {e}")
 
     def _is_dnd_active(self) -> bool:
-        """Check if Do Not Disturb is active.
+        """Check if Do Not Disturb is active, reusing recent lookups.
+
+        Returns:
+            True if DND is active (best effort detection)
+        """
+        now = self._now()
+        if self._dnd_checked_at is None or now - self._dnd_checked_at >= DND_CACHE_SEC:
+            self._dnd_active = self._query_dnd()
+            self._dnd_checked_at = now
+        return self._dnd_active
+
+    def _query_dnd(self) -> bool:
+        """Query Do Not Disturb state over D-Bus.
 
         Returns:
             True if DND is active (best effort detection)
@@ -261,7 +301,7 @@ class NotificationManager:
                 pass
 
         except Exception as e:
-            logger.debug(f"DND detection failed: {e}")
+            logger.debug("DND detection failed: %s", e)
 
         return False
 
@@ -278,7 +318,7 @@ class NotificationManager:
                 try:
                     state.notification.close()
                 except Exception as e:
-                    logger.debug(f"Error closing notification: {e}")
+                    logger.debug("Error closing notification: %s", e)
 
         self.states.clear()
 
@@ -147,7 +147,7 @@ class OverlayWindow(Gtk.Window):
             context.remove_class(cls)
         context.add_class(f"state-{state}")
 
-        logger.debug(f"Overlay state: {state}")
+        logger.debug("Overlay state: %s", state)
 
     def set_transcript(self, text: str) -> None:
         """Set the transcript text.
@@ -103,12 +103,12 @@ class PreferencesWindow(Gtk.Window):
 
     def _on_button_press(self, widget, event):
         """Debug: button press event."""
-        logger.info(f"PreferencesWindow button press at ({event.x}, {event.y})")
+        logger.info("PreferencesWindow button press at (%s, %s)", event.x, event.y)
         return False  # Propagate event
 
     def _on_key_press(self, widget, event):
         """Debug: key press event."""
-        logger.info(f"PreferencesWindow key press: {event.keyval}")
+        logger.info("PreferencesWindow key press: %s", event.keyval)
         if event.keyval == 65307:  # ESC key
             self.hide()
             return True
@@ -268,13 +268,14 @@ class PreferencesWindow(Gtk.Window):
                     device=device,
                     blocking=True
                 )
-                # Calculate RMS level
-                rms = np.sqrt(np.mean(data**2))
+                # Calculate RMS level in one pass (dot product, no squared temporary)
+                samples = data.ravel()
+                rms = np.sqrt(np.dot(samples, samples) / samples.size)
                 # Update level meter on main thread
                 GLib.idle_add(self.level_meter.set_value, min(rms * 10, 1.0))
                 return True  # Continue monitoring
             except Exception as e:
-                logger.debug(f"Level monitoring error: {e}")
+                logger.debug("Level monitoring error: %s", e)
                 return False
 
         # Update every 100ms
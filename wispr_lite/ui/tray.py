@@ -39,7 +39,7 @@ class TrayIcon:
             self.indicator = None
             return
 
-        logger.info(f"Using {APPINDICATOR_TYPE} for tray icon")
+        logger.info("Using %s for tray icon", APPINDICATOR_TYPE)
 
         # Create indicator
         # Icon theme path - try user icons first, then bundled icons
@@ -63,7 +63,7 @@ class TrayIcon:
         self.indicator.set_icon_theme_path(icon_path)
         self.indicator.set_status(AppIndicator.IndicatorStatus.ACTIVE)
 
-        logger.info(f"Tray icon path set to: {icon_path}")
+        logger.info("Tray icon path set to: %s", icon_path)
 
         # Create menu
         self.menu = Gtk.Menu()
@@ -200,7 +200,7 @@ class TrayIcon:
         else:
             self.toggle_item.set_label(strings.TRAY_START_LISTENING)
 
-        logger.debug(f"Tray state: {state}")
+        logger.debug("Tray state: %s", state)
 
     def set_mode(self, mode: str) -> None:
         """Update mode display.